@@ -19,6 +19,8 @@
 使用方法：
     python check_and_generate_audio.py -s 238 -e 300
     python check_and_generate_audio.py --start 1 --end 100
+    LINGOHOW_ASSUME_YES=1 python check_and_generate_audio.py -s 1 -e 10   # 跳过确认等待
+    python check_and_generate_audio.py -s 1 -e 500 --missing-only        # 只保存缺失列表，不生成完整报告
 """
 
 import asyncio
@@ -26,11 +28,24 @@ import json
 import logging
 import os
 import hashlib
+import hmac
+import pickle
+import re
 import time
 import argparse
+import sys
+import threading
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, AsyncIterator, Iterable, Optional, Tuple
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime
+from functools import lru_cache
+from urllib.parse import quote
+import xml.etree.ElementTree as ET
 
 # 导入现有的服务
 try:
@@ -39,6 +54,11 @@ try:
 except ImportError:
     pass
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # 设置日志
 logging.basicConfig(
     level=logging.INFO,
@@ -47,6 +67,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=65536)
 def generate_sentence_hash(text: str) -> str:
     """
     生成句子的哈希值（与 NextJS getAudioFileName 逻辑一致）
@@ -60,17 +81,288 @@ def generate_sentence_hash(text: str) -> str:
     return hashlib.md5(text.strip().encode()).hexdigest()[:8]
 
 
-async def get_all_audio_files_from_r2() -> set:
+# 句子音频在存储中的对象前缀
+SENTENCE_AUDIO_PREFIX = 'audio/sentences/'
+
+# 对象 key 为 '{前缀}{哈希}.mp3'，用切片直接取出哈希
+SENTENCE_AUDIO_PREFIX_LEN = len(SENTENCE_AUDIO_PREFIX)
+AUDIO_SUFFIX_LEN = len('.mp3')
+
+# 文件名是 8 位 MD5 十六进制哈希，按首字符切成 16 个互不重叠的分片并发列举
+HASH_SHARDS = '0123456789abcdef'
+
+# int(x, 16) 还接受 0x 前缀、下划线和正负号，先用正则严格校验
+AUDIO_HASH_PATTERN = re.compile(r'[0-9a-f]{8}')
+
+
+class AudioHashSet:
+    """
+    紧凑的音频文件名集合（精确匹配，只用于成员判断）
+
+    文件名是 8 位十六进制哈希，正好是一个 32 位无符号整数，因此存为有序的
+    array('I')（每个条目 4 字节），查找使用二分。相比 Python str 集合内存小一个
+    数量级以上，且不像 Bloom 过滤器那样存在误判。
+    """
+
+    __slots__ = ('_values',)
+
+    def __init__(self, values: Optional[array] = None):
+        """
+        Args:
+            values: 已排序且去重的 array('I')
+        """
+        self._values = values if values is not None else array('I')
+
+    @staticmethod
+    def parse(name: str) -> Optional[int]:
+        """将 8 位小写十六进制文件名转换为整数，格式不符时返回 None"""
+        if AUDIO_HASH_PATTERN.fullmatch(name) is None:
+            return None
+        return int(name, 16)
+
+    @classmethod
+    def from_values(cls, values: Iterable[int]) -> 'AudioHashSet':
+        """由任意顺序（可重复）的整数构建集合"""
+        return cls(array('I', sorted(set(values))))
+
+    @classmethod
+    def concat(cls, parts: Iterable['AudioHashSet']) -> 'AudioHashSet':
+        """
+        按顺序拼接多个集合
+
+        各分片按哈希首字符 0-f 排列且互不重叠，拼接结果天然有序，无需重新排序。
+        """
+        values = array('I')
+        for part in parts:
+            values.extend(part._values)
+        return cls(values)
+
+    def update(self, names: Iterable[str]) -> None:
+        """加入新的文件名"""
+        parse = self.parse
+        new_values = {v for v in (parse(name) for name in names) if v is not None}
+        if new_values:
+            self._values = array('I', sorted(new_values.union(self._values)))
+
+    def __contains__(self, name: str) -> bool:
+        value = self.parse(name)
+        if value is None:
+            return False
+        idx = bisect_left(self._values, value)
+        return idx < len(self._values) and self._values[idx] == value
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+def _append_hashes(values: array, names: Iterable[str]) -> None:
+    """
+    将文件名解析为整数并追加到 values（跳过非哈希文件名）
+
+    Args:
+        values: 目标 array('I')
+        names: 文件名（不含前缀和扩展名）
+    """
+    parse = AudioHashSet.parse
+    for name in names:
+        value = parse(name)
+        if value is not None:
+            values.append(value)
+
+
+# 存储文件列表的本地缓存（避免短时间内重复运行时全量重新列举）
+AUDIO_LIST_CACHE_DIR = Path.home() / '.cache' / 'lingohow'
+AUDIO_LIST_CACHE_TTL = 600
+
+# 上次运行学习到的 edge-tts 并发数（AIMD 限流器的最终值）
+EDGE_TTS_CONCURRENCY_CACHE = AUDIO_LIST_CACHE_DIR / 'edge_tts_concurrency.json'
+
+# 生成与上传流水线：队列容量，以及每上传多少个文件输出一次进度
+UPLOAD_QUEUE_SIZE = 64
+UPLOAD_PROGRESS_EVERY = 32
+
+# 开始生成前等待用户确认的最长时间（秒）
+CONFIRM_TIMEOUT = 10
+
+
+def _audio_list_cache_key(storage: str, bucket: Optional[str]) -> Optional[str]:
+    """
+    生成文件列表缓存的 key（按存储类型 + bucket + 前缀区分）
+
+    Args:
+        storage: 存储类型（'r2' 或 'cos'）
+        bucket: bucket 名称
+
+    Returns:
+        缓存 key，bucket 未配置时返回 None
+    """
+    if not bucket:
+        return None
+    return f"{storage}-{bucket}-{SENTENCE_AUDIO_PREFIX.strip('/').replace('/', '_')}"
+
+
+def _load_cache(cache_key: str, ttl: int) -> Optional[AudioHashSet]:
     """
-    从 R2 获取所有音频文件列表（批量）
+    读取文件列表缓存（超过 TTL 视为失效）
+
+    Args:
+        cache_key: 缓存 key
+        ttl: 有效期（秒），<= 0 表示不使用缓存
 
     Returns:
-        包含所有文件名（不含路径和扩展名）的 Set
+        缓存的文件名集合，缓存不存在或已过期时返回 None
+    """
+    if ttl <= 0:
+        return None
+
+    cache_file = AUDIO_LIST_CACHE_DIR / f"{cache_key}.pkl"
+    try:
+        if time.time() - cache_file.stat().st_mtime > ttl:
+            return None
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"读取文件列表缓存失败 {cache_file}: {e}")
+        return None
+
+
+def _save_cache(cache_key: str, existing_files: AudioHashSet, mtime: Optional[float] = None) -> None:
+    """
+    保存文件列表缓存（先写临时文件再原子替换）
+
+    Args:
+        cache_key: 缓存 key
+        existing_files: 文件名集合
+        mtime: 保留的修改时间（更新已有缓存时不延长其有效期）
     """
+    cache_file = AUDIO_LIST_CACHE_DIR / f"{cache_key}.pkl"
+    tmp_file = cache_file.with_suffix('.pkl.tmp')
     try:
-        import aioboto3
-        import os
+        AUDIO_LIST_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, 'wb') as f:
+            pickle.dump(existing_files, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+        if mtime is not None:
+            os.utime(cache_file, (mtime, mtime))
+    except Exception as e:
+        logger.warning(f"保存文件列表缓存失败 {cache_file}: {e}")
+
+
+def _extend_cache(cache_key: Optional[str], new_files: Iterable[str], ttl: int) -> None:
+    """
+    将新上传的文件加入仍然有效的缓存（已过期的缓存不更新）
+
+    Args:
+        cache_key: 缓存 key
+        new_files: 新上传的文件名
+        ttl: 有效期（秒）
+    """
+    if not cache_key:
+        return
 
+    cache_file = AUDIO_LIST_CACHE_DIR / f"{cache_key}.pkl"
+    cached = _load_cache(cache_key, ttl)
+    if cached is None:
+        return
+
+    try:
+        mtime = cache_file.stat().st_mtime
+    except FileNotFoundError:
+        return
+
+    cached.update(new_files)
+    _save_cache(cache_key, cached, mtime=mtime)
+
+
+async def _list_r2_prefix(s3_client, bucket: str, shard: str) -> Tuple[AudioHashSet, int]:
+    """
+    分页列举 R2 中单个哈希分片下的所有音频文件
+
+    Args:
+        s3_client: aioboto3 S3 客户端
+        bucket: R2 bucket 名称
+        shard: 哈希首字符（如 'a'）
+
+    Returns:
+        (文件名集合, 页数) 元组
+    """
+    values = array('I')
+    page_count = 0
+
+    paginator = s3_client.get_paginator('list_objects_v2')
+    async for page in paginator.paginate(
+        Bucket=bucket,
+        Prefix=f'{SENTENCE_AUDIO_PREFIX}{shard}',
+        PaginationConfig={'PageSize': 1000}
+    ):
+        page_count += 1
+
+        # 提取文件名（去掉前缀和 '.mp3' 后缀），每页处理完即释放
+        _append_hashes(
+            values,
+            (
+                obj['Key'][SENTENCE_AUDIO_PREFIX_LEN:-AUDIO_SUFFIX_LEN]
+                for obj in page.get('Contents', ())
+            )
+        )
+
+    return AudioHashSet.from_values(values), page_count
+
+
+# 进程内共享的 aioboto3 Session（延迟创建），避免每次列举都重新解析凭证与 endpoint
+_R2_SESSION = None
+
+
+@asynccontextmanager
+async def r2_client(r2_config: Dict[str, str]) -> AsyncIterator[Any]:
+    """
+    获取 R2 S3 客户端（共享 Session，连接池足够容纳所有分片并发请求）
+
+    botocore 默认连接池只有 10 个连接，16 个分片并发分页时会互相排队；
+    这里按分片数放大连接池，所有分页请求复用同一组 keep-alive 连接。
+
+    Args:
+        r2_config: 包含 endpoint_url / access_key_id / secret_access_key 的配置
+
+    Yields:
+        aioboto3 S3 客户端
+    """
+    global _R2_SESSION
+    import aioboto3
+    from botocore.config import Config
+
+    if _R2_SESSION is None:
+        _R2_SESSION = aioboto3.Session()
+
+    boto_config = Config(
+        max_pool_connections=len(HASH_SHARDS) * 4,
+        retries={'max_attempts': 3, 'mode': 'adaptive'}
+    )
+
+    async with _R2_SESSION.client(
+        service_name='s3',
+        endpoint_url=r2_config['endpoint_url'],
+        aws_access_key_id=r2_config['access_key_id'],
+        aws_secret_access_key=r2_config['secret_access_key'],
+        region_name='auto',
+        config=boto_config
+    ) as s3_client:
+        yield s3_client
+
+
+async def get_all_audio_files_from_r2(cache_ttl: int = AUDIO_LIST_CACHE_TTL) -> AudioHashSet:
+    """
+    从 R2 获取所有音频文件列表（按哈希首字符分片并发分页）
+
+    Args:
+        cache_ttl: 本地文件列表缓存有效期（秒），<= 0 表示不使用缓存
+
+    Returns:
+        包含所有文件名（不含路径和扩展名）的集合
+    """
+    try:
         r2_config = {
             'bucket': os.getenv('R2_BUCKET_NAME'),
             'access_key_id': os.getenv('R2_ACCESS_KEY_ID'),
@@ -80,71 +372,225 @@ async def get_all_audio_files_from_r2() -> set:
 
         if not all(r2_config.values()):
             logger.warning("R2 configuration incomplete, skipping")
-            return set()
-
-        existing_files = set()
-        session = aioboto3.Session()
-
-        async with session.client(
-            service_name='s3',
-            endpoint_url=r2_config['endpoint_url'],
-            aws_access_key_id=r2_config['access_key_id'],
-            aws_secret_access_key=r2_config['secret_access_key'],
-            region_name='auto'
-        ) as s3_client:
-            continuation_token = None
-            page_count = 0
-
-            while True:
-                list_params = {
-                    'Bucket': r2_config['bucket'],
-                    'Prefix': 'audio/sentences/',
-                    'MaxKeys': 1000
-                }
-
-                if continuation_token:
-                    list_params['ContinuationToken'] = continuation_token
-
-                response = await s3_client.list_objects_v2(**list_params)
-                page_count += 1
-
-                # 提取文件名
-                if 'Contents' in response:
-                    for obj in response['Contents']:
-                        key = obj.get('Key', '')
-                        # 去掉 'audio/sentences/' 前缀和 '.mp3' 后缀
-                        filename = key.replace('audio/sentences/', '').replace('.mp3', '')
-                        if filename:
-                            existing_files.add(filename)
-
-                # 检查是否还有更多数据
-                if response.get('IsTruncated'):
-                    continuation_token = response.get('NextContinuationToken')
-                else:
-                    break
-
-            logger.info(f"✅ R2: 加载了 {len(existing_files)} 个音频文件（{page_count} 页）")
-            return existing_files
+            return AudioHashSet()
+
+        cache_key = _audio_list_cache_key('r2', r2_config['bucket'])
+        cached = _load_cache(cache_key, cache_ttl)
+        if cached is not None:
+            logger.info(f"✅ R2: 从本地缓存加载了 {len(cached)} 个音频文件")
+            return cached
+
+        async with r2_client(r2_config) as s3_client:
+            shard_results = await asyncio.gather(*[
+                _list_r2_prefix(s3_client, r2_config['bucket'], shard)
+                for shard in HASH_SHARDS
+            ])
+
+        existing_files = AudioHashSet.concat(files for files, _ in shard_results)
+        page_count = sum(pages for _, pages in shard_results)
+
+        logger.info(f"✅ R2: 加载了 {len(existing_files)} 个音频文件（{page_count} 页）")
+        if cache_ttl > 0:
+            _save_cache(cache_key, existing_files)
+        return existing_files
 
     except ImportError:
         logger.warning("aioboto3 未安装，无法检查 R2")
-        return set()
+        return AudioHashSet()
     except Exception as e:
         logger.error(f"从 R2 获取文件列表失败: {e}")
-        return set()
+        return AudioHashSet()
+
+
+def _cos_sign_key(secret_key: str, key_time: str) -> str:
+    """
+    计算 COS v5 签名的 SignKey（每个会话只需计算一次）
+
+    Args:
+        secret_key: COS SecretKey
+        key_time: 签名有效期，格式 "{start};{end}"
+
+    Returns:
+        SignKey（十六进制字符串）
+    """
+    return hmac.new(secret_key.encode(), key_time.encode(), hashlib.sha1).hexdigest()
+
+
+def _cos_authorization(
+    secret_id: str,
+    sign_key: str,
+    key_time: str,
+    host: str,
+    params: Dict[str, str]
+) -> str:
+    """
+    生成 COS GET Bucket 请求的 Authorization 头（HMAC-SHA1）
+
+    Args:
+        secret_id: COS SecretId
+        sign_key: 由 _cos_sign_key 计算的 SignKey
+        key_time: 签名有效期，格式 "{start};{end}"
+        host: 请求 Host
+        params: URL 查询参数
+
+    Returns:
+        Authorization 头的值
+    """
+    def encode(value: str) -> str:
+        return quote(value, safe='-_.~')
+
+    param_items = sorted((k.lower(), encode(v)) for k, v in params.items())
+    url_param_list = ';'.join(k for k, _ in param_items)
+    http_parameters = '&'.join(f'{k}={v}' for k, v in param_items)
+    http_headers = f'host={encode(host)}'
+
+    http_string = f'get\n/\n{http_parameters}\n{http_headers}\n'
+    string_to_sign = f'sha1\n{key_time}\n{hashlib.sha1(http_string.encode()).hexdigest()}\n'
+    signature = hmac.new(sign_key.encode(), string_to_sign.encode(), hashlib.sha1).hexdigest()
+
+    return (
+        f'q-sign-algorithm=sha1&q-ak={secret_id}'
+        f'&q-sign-time={key_time}&q-key-time={key_time}'
+        f'&q-header-list=host&q-url-param-list={url_param_list}'
+        f'&q-signature={signature}'
+    )
+
+
+async def _list_cos_prefix(
+    http_session,
+    cos_config: Dict[str, str],
+    sign_key: str,
+    key_time: str,
+    shard: str
+) -> Tuple[AudioHashSet, int]:
+    """
+    分页列举 COS 中单个哈希分片下的所有音频文件（直接调用 GET Bucket REST 接口）
+
+    响应 XML 在读取时增量解析，不在内存中保留整页文档。
+
+    Args:
+        http_session: aiohttp ClientSession
+        cos_config: COS 配置
+        sign_key: 由 _cos_sign_key 计算的 SignKey
+        key_time: 签名有效期
+        shard: 哈希首字符（如 'a'）
+
+    Returns:
+        (文件名集合, 页数) 元组
+    """
+    host = f"{cos_config['bucket']}.cos.{cos_config['region']}.myqcloud.com"
+    values = array('I')
+    parse = AudioHashSet.parse
+    marker = ''
+    page_count = 0
+
+    while True:
+        params = {
+            'prefix': f'{SENTENCE_AUDIO_PREFIX}{shard}',
+            'max-keys': '1000',
+            'marker': marker
+        }
+        headers = {
+            'Host': host,
+            'Authorization': _cos_authorization(
+                cos_config['secret_id'], sign_key, key_time, host, params
+            )
+        }
+
+        last_key = ''
+        is_truncated = False
+        next_marker = ''
+
+        async with http_session.get(f'https://{host}/', params=params, headers=headers) as response:
+            response.raise_for_status()
+
+            parser = ET.XMLPullParser(events=('end',))
+            async for chunk in response.content.iter_chunked(64 * 1024):
+                parser.feed(chunk)
+                for _, elem in parser.read_events():
+                    tag = elem.tag.rsplit('}', 1)[-1]
+                    if tag == 'Key':
+                        last_key = elem.text or ''
+                        # 提取文件名（去掉前缀和 '.mp3' 后缀）
+                        value = parse(last_key[SENTENCE_AUDIO_PREFIX_LEN:-AUDIO_SUFFIX_LEN])
+                        if value is not None:
+                            values.append(value)
+                    elif tag == 'IsTruncated':
+                        is_truncated = elem.text == 'true'
+                    elif tag == 'NextMarker':
+                        next_marker = elem.text or ''
+                    elif tag == 'Contents':
+                        elem.clear()
+            parser.close()
+
+        page_count += 1
+
+        # 检查是否还有更多数据
+        if is_truncated and (next_marker or last_key):
+            marker = next_marker or last_key
+        else:
+            break
 
+    return AudioHashSet.from_values(values), page_count
 
-def _get_cos_files_sync() -> set:
+
+def _list_cos_prefix_sync(cos_client: Any, bucket: str, shard: str) -> Tuple[AudioHashSet, int]:
+    """
+    使用 COS SDK 列举单个哈希分片下的所有音频文件（在线程中运行）
+
+    Args:
+        cos_client: qcloud_cos CosS3Client（线程安全，可在多个分片间共享）
+        bucket: 存储桶名称
+        shard: 哈希首字符
+
+    Returns:
+        (文件集合, 页数) 元组
+    """
+    values = array('I')
+    page_count = 0
+    marker = ''
+
+    while True:
+        response = cos_client.list_objects(
+            Bucket=bucket,
+            Prefix=SENTENCE_AUDIO_PREFIX + shard,
+            Marker=marker,
+            MaxKeys=1000
+        )
+        page_count += 1
+
+        contents = response.get('Contents', [])
+        _append_hashes(
+            values,
+            (obj['Key'][SENTENCE_AUDIO_PREFIX_LEN:-AUDIO_SUFFIX_LEN] for obj in contents)
+        )
+
+        if response.get('IsTruncated') != 'true' or not contents:
+            break
+        marker = response.get('NextMarker') or contents[-1]['Key']
+
+    return AudioHashSet.from_values(values), page_count
+
+
+async def get_all_audio_files_from_cos(cache_ttl: int = AUDIO_LIST_CACHE_TTL) -> AudioHashSet:
     """
-    从 COS 获取所有音频文件列表（同步版本）
+    从 COS 获取所有音频文件列表（按哈希首字符分片并发分页）
+
+    优先用 aiohttp 直接调用 REST 接口；未安装 aiohttp 时使用 COS SDK，
+    每个分片在独立线程中分页。
+
+    Args:
+        cache_ttl: 本地文件列表缓存有效期（秒），<= 0 表示不使用缓存
 
     Returns:
-        包含所有文件名（不含路径和扩展名）的 Set
+        包含所有文件名（不含路径和扩展名）的集合
     """
     try:
-        from qcloud_cos import CosConfig, CosS3Client
-        import os
+        import aiohttp
+    except ImportError:
+        aiohttp = None
 
+    try:
         cos_config = {
             'secret_id': os.getenv('COS_SECRET_ID'),
             'secret_key': os.getenv('COS_SECRET_KEY'),
@@ -154,68 +600,102 @@ def _get_cos_files_sync() -> set:
 
         if not all(cos_config.values()):
             logger.warning("COS configuration incomplete, skipping")
-            return set()
-
-        config = CosConfig(
-            Region=cos_config['region'],
-            SecretId=cos_config['secret_id'],
-            SecretKey=cos_config['secret_key']
-        )
-        client = CosS3Client(config)
-
-        existing_files = set()
-        marker = ''
-        page_count = 0
-
-        while True:
-            response = client.list_objects(
-                Bucket=cos_config['bucket'],
-                Prefix='audio/sentences/',
-                Marker=marker,
-                MaxKeys=1000
-            )
-            page_count += 1
-
-            # 提取文件名
-            if 'Contents' in response:
-                for obj in response['Contents']:
-                    key = obj.get('Key', '')
-                    # 去掉 'audio/sentences/' 前缀和 '.mp3' 后缀
-                    filename = key.replace('audio/sentences/', '').replace('.mp3', '')
-                    if filename:
-                        existing_files.add(filename)
-
-            # 检查是否还有更多数据
-            if response.get('IsTruncated') == 'true':
-                marker = response.get('NextMarker', '')
-            else:
-                break
+            return AudioHashSet()
+
+        cache_key = _audio_list_cache_key('cos', cos_config['bucket'])
+        cached = _load_cache(cache_key, cache_ttl)
+        if cached is not None:
+            logger.info(f"✅ COS: 从本地缓存加载了 {len(cached)} 个音频文件")
+            return cached
+
+        # 签名有效期覆盖整个列举过程，SignKey 只计算一次
+        now = int(time.time())
+        key_time = f'{now - 60};{now + 3600}'
+        sign_key = _cos_sign_key(cos_config['secret_key'], key_time)
+
+        if aiohttp is not None:
+            connector = aiohttp.TCPConnector(limit=32)
+            async with aiohttp.ClientSession(connector=connector) as http_session:
+                shard_results = await asyncio.gather(*[
+                    _list_cos_prefix(http_session, cos_config, sign_key, key_time, shard)
+                    for shard in HASH_SHARDS
+                ])
+        else:
+            # 没有 aiohttp 时回退到 COS SDK：每个分片一个线程并发分页，而不是单线程列举全部
+            # （专用线程池：默认线程池为 min(32, CPU+4)，小机器上不足 16 个线程）
+            from qcloud_cos import CosConfig, CosS3Client
+
+            cos_client = CosS3Client(CosConfig(
+                Region=cos_config['region'],
+                SecretId=cos_config['secret_id'],
+                SecretKey=cos_config['secret_key'],
+                Scheme='https',
+                PoolConnections=len(HASH_SHARDS),
+                PoolMaxSize=len(HASH_SHARDS)
+            ))
+            loop = asyncio.get_running_loop()
+            with ThreadPoolExecutor(max_workers=len(HASH_SHARDS), thread_name_prefix='cos-list') as executor:
+                shard_results = await asyncio.gather(*[
+                    loop.run_in_executor(executor, _list_cos_prefix_sync, cos_client, cos_config['bucket'], shard)
+                    for shard in HASH_SHARDS
+                ])
+
+        existing_files = AudioHashSet.concat(files for files, _ in shard_results)
+        page_count = sum(pages for _, pages in shard_results)
 
         logger.info(f"✅ COS: 加载了 {len(existing_files)} 个音频文件（{page_count} 页）")
+        if cache_ttl > 0:
+            _save_cache(cache_key, existing_files)
         return existing_files
 
     except ImportError:
-        logger.warning("qcloud_cos 未安装，无法检查 COS")
-        return set()
+        logger.warning("aiohttp 和 qcloud_cos 均未安装，无法检查 COS")
+        return AudioHashSet()
     except Exception as e:
         logger.error(f"从 COS 获取文件列表失败: {e}")
-        return set()
+        return AudioHashSet()
 
 
-async def get_all_audio_files_from_cos() -> set:
+def _load_learned_concurrency(default: int) -> int:
     """
-    从 COS 获取所有音频文件列表（异步包装器）
+    读取上次运行学习到的 edge-tts 并发数
+
+    Args:
+        default: 没有记录时使用的并发数
 
     Returns:
-        包含所有文件名（不含路径和扩展名）的 Set
+        并发数（不超过 default）
+    """
+    try:
+        with open(EDGE_TTS_CONCURRENCY_CACHE, 'r', encoding='utf-8') as f:
+            learned = int(json.load(f)['limit'])
+        return max(1, min(learned, default))
+    except FileNotFoundError:
+        return default
+    except Exception as e:
+        logger.warning(f"读取 edge-tts 并发数记录失败: {e}")
+        return default
+
+
+def _save_learned_concurrency(limit: int) -> None:
+    """
+    保存本次运行结束时的 edge-tts 并发数
+
+    Args:
+        limit: 并发数
     """
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, _get_cos_files_sync)
+    try:
+        EDGE_TTS_CONCURRENCY_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        with open(EDGE_TTS_CONCURRENCY_CACHE, 'w', encoding='utf-8') as f:
+            json.dump({'limit': limit, 'updated_at': datetime.now().isoformat()}, f)
+    except Exception as e:
+        logger.warning(f"保存 edge-tts 并发数记录失败: {e}")
 
 
 async def check_all_sentences(
     sentences: List[Dict[str, Any]],
-    max_concurrent_checks: int = 4
+    max_concurrent_checks: int = 4,
+    cache_ttl: int = AUDIO_LIST_CACHE_TTL
 ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
     """
     检查所有句子的音频文件是否存在（批量优化版本）
@@ -223,11 +703,13 @@ async def check_all_sentences(
     Args:
         sentences: 句子列表
         max_concurrent_checks: 参数保留但不使用（批量检查不需要并发控制）
+        cache_ttl: 本地文件列表缓存有效期（秒），<= 0 表示不使用缓存
 
     Returns:
         (all_results, missing_sentences) 元组
-        - all_results: 所有句子的检查结果
-        - missing_sentences: 缺失音频的句子列表
+        - all_results: 所有句子的检查结果（即传入的句子字典本身，原地写入
+          sentence_hash / r2_exists / cos_exists / audio_exists，不做拷贝）
+        - missing_sentences: 缺失音频的句子列表（与 all_results 共享同一批字典）
     """
     logger.info(f"开始检查 {len(sentences)} 个句子的音频文件...")
     start_time = time.time()
@@ -235,55 +717,58 @@ async def check_all_sentences(
     # 步骤1: 批量获取 R2 和 COS 的所有文件列表
     logger.info("📥 正在从 R2 和 COS 批量获取文件列表...")
     r2_files, cos_files = await asyncio.gather(
-        get_all_audio_files_from_r2(),
-        get_all_audio_files_from_cos()
+        get_all_audio_files_from_r2(cache_ttl),
+        get_all_audio_files_from_cos(cache_ttl)
     )
 
     logger.info(f"   R2 文件数: {len(r2_files)}")
     logger.info(f"   COS 文件数: {len(cos_files)}")
 
-    # 步骤2: 检查每个句子
-    all_results = []
-    missing_audio_sentences = []
-
+    # 步骤2: 批量计算哈希（与 NextJS 一致仍使用 MD5）
     logger.info("🔍 开始检查句子音频状态...")
-    for idx, sentence in enumerate(sentences):
-        en = sentence.get('en', '').strip()
-        if not en:
-            continue
-
-        # 生成哈希
-        sentence_hash = generate_sentence_hash(en)
-
-        # 在 Set 中快速查找
-        r2_exists = sentence_hash in r2_files
-        cos_exists = sentence_hash in cos_files
-
-        # 创建结果对象
-        result = sentence.copy()
-        result['sentence_hash'] = sentence_hash
-        result['r2_exists'] = r2_exists
-        result['cos_exists'] = cos_exists
-        result['audio_exists'] = r2_exists and cos_exists
-
-        all_results.append(result)
-
-        # 如果任一存储不存在，则需要生成
-        if not result['audio_exists']:
-            missing_audio_sentences.append(result)
-
-        # 进度显示（每100个或最后一个）
-        if (idx + 1) % 100 == 0 or (idx + 1) == len(sentences):
-            logger.info(
-                f"检查进度: {idx + 1}/{len(sentences)} "
-                f"({(idx + 1) * 100 / len(sentences):.1f}%)"
-            )
+    all_results = [s for s in sentences if s.get('en', '').strip()]
+    texts = [s['en'].strip() for s in all_results]
+    # 重复出现的句子文本只计算一次哈希
+    hash_of = {text: generate_sentence_hash(text) for text in set(texts)}
+    hashes = [hash_of[text] for text in texts]
+
+    # 步骤3: 按下标与 all_results 对齐的存在标记（每句 1 字节），统计直接在标记上计算
+    total = len(all_results)
+    r2_flags = bytearray()
+    cos_flags = bytearray()
+    # 按块处理，每 10% 输出一次进度（热循环内没有进度判断和日志格式化）
+    step = max(1, -(-total // 10))
+    log_progress = logger.isEnabledFor(logging.INFO)
+    for chunk_start in range(0, total, step):
+        chunk_end = min(chunk_start + step, total)
+        chunk_hashes = hashes[chunk_start:chunk_end]
+        r2_flags.extend(h in r2_files for h in chunk_hashes)
+        cos_flags.extend(h in cos_files for h in chunk_hashes)
+
+        if log_progress:
+            logger.info(f"检查进度: {chunk_end}/{total} ({chunk_end * 100 / total:.1f}%)")
+
+    # 检查结果原地写回句子字典（输出 JSON 需要），不再为每个句子 copy() 一份新字典
+    for sentence, sentence_hash, r2_exists, cos_exists in zip(all_results, hashes, r2_flags, cos_flags):
+        sentence['sentence_hash'] = sentence_hash
+        sentence['r2_exists'] = bool(r2_exists)
+        sentence['cos_exists'] = bool(cos_exists)
+        sentence['audio_exists'] = bool(r2_exists and cos_exists)
+
+    # 如果任一存储不存在，则需要生成
+    missing_audio_sentences = [
+        all_results[idx]
+        for idx, (r2_exists, cos_exists) in enumerate(zip(r2_flags, cos_flags))
+        if not (r2_exists and cos_exists)
+    ]
 
     total_time = time.time() - start_time
     logger.info(f"✅ 检查完成！总耗时: {total_time:.1f}秒")
     logger.info(f"   - 检查句子数: {len(all_results)}")
     logger.info(f"   - 音频已存在: {len(all_results) - len(missing_audio_sentences)}")
     logger.info(f"   - 音频缺失: {len(missing_audio_sentences)}")
+    logger.info(f"   - R2 已存在: {r2_flags.count(1)}")
+    logger.info(f"   - COS 已存在: {cos_flags.count(1)}")
 
     return all_results, missing_audio_sentences
 
@@ -292,16 +777,18 @@ async def generate_and_upload_audio(
     sentences: List[Dict[str, Any]],
     max_concurrent_audio: int = 8,
     max_concurrent_r2: int = 20,
-    max_workers_cos: int = 8
+    max_workers_cos: int = 8,
+    cache_ttl: int = AUDIO_LIST_CACHE_TTL
 ) -> Dict[str, Any]:
     """
-    生成并上传音频文件（优化：先检查本地文件，有则直接上传）
+    生成并上传音频文件（优化：先检查本地文件，有则直接上传；生成与上传流水线并行）
 
     Args:
         sentences: 需要生成音频的句子列表
         max_concurrent_audio: 音频生成最大并发数（默认：8）
         max_concurrent_r2: R2 上传最大并发数（默认：20）
         max_workers_cos: COS 上传最大线程数（默认：8）
+        cache_ttl: 本地文件列表缓存有效期（秒），上传成功的文件会写回仍有效的缓存
 
     Returns:
         统计结果
@@ -315,8 +802,12 @@ async def generate_and_upload_audio(
             'uploaded_cos': 0
         }
 
-    from utils.audio_generator import generate_batch_audio, check_edge_tts_available
-    from services.storage_service import upload_audio_files
+    from utils.audio_generator import (
+        generate_batch_audio,
+        check_edge_tts_available,
+        AdaptiveConcurrencyLimiter
+    )
+    from services.storage_service import upload_audio_stream
 
     # 检查 edge-tts 是否可用
     if not check_edge_tts_available():
@@ -326,129 +817,172 @@ async def generate_and_upload_audio(
     audio_dir = Path("audio/sentences")
     audio_dir.mkdir(parents=True, exist_ok=True)
 
-    # 步骤1: 检查本地文件是否已存在
+    # 步骤1: 检查本地文件是否已存在（一次 scandir 获取目录下所有 mp3 的大小）
     logger.info(f"🔍 检查本地 audio/sentences/ 文件夹...")
+    with os.scandir(audio_dir) as entries:
+        local_audio = {
+            entry.name[:-AUDIO_SUFFIX_LEN]: entry.stat(follow_symlinks=False).st_size
+            for entry in entries
+            if entry.name.endswith('.mp3')
+        }
+
+    audio_dir_str = str(audio_dir)
     local_files = []
-    need_generate = []
+    # sentence_hash -> 文本；相同文本只生成、上传一次，减少 edge-tts 请求
+    need_generate = {}
+    seen_hashes = set()
 
     for sentence in sentences:
         en = sentence.get('en', '').strip()
         if not en:
             continue
 
-        sentence_hash = generate_sentence_hash(en)
-        audio_path = audio_dir / f"{sentence_hash}.mp3"
+        sentence_hash = sentence.get('sentence_hash') or generate_sentence_hash(en)
+        if sentence_hash in seen_hashes:
+            continue
+        seen_hashes.add(sentence_hash)
 
-        if audio_path.exists() and audio_path.stat().st_size > 0:
+        if local_audio.get(sentence_hash, 0) > 0:
             # 本地文件存在，直接加入上传列表
             local_files.append({
                 'en': en,
                 'sentence_hash': sentence_hash,
-                'audio_path': str(audio_path)
+                'audio_path': os.path.join(audio_dir_str, f"{sentence_hash}.mp3")
             })
         else:
             # 需要生成
-            need_generate.append(en)
+            need_generate[sentence_hash] = en
 
     logger.info(f"   ✅ 本地已存在: {len(local_files)} 个文件")
     logger.info(f"   🎵 需要生成: {len(need_generate)} 个文件")
 
-    # 步骤2: 生成缺失的音频文件
-    audio_gen_time = 0
-    newly_generated = []
-    processed_sentences = []  # 初始化，避免UnboundLocalError
-
-    if need_generate:
-        logger.info(f"开始生成 {len(need_generate)} 个音频文件（并发数：{max_concurrent_audio}）...")
-        audio_gen_start = time.time()
-
-        # 生成音频文件
-        processed_sentences = await generate_batch_audio(
-            sentences=need_generate,
-            audio_dir=audio_dir,
-            voice="en-US-AvaMultilingualNeural",
-            max_concurrent=max_concurrent_audio,
-            timeout_per_sentence=30
-        )
+    # 步骤2: 生成与上传流水线并行
+    # 生成完成的文件立即进入有界队列，上传任务按批取出上传，上传期间生成继续进行
+    # 创建句子hash到 (r2_exists, cos_exists) 的映射，确定需要上传到哪个存储
+    sentence_check_map = {
+        s.get('sentence_hash'): (s.get('r2_exists', False), s.get('cos_exists', False))
+        for s in sentences
+    }
 
-        audio_gen_time = time.time() - audio_gen_start
+    upload_queue: asyncio.Queue = asyncio.Queue(maxsize=UPLOAD_QUEUE_SIZE)
+    upload_counts = {'r2': 0, 'cos': 0}
+
+    def on_uploaded(storage: str, result: Dict[str, Any]) -> None:
+        """记录单个文件上传完成，定期输出累计进度"""
+        upload_counts[storage] += 1
+        if (upload_counts['r2'] + upload_counts['cos']) % UPLOAD_PROGRESS_EVERY == 0:
+            logger.info(f"⬆️  已上传: R2 {upload_counts['r2']} 个, COS {upload_counts['cos']} 个")
+
+    async def put_upload(item: Optional[Dict[str, str]]) -> None:
+        """放入上传队列；上传任务提前退出时抛出其异常，避免在满队列上永久阻塞"""
+        put_task = asyncio.ensure_future(upload_queue.put(item))
+        done, _ = await asyncio.wait({put_task, uploader_task}, return_when=asyncio.FIRST_COMPLETED)
+        if put_task not in done:
+            put_task.cancel()
+            uploader_task.result()  # 重新抛出上传任务的异常
+            raise RuntimeError("上传任务已提前结束")
+
+    async def enqueue_upload(sentence_hash: str, audio_path: str) -> None:
+        await put_upload({
+            'file_path': audio_path,
+            'object_key': f"audio/sentences/{sentence_hash}.mp3",
+            'sentence_hash': sentence_hash
+        })
+
+    async def on_generated(processed: Dict[str, Any]) -> None:
+        """单个句子生成完成后立即加入上传队列"""
+        if processed.get('audio_generated') and processed.get('audio_path'):
+            local_files.append({
+                'en': processed.get('en', ''),
+                'sentence_hash': processed['sentence_hash'],
+                'audio_path': processed['audio_path']
+            })
+            await enqueue_upload(processed['sentence_hash'], processed['audio_path'])
+
+    pipeline_start = time.time()
+    # 消费上传队列，攒批上传（同一文件只上传到缺失的存储），收到 None 时结束
+    uploader_task = asyncio.create_task(upload_audio_stream(
+        upload_queue,
+        max_concurrent_r2=max_concurrent_r2,
+        max_workers_cos=max_workers_cos,
+        already_uploaded=lambda file_data: sentence_check_map.get(file_data['sentence_hash'], (False, False)),
+        on_result=on_uploaded
+    ))
 
-        # 统计新生成的文件
-        newly_generated = [p for p in processed_sentences if p.get('audio_generated') and not p.get('existed')]
+    try:
+        # 本地已存在的文件（scandir 已确认存在，无需再次 stat）直接进入上传队列
+        for file_info in list(local_files):
+            await enqueue_upload(file_info['sentence_hash'], file_info['audio_path'])
+
+        audio_gen_time = 0
+        newly_generated = []
+
+        if need_generate:
+            # 自适应并发：从上次学习到的值开始，被限流时减半，之后逐步恢复（不超过配置值）
+            limiter = AdaptiveConcurrencyLimiter(
+                initial=_load_learned_concurrency(max_concurrent_audio),
+                max_limit=max_concurrent_audio
+            )
+            logger.info(
+                f"开始生成 {len(need_generate)} 个音频文件"
+                f"（并发数：{limiter.limit}，上限：{max_concurrent_audio}），生成完成即上传..."
+            )
+            audio_gen_start = time.time()
+
+            # 生成音频文件
+            processed_sentences = await generate_batch_audio(
+                sentences=list(need_generate.values()),
+                audio_dir=audio_dir,
+                voice="en-US-AvaMultilingualNeural",
+                max_concurrent=max_concurrent_audio,
+                timeout_per_sentence=30,
+                limiter=limiter,
+                on_result=on_generated
+            )
 
-        logger.info(f"✅ 音频生成完成，耗时: {audio_gen_time:.1f}秒")
-        logger.info(f"   - 新生成: {len(newly_generated)} 个文件")
-        logger.info(f"   - 生成速度: {len(need_generate) / audio_gen_time:.2f} 句/秒")
+            audio_gen_time = time.time() - audio_gen_start
+            _save_learned_concurrency(limiter.limit)
 
-        # 将新生成的文件添加到本地文件列表
-        for processed in processed_sentences:
-            if processed.get('audio_generated') and processed.get('audio_path'):
-                local_files.append({
-                    'en': processed.get('en', ''),
-                    'sentence_hash': processed['sentence_hash'],
-                    'audio_path': processed['audio_path']
-                })
-    else:
-        logger.info("✅ 所有文件都已在本地存在，无需生成")
-
-    # 步骤3: 准备上传文件列表（根据缺失情况分别上传）
-    # 为每个句子匹配原始检查结果，确定需要上传到哪个存储
-    upload_files_r2 = []
-    upload_files_cos = []
-
-    # 创建句子hash到检查结果的映射
-    sentence_check_map = {s.get('sentence_hash'): s for s in sentences}
-
-    for file_info in local_files:
-        audio_path = file_info['audio_path']
-        sentence_hash = file_info['sentence_hash']
-
-        if Path(audio_path).exists():
-            object_key = f"audio/sentences/{sentence_hash}.mp3"
-            file_data = {
-                'file_path': audio_path,
-                'object_key': object_key,
-                'sentence_hash': sentence_hash
-            }
-
-            # 获取原始检查结果
-            check_result = sentence_check_map.get(sentence_hash, {})
-            r2_exists = check_result.get('r2_exists', False)
-            cos_exists = check_result.get('cos_exists', False)
-
-            # 只上传到缺失的存储
-            if not r2_exists:
-                upload_files_r2.append(file_data)
-            if not cos_exists:
-                upload_files_cos.append(file_data)
-
-    logger.info(f"准备上传文件:")
-    logger.info(f"   - R2 需要上传: {len(upload_files_r2)} 个")
-    logger.info(f"   - COS 需要上传: {len(upload_files_cos)} 个")
-
-    upload_start = time.time()
-
-    # 分别上传到 R2 和 COS（根据缺失情况）
-    if upload_files_r2 or upload_files_cos:
-        cos_results, r2_results, cos_stats, r2_stats = await upload_audio_files(
-            upload_files=[],  # 使用 r2_files 和 cos_files 指定各自的上传列表
-            upload_to_cos=len(upload_files_cos) > 0,
-            upload_to_r2=len(upload_files_r2) > 0,
-            max_concurrent_r2=max_concurrent_r2,
-            max_workers_cos=max_workers_cos,
-            r2_files=upload_files_r2,  # 只上传到 R2 缺失的文件
-            cos_files=upload_files_cos  # 只上传到 COS 缺失的文件
-        )
-    else:
+            # 统计新生成的文件
+            newly_generated = [p for p in processed_sentences if p.get('audio_generated') and not p.get('existed')]
+
+            logger.info(f"✅ 音频生成完成，耗时: {audio_gen_time:.1f}秒")
+            logger.info(f"   - 新生成: {len(newly_generated)} 个文件")
+            logger.info(f"   - 生成速度: {len(need_generate) / audio_gen_time:.2f} 句/秒")
+        else:
+            logger.info("✅ 所有文件都已在本地存在，无需生成")
+
+        # 通知上传任务结束并等待剩余文件上传完成
+        await put_upload(None)
+        cos_results, r2_results, cos_stats, r2_stats = await uploader_task
+    finally:
+        if not uploader_task.done():
+            uploader_task.cancel()
+
+    if not upload_counts['r2'] and not upload_counts['cos']:
         logger.info("所有文件都已在R2和COS存在，无需上传")
-        cos_results, r2_results = [], []
-        cos_stats = {'total_uploads': 0, 'successful_uploads': 0, 'failed_uploads': 0}
-        r2_stats = {'total_uploads': 0, 'successful_uploads': 0, 'failed_uploads': 0}
 
-    upload_time = time.time() - upload_start
-    logger.info(f"✅ 上传完成，耗时: {upload_time:.1f}秒")
+    # 上传与生成重叠，上传耗时即流水线从开始到最后一个文件上传完成的时间
+    pipeline_time = time.time() - pipeline_start
+    upload_time = pipeline_time
+    logger.info(f"✅ 上传完成，上传耗时: {upload_time:.1f}秒")
+
+    # 将上传成功的文件写回文件列表缓存，下次运行无需重新列举
+    for storage, bucket_env, results in (
+        ('r2', 'R2_BUCKET_NAME', r2_results),
+        ('cos', 'COS_BUCKET', cos_results)
+    ):
+        _extend_cache(
+            _audio_list_cache_key(storage, os.getenv(bucket_env)),
+            (
+                r['object_key'][SENTENCE_AUDIO_PREFIX_LEN:-AUDIO_SUFFIX_LEN]
+                for r in results if r.get('success')
+            ),
+            cache_ttl
+        )
 
-    total_time = audio_gen_time + upload_time
+    # 生成与上传重叠执行，总耗时为流水线实际耗时
+    total_time = pipeline_time
 
     stats = {
         'total': len(sentences),
@@ -463,7 +997,7 @@ async def generate_and_upload_audio(
             'upload_time': upload_time,
             'total_time': total_time,
             'audio_gen_rate': len(need_generate) / audio_gen_time if audio_gen_time > 0 else 0,
-            'upload_rate': len(upload_files) / upload_time if upload_time > 0 else 0
+            'upload_rate': (upload_counts['r2'] + upload_counts['cos']) / upload_time if upload_time > 0 else 0
         }
     }
 
@@ -495,28 +1029,50 @@ def group_by_episode(sentences: List[Dict[str, Any]]) -> Dict[int, List[Dict[str
     Returns:
         按 episode_id 分组的字典
     """
-    episodes = {}
+    episodes = defaultdict(list)
     for sentence in sentences:
-        episode_id = sentence.get('episode_id')
-        if episode_id not in episodes:
-            episodes[episode_id] = []
-        episodes[episode_id].append(sentence)
+        episodes[sentence.get('episode_id')].append(sentence)
 
-    return episodes
+    return dict(episodes)
 
 
 def format_check_results(all_results: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     格式化检查结果，按 episode 分组
 
+    一次遍历同时完成分组、字段提取和各项计数。
+
     Args:
         all_results: 所有句子的检查结果
 
     Returns:
         格式化后的结果字典
     """
-    # 按 episode 分组
-    episodes = group_by_episode(all_results)
+    episodes = defaultdict(lambda: {
+        'audio_exists_count': 0,
+        'r2_exists_count': 0,
+        'cos_exists_count': 0,
+        'sentences': []
+    })
+
+    for s in all_results:
+        r2_exists = s.get('r2_exists', False)
+        cos_exists = s.get('cos_exists', False)
+        audio_exists = s.get('audio_exists', False)
+
+        bucket = episodes[s.get('episode_id')]
+        bucket['audio_exists_count'] += audio_exists
+        bucket['r2_exists_count'] += r2_exists
+        bucket['cos_exists_count'] += cos_exists
+        bucket['sentences'].append({
+            'sentence_id': s.get('sentence_id'),
+            'episode_sequence': s.get('episode_sequence'),
+            'en': s.get('en'),
+            'sentence_hash': s.get('sentence_hash'),
+            'r2_exists': r2_exists,
+            'cos_exists': cos_exists,
+            'audio_exists': audio_exists
+        })
 
     # 构建结果
     formatted_results = {
@@ -525,38 +1081,130 @@ def format_check_results(all_results: List[Dict[str, Any]]) -> Dict[str, Any]:
         'episodes': {}
     }
 
-    for episode_id in sorted(episodes.keys()):
-        episode_sentences = episodes[episode_id]
-
-        # 统计该 episode 的音频状态
-        audio_exists_count = sum(1 for s in episode_sentences if s.get('audio_exists', False))
-        r2_exists_count = sum(1 for s in episode_sentences if s.get('r2_exists', False))
-        cos_exists_count = sum(1 for s in episode_sentences if s.get('cos_exists', False))
+    for episode_id in sorted(episodes):
+        bucket = episodes[episode_id]
+        episode_sentences = bucket['sentences']
+        episode_sentences.sort(key=lambda x: x['episode_sequence'] or 0)
 
         formatted_results['episodes'][f'EP{episode_id}'] = {
             'episode_id': episode_id,
             'total_sentences': len(episode_sentences),
-            'audio_exists_count': audio_exists_count,
-            'audio_missing_count': len(episode_sentences) - audio_exists_count,
-            'r2_exists_count': r2_exists_count,
-            'cos_exists_count': cos_exists_count,
-            'sentences': [
-                {
-                    'sentence_id': s.get('sentence_id'),
-                    'episode_sequence': s.get('episode_sequence'),
-                    'en': s.get('en'),
-                    'sentence_hash': s.get('sentence_hash'),
-                    'r2_exists': s.get('r2_exists', False),
-                    'cos_exists': s.get('cos_exists', False),
-                    'audio_exists': s.get('audio_exists', False)
-                }
-                for s in sorted(episode_sentences, key=lambda x: x.get('episode_sequence', 0))
-            ]
+            'audio_exists_count': bucket['audio_exists_count'],
+            'audio_missing_count': len(episode_sentences) - bucket['audio_exists_count'],
+            'r2_exists_count': bucket['r2_exists_count'],
+            'cos_exists_count': bucket['cos_exists_count'],
+            'sentences': episode_sentences
         }
 
     return formatted_results
 
 
+def write_json_file(path: Path, data: Any, indent: Optional[int] = None) -> None:
+    """
+    写入 JSON 文件（优先使用 orjson，未安装时回退到标准库 json）
+
+    大文件默认不缩进，体积更小、写入更快；需要人工查看的小文件可传 indent=2。
+
+    Args:
+        path: 输出文件路径
+        data: 要写入的数据
+        indent: 缩进空格数，None 表示紧凑格式（orjson 只支持 2 空格缩进）
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=option))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=indent)
+
+
+def load_sentences_in_range(
+    data_file: Path,
+    start_episode: int,
+    end_episode: int
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    读取数据文件并筛选指定 episode 范围的句子
+
+    安装了 ijson 时流式解析，只在内存中保留筛选后的句子；否则退回 json.load。
+
+    Args:
+        data_file: 数据文件路径（句子数组 JSON）
+        start_episode: 起始 Episode ID
+        end_episode: 结束 Episode ID
+
+    Returns:
+        (filtered_sentences, total_count) 元组
+    """
+    try:
+        import ijson
+    except ImportError:
+        ijson = None
+
+    total_count = 0
+    filtered_sentences = []
+
+    with open(data_file, 'rb') as f:
+        if ijson is not None:
+            sentences = ijson.items(f, 'item', use_float=True)
+        else:
+            sentences = json.load(f)
+
+        for sentence in sentences:
+            total_count += 1
+            if start_episode <= sentence.get('episode_id', 0) <= end_episode:
+                filtered_sentences.append(sentence)
+
+    return filtered_sentences, total_count
+
+
+def is_interactive() -> bool:
+    """
+    是否需要等待用户确认
+
+    stdin 不是终端（CI / cron / 管道）或设置了 LINGOHOW_ASSUME_YES 时不等待。
+    """
+    return sys.stdin.isatty() and not os.getenv('LINGOHOW_ASSUME_YES')
+
+
+async def wait_for_confirmation(timeout: float) -> None:
+    """
+    等待用户按 Enter 或超时后继续（非交互模式立即返回）
+
+    读取 stdin 在守护线程中进行，超时后不会阻塞进程退出。
+
+    Args:
+        timeout: 最长等待时间（秒）
+    """
+    if not is_interactive():
+        return
+
+    loop = asyncio.get_running_loop()
+    pressed = loop.create_future()
+
+    def _resolve() -> None:
+        if not pressed.done():
+            pressed.set_result(None)
+
+    def _read_line() -> None:
+        sys.stdin.readline()
+        try:
+            loop.call_soon_threadsafe(_resolve)
+        except RuntimeError:
+            # 事件循环已关闭
+            pass
+
+    threading.Thread(target=_read_line, daemon=True).start()
+
+    try:
+        await asyncio.wait_for(pressed, timeout)
+    except asyncio.TimeoutError:
+        pass
+
+
 def parse_arguments():
     """解析命令行参数"""
     parser = argparse.ArgumentParser(
@@ -619,6 +1267,19 @@ def parse_arguments():
         help='COS 上传线程数（默认：3）'
     )
 
+    parser.add_argument(
+        '--cache-ttl',
+        type=int,
+        default=AUDIO_LIST_CACHE_TTL,
+        help=f'R2/COS 文件列表本地缓存有效期，单位秒，0 表示不使用缓存（默认：{AUDIO_LIST_CACHE_TTL}）'
+    )
+
+    parser.add_argument(
+        '--missing-only',
+        action='store_true',
+        help='只保存缺失音频的句子列表，跳过按 episode 分组的完整检查结果（大范围检查时节省内存和磁盘）'
+    )
+
     parser.add_argument(
         '--data-file',
         type=str,
@@ -650,6 +1311,7 @@ async def main():
     MAX_CONCURRENT_AUDIO = args.audio_workers
     MAX_CONCURRENT_R2 = args.r2_workers
     MAX_WORKERS_COS = args.cos_workers
+    CACHE_TTL = args.cache_ttl
     data_file_path = args.data_file
 
     # 读取数据文件
@@ -661,16 +1323,13 @@ async def main():
 
     logger.info("=" * 60)
     logger.info(f"📖 读取数据文件: {data_file}")
-    with open(data_file, 'r', encoding='utf-8') as f:
-        all_sentences = json.load(f)
 
-    logger.info(f"   总句子数: {len(all_sentences)}")
+    # 边读取边筛选指定范围的 episode 句子
+    filtered_sentences, total_count = load_sentences_in_range(
+        data_file, START_EPISODE, END_EPISODE
+    )
 
-    # 筛选指定范围的 episode 句子
-    filtered_sentences = [
-        s for s in all_sentences
-        if START_EPISODE <= s.get('episode_id', 0) <= END_EPISODE
-    ]
+    logger.info(f"   总句子数: {total_count}")
 
     logger.info(f"   筛选范围: Episode {START_EPISODE} 到 Episode {END_EPISODE}")
     logger.info(f"   筛选后句子数: {len(filtered_sentences)}")
@@ -686,28 +1345,30 @@ async def main():
     # 检查音频文件是否存在
     all_results, missing_sentences = await check_all_sentences(
         filtered_sentences,
-        max_concurrent_checks=MAX_CONCURRENT_CHECKS
+        max_concurrent_checks=MAX_CONCURRENT_CHECKS,
+        cache_ttl=CACHE_TTL
     )
 
     # 格式化并保存完整的检查结果（按 episode 分组）
-    formatted_results = format_check_results(all_results)
+    # --missing-only 时跳过：完整报告要为每个句子再构建一份输出字典，是检查阶段最大的内存开销
+    if not args.missing_only:
+        formatted_results = format_check_results(all_results)
 
-    # 保存完整检查结果
-    full_results_file = Path(
-        f"audio_check_results_ep{START_EPISODE}-{END_EPISODE}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    )
-    with open(full_results_file, 'w', encoding='utf-8') as f:
-        json.dump(formatted_results, f, ensure_ascii=False, indent=2)
+        # 保存完整检查结果
+        full_results_file = Path(
+            f"audio_check_results_ep{START_EPISODE}-{END_EPISODE}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        )
+        write_json_file(full_results_file, formatted_results)
+        del formatted_results
 
-    logger.info(f"📊 完整检查结果已保存到: {full_results_file}")
+        logger.info(f"📊 完整检查结果已保存到: {full_results_file}")
 
     # 同时保存缺失音频的句子列表（用于生成）
     if missing_sentences:
         missing_file = Path(
             f"missing_audio_ep{START_EPISODE}-{END_EPISODE}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         )
-        with open(missing_file, 'w', encoding='utf-8') as f:
-            json.dump(missing_sentences, f, ensure_ascii=False, indent=2)
+        write_json_file(missing_file, missing_sentences)
 
         logger.info(f"💾 缺失音频的句子已保存到: {missing_file}")
 
@@ -717,8 +1378,9 @@ async def main():
     logger.info("📊 检查结果统计")
     logger.info("=" * 60)
 
-    # 总体统计
+    # 总体统计（之后只需要缺失列表，提前释放其余句子字典，生成阶段只保留 O(缺失数) 的数据）
     total_sentences = len(all_results)
+    del all_results, filtered_sentences
     audio_exists = total_sentences - len(missing_sentences)
 
     logger.info(f"总句子数: {total_sentences}")
@@ -752,11 +1414,14 @@ async def main():
         logger.info("🎵 是否继续生成并上传缺失的音频文件？")
         logger.info(f"   将生成 {len(missing_sentences)} 个音频文件")
         logger.info(f"   范围: Episode {START_EPISODE} 到 Episode {END_EPISODE}")
-        logger.info("   按 Ctrl+C 取消，或等待 10 秒自动继续...")
+        if is_interactive():
+            logger.info(f"   按 Enter 立即继续，按 Ctrl+C 取消，或等待 {CONFIRM_TIMEOUT} 秒自动继续...")
+        else:
+            logger.info("   非交互模式，直接继续")
         logger.info("=" * 60)
 
         try:
-            await asyncio.sleep(10)
+            await wait_for_confirmation(CONFIRM_TIMEOUT)
         except KeyboardInterrupt:
             logger.info("用户取消操作")
             return
@@ -766,7 +1431,8 @@ async def main():
             missing_sentences,
             max_concurrent_audio=MAX_CONCURRENT_AUDIO,
             max_concurrent_r2=MAX_CONCURRENT_R2,
-            max_workers_cos=MAX_WORKERS_COS
+            max_workers_cos=MAX_WORKERS_COS,
+            cache_ttl=CACHE_TTL
         )
 
         # 保存统计结果
@@ -781,8 +1447,7 @@ async def main():
             'total_episodes': END_EPISODE - START_EPISODE + 1
         }
 
-        with open(stats_file, 'w', encoding='utf-8') as f:
-            json.dump(stats, f, ensure_ascii=False, indent=2)
+        write_json_file(stats_file, stats, indent=2)
 
         logger.info(f"📊 统计结果已保存到: {stats_file}")
         logger.info(f"✅ 所有操作完成！(Episode {START_EPISODE}-{END_EPISODE})")
@@ -20,10 +20,22 @@ class Settings(BaseSettings):
     # Deepseek API Settings
     deepseek_api_key: str
     deepseek_base_url: str = "https://api.deepseek.com"
+    deepseek_max_connections: int = 100  # Pool size of each (sync/async) DeepSeek HTTP client
+    deepseek_timeout_seconds: float = 300.0  # Per request; must cover a whole batched enhancement
 
     # MongoDB Settings
     mongodb_uri: str
     mongodb_database_name: str = "dev_lingohow"
+    mongodb_max_pool_size: int = 100
+    mongodb_min_pool_size: int = 10
+    mongodb_socket_timeout_ms: int = 5000
+    mongodb_ensure_indexes: bool = True  # Create/verify the episode_id index at startup
+    mongodb_batch_wait_ms: int = 2  # Window for coalescing concurrent episode reads into one $in query
+
+    # Redis Settings (optional shared cache across workers; disabled when empty)
+    redis_url: str = ""
+    redis_episode_ttl_seconds: int = 300
+    redis_enhance_ttl_seconds: int = 2592000  # 30 days; enhancements of a sentence don't change
 
     # R2 (Cloudflare) Storage Settings
     r2_bucket_name: str = ""
@@ -40,18 +52,41 @@ class Settings(BaseSettings):
     cos_bucket: str = ""
     cos_region: str = ""
 
-    # CORS Settings
-    cors_origins: List[str] = ["*"]
-    cors_allow_credentials: bool = False
+    # CORS and response compression are configured by CORSSettings / CompressionSettings
 
     # Rate Limiting
     rate_limit_transcript: str = "1/5seconds"
+    paragraph_max_sentences: int = 200  # Larger paragraphs are rejected with 413
+    paragraph_max_chars: int = 100_000  # Longer paragraph text is rejected with 413 before splitting
 
     # Performance Settings
     max_workers: int = 4
-    max_concurrent_audio: int = 5
+    worker_pool_size: int = 32  # Shared thread pool for blocking calls (app-wide)
+    anyio_thread_limit: int = 100  # Starlette threadpool (sync handlers/dependencies, background tasks)
+    expression_pool_size: int = 16  # Dedicated pool for expression batch requests
+    max_concurrent_audio: int = 5  # Initial Edge TTS concurrency (adapts at runtime)
+    max_concurrent_audio_limit: int = 16  # Ceiling the adaptive Edge TTS concurrency may grow to
     audio_timeout_seconds: int = 30
 
+    # DeepSeek result caches (translation / phonetic / highlights), per process
+    deepseek_cache_size: int = 100000
+    deepseek_cache_ttl_seconds: int = 86400
+
+    # Sentences per batched DeepSeek enhancement request
+    enhance_batch_size: int = 10
+    enhance_batch_wait_ms: int = 20  # Window for coalescing concurrent single-sentence requests
+
+    # YouTube transcript cache keyed by video_id, per process
+    transcript_cache_size: int = 2048
+    transcript_cache_ttl_seconds: int = 86400
+
+    # MongoDB episode document cache keyed by episode_id, per process
+    episode_cache_size: int = 10000
+    episode_cache_ttl_seconds: int = 60
+    episode_http_max_age_seconds: int = 30  # Cache-Control max-age on episode reads
+    episode_file_cache_size: int = 256  # Raw local episode files kept in memory (validated by mtime)
+    episode_file_lock: bool = True  # Cross-process FileLock; False only with a single worker process
+
     # Storage Paths
     audio_output_dir: str = "audio/sentences"
 
@@ -62,6 +97,7 @@ class Settings(BaseSettings):
         env_file = ".env.local"
         case_sensitive = False
         env_prefix = ""
+        extra = "ignore"  # CORS_* / GZIP_* in .env.local belong to the settings classes below
 
     def get_r2_url(self, object_key: str) -> str:
         """
@@ -103,3 +139,54 @@ def get_settings() -> Settings:
     improving performance and consistency.
     """
     return Settings()
+
+
+class CORSSettings(BaseSettings):
+    """
+    CORS settings only.
+
+    Middleware is configured when the app module is imported, before
+    lifespan runs, so these are loaded separately from Settings (which
+    requires API keys) from the same environment variables.
+    """
+
+    cors_origins: List[str] = ["*"]
+    cors_allow_credentials: bool = False
+    cors_allow_methods: List[str] = ["GET", "POST"]
+    cors_allow_headers: List[str] = ["Content-Type", "Authorization"]
+
+    class Config:
+        env_file = ".env.local"
+        case_sensitive = False
+        env_prefix = ""
+        extra = "ignore"
+
+
+@lru_cache()
+def get_cors_settings() -> CORSSettings:
+    """Get cached CORS settings instance."""
+    return CORSSettings()
+
+
+class CompressionSettings(BaseSettings):
+    """
+    Response compression settings only.
+
+    Loaded at import time alongside CORSSettings for the same reason:
+    middleware is added before lifespan runs.
+    """
+
+    gzip_minimum_size: int = 1024  # Smaller bodies are sent uncompressed
+    gzip_compress_level: int = 6  # Ratio/CPU trade-off (1-9)
+
+    class Config:
+        env_file = ".env.local"
+        case_sensitive = False
+        env_prefix = ""
+        extra = "ignore"
+
+
+@lru_cache()
+def get_compression_settings() -> CompressionSettings:
+    """Get cached compression settings instance."""
+    return CompressionSettings()
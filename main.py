@@ -3,19 +3,25 @@ FastAPI Translation API
 Provides endpoints for text translation, sentence enhancement, and expression generation.
 """
 
-import logging
+import asyncio
 import hashlib
+import logging
+from typing import Optional
 from pathlib import Path
 from contextlib import asynccontextmanager
 from concurrent.futures import ThreadPoolExecutor
-from fastapi import FastAPI, HTTPException, Depends, Request
+import orjson
+from anyio import to_thread
+from fastapi import FastAPI, HTTPException, Depends, Request, BackgroundTasks, Query
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
 # Configuration
-from config import get_settings
+from config import get_settings, get_cors_settings, get_compression_settings
 
 # Models
 from models import (
@@ -33,14 +39,18 @@ from models import (
     PhraseAudioGenerateRequest,
     PhraseAudioGenerateResponse,
     EnhancedSentence,
-    HighlightEntry,
+    ENHANCED_SENTENCES_ADAPTER,
+    HIGHLIGHT_ENTRIES_ADAPTER,
     MongoDBEpisodeResponse,
+    MongoDBEpisodeBatchRequest,
+    MongoDBEpisodeBatchResponse,
     ErrorResponse,
 )
-from services.deepseek_client import DeepseekClient, DeepseekAPIError
+from services.deepseek_client import DeepseekClient, AsyncDeepseekClient, DeepseekAPIError
 from services.translation_service import TranslationService
 from services.phonetic_service import PhoneticService
 from services.highlight_service import HighlightService
+from services.enhance_service import EnhanceService
 from services.expression_service import ExpressionService
 from services.transcript_service import (
     TranscriptService,
@@ -55,13 +65,16 @@ from services.episode_service import (
 from services.mongodb_service import (
     MongoDBService,
     MongoDBServiceError,
-    MongoDBConnectionError,
-    EpisodeNotFoundInDBError
+    MongoDBConnectionError
 )
-from utils.text_splitter import split_into_sentences
-from utils.audio_generator import generate_batch_audio, check_edge_tts_available, AudioGenerationError
-from utils.phrase_audio_generator import generate_and_upload_phrase_audio
-from services.storage_service import upload_audio_files
+from utils.cache import LRUCache
+
+try:
+    from redis.asyncio import Redis
+except ImportError:
+    Redis = None
+from utils.text_splitter import split_into_sentences_async
+from utils.text_helpers import hash_text
 
 # Logging will be configured in lifespan
 logger = logging.getLogger(__name__)
@@ -69,6 +82,19 @@ logger = logging.getLogger(__name__)
 # Initialize rate limiter
 limiter = Limiter(key_func=get_remote_address)
 
+# Paragraph endpoints are charged per sentence, so one large paragraph
+# uses as much of the budget as many small ones
+PARAGRAPH_RATE_LIMIT = "300/minute"
+
+
+# Streamed line by line; excluded from gzip, which would hold short lines back in zlib's buffer
+PARAGRAPH_STREAM_PATH = "/api/paragraph/generate-sentences/stream"
+
+
+def paragraph_request_cost(request: Request) -> int:
+    """Rate-limit cost of a paragraph request: its sentence count (set by paragraph_sentences)."""
+    return max(1, len(getattr(request.state, "paragraph_sentences", ())))
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -84,33 +110,131 @@ async def lifespan(app: FastAPI):
 
     # Startup
     logger.info(f"Starting {settings.app_name} v{settings.app_version}")
+
+    # One shared pool for all blocking work (asyncio.to_thread / run_in_executor(None, ...))
+    worker_pool = ThreadPoolExecutor(
+        max_workers=settings.worker_pool_size,
+        thread_name_prefix="worker"
+    )
+    asyncio.get_running_loop().set_default_executor(worker_pool)
+    app.state.worker_pool = worker_pool
+
+    # Starlette runs sync handlers, sync dependencies and background tasks on anyio's own pool
+    to_thread.current_default_thread_limiter().total_tokens = settings.anyio_thread_limit
+
+    # Sentence audio output directory, created once instead of on every audio request
+    Path(settings.audio_output_dir).mkdir(parents=True, exist_ok=True)
+
     try:
         # Create Deepseek client
+        # Sync client shares one HTTP connection pool across all worker threads
         deepseek_client = DeepseekClient(
             api_key=settings.deepseek_api_key,
-            base_url=settings.deepseek_base_url
+            base_url=settings.deepseek_base_url,
+            max_connections=settings.deepseek_max_connections,
+            timeout=settings.deepseek_timeout_seconds
         )
+        app.state.deepseek_client = deepseek_client
         logger.info("✅ DeepseekClient initialized")
 
-        # Initialize services and store in app.state
-        app.state.translation_service = TranslationService(deepseek_client)
-        app.state.phonetic_service = PhoneticService(deepseek_client)
-        app.state.highlight_service = HighlightService(deepseek_client)
-        app.state.expression_service = ExpressionService(deepseek_client)
-        app.state.transcript_service = TranscriptService()
-        app.state.episode_service = EpisodeService()
+        # Async client shares one HTTP connection pool across all concurrent requests
+        async_deepseek_client = AsyncDeepseekClient(
+            api_key=settings.deepseek_api_key,
+            base_url=settings.deepseek_base_url,
+            max_connections=settings.deepseek_max_connections,
+            timeout=settings.deepseek_timeout_seconds
+        )
+        app.state.async_deepseek_client = async_deepseek_client
+        logger.info("✅ AsyncDeepseekClient initialized")
+
+        # Optional Redis tier shared by all workers (MongoDB episodes, sentence enhancements)
+        redis_client = None
+        if settings.redis_url:
+            if Redis is None:
+                logger.warning("⚠️  REDIS_URL is set but redis is not installed; shared cache disabled")
+            else:
+                redis_client = Redis.from_url(settings.redis_url)
+                logger.info("✅ Redis client initialized")
+        app.state.redis_client = redis_client
+
+        # Result caches keyed by sentence hash: repeated sentences skip the DeepSeek round trip
+        def make_cache() -> LRUCache:
+            return LRUCache(
+                maxsize=settings.deepseek_cache_size,
+                ttl=settings.deepseek_cache_ttl_seconds
+            )
+
+        # Initialize services
+        translation_service = TranslationService(deepseek_client, async_deepseek_client, make_cache())
+        phonetic_service = PhoneticService(deepseek_client, async_deepseek_client, make_cache())
+        highlight_service = HighlightService(deepseek_client, async_deepseek_client, make_cache())
+        services = {
+            "translation": translation_service,
+            "phonetic": phonetic_service,
+            "highlight": highlight_service,
+            "enhance": EnhanceService(
+                async_deepseek_client,
+                translation_service,
+                phonetic_service,
+                highlight_service,
+                batch_size=settings.enhance_batch_size,
+                batch_wait_ms=settings.enhance_batch_wait_ms,
+                cache=make_cache(),
+                redis_client=redis_client,
+                redis_ttl=settings.redis_enhance_ttl_seconds
+            ),
+            "expression": ExpressionService(
+                deepseek_client,
+                executor=ThreadPoolExecutor(
+                    max_workers=settings.expression_pool_size,
+                    thread_name_prefix="expression"
+                )
+            ),
+            "transcript": TranscriptService(
+                cache=LRUCache(
+                    maxsize=settings.transcript_cache_size,
+                    ttl=settings.transcript_cache_ttl_seconds
+                )
+            ),
+            "episode": EpisodeService(
+                cache=LRUCache(maxsize=settings.episode_file_cache_size),
+                use_file_lock=settings.episode_file_lock
+            ),
+        }
 
-        # Initialize MongoDB service
+        # Initialize MongoDB service (optional: endpoints return 503 without it)
         try:
-            app.state.mongodb_service = MongoDBService(
+            mongodb_service = MongoDBService(
                 mongodb_uri=settings.mongodb_uri,
-                mongodb_database_name=settings.mongodb_database_name
+                mongodb_database_name=settings.mongodb_database_name,
+                cache=LRUCache(
+                    maxsize=settings.episode_cache_size,
+                    ttl=settings.episode_cache_ttl_seconds
+                ),
+                redis_client=redis_client,
+                redis_ttl=settings.redis_episode_ttl_seconds,
+                max_pool_size=settings.mongodb_max_pool_size,
+                min_pool_size=settings.mongodb_min_pool_size,
+                socket_timeout_ms=settings.mongodb_socket_timeout_ms,
+                batch_wait_ms=settings.mongodb_batch_wait_ms
             )
-            app.state.mongodb_service.connect()
+            # Ping and index checks are blocking round trips; keep them off the event loop
+            await asyncio.to_thread(mongodb_service.connect)
+            if settings.mongodb_ensure_indexes:
+                await asyncio.to_thread(mongodb_service.ensure_indexes)
+            await mongodb_service.warm_up_async()
+            mongodb_service.start()
+            services["mongodb"] = mongodb_service
             logger.info("✅ MongoDBService initialized")
         except MongoDBConnectionError as e:
             logger.warning(f"⚠️  MongoDB service initialization failed: {e}")
-            app.state.mongodb_service = None
+            services["mongodb"] = None
+
+        services["enhance"].start()
+
+        # Store services in app.state; getters check one flag plus a dict lookup
+        app.state.services = services
+        app.state.services_ready = True
 
         # Store settings in app.state for access in endpoints
         app.state.settings = settings
@@ -124,8 +248,21 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info(f"Shutting down {settings.app_name}")
-    if hasattr(app.state, 'mongodb_service') and app.state.mongodb_service:
-        app.state.mongodb_service.close()
+    app.state.services_ready = False
+    if app.state.services.get("mongodb"):
+        await app.state.services["mongodb"].aclose()
+        app.state.services["mongodb"].close()
+    if app.state.services.get("enhance"):
+        await app.state.services["enhance"].aclose()
+    if app.state.services.get("expression"):
+        app.state.services["expression"].close()
+    if hasattr(app.state, 'deepseek_client'):
+        app.state.deepseek_client.close()
+    if hasattr(app.state, 'async_deepseek_client'):
+        await app.state.async_deepseek_client.aclose()
+    if getattr(app.state, 'redis_client', None) is not None:
+        await app.state.redis_client.aclose()
+    worker_pool.shutdown(wait=True)
 
 
 # Initialize FastAPI app (settings will be loaded in lifespan)
@@ -134,6 +271,8 @@ app = FastAPI(
     version="1.0.0",
     description="API for Chinese translation, phonetic transcription, and expression generation",
     lifespan=lifespan,
+    # orjson (already a dependency) encodes responses natively instead of stdlib json
+    default_response_class=ORJSONResponse,
     tags_metadata=[
         {"name": "system", "description": "System health and information endpoints"},
         {"name": "paragraph", "description": "Paragraph processing and sentence generation"},
@@ -148,64 +287,281 @@ app = FastAPI(
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
-# Configure CORS
-# TODO: In production, configure CORS with specific origins from settings
+# Services are populated by lifespan; reported by /health in this order
+SERVICE_NAMES = ("translation", "phonetic", "highlight", "expression", "transcript", "episode", "mongodb")
+app.state.services = {}
+app.state.services_ready = False
+app.state.tts_limiter = None  # Created by the first audio request (keeps edge-tts unloaded until then)
+
+# Configure CORS from settings (CORS_ORIGINS, e.g. '["https://lingohow.com"]');
+# explicit methods and headers keep preflight handling off the wildcard path
+cors_settings = get_cors_settings()
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Allow all origins for development
-    allow_credentials=False,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=cors_settings.cors_origins,
+    allow_credentials=cors_settings.cors_allow_credentials,
+    allow_methods=cors_settings.cors_allow_methods,
+    allow_headers=cors_settings.cors_allow_headers,
 )
+
+class StreamingAwareGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that passes the given streaming paths through uncompressed."""
+
+    def __init__(self, app, exclude_paths: tuple[str, ...] = (), **kwargs):
+        super().__init__(app, **kwargs)
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# Gzip JSON bodies (episode documents, transcripts) for clients sending Accept-Encoding: gzip;
+# NDJSON streams are skipped so each line is delivered as soon as it is written
+compression_settings = get_compression_settings()
+app.add_middleware(
+    StreamingAwareGZipMiddleware,
+    exclude_paths=(PARAGRAPH_STREAM_PATH,),
+    minimum_size=compression_settings.gzip_minimum_size,
+    compresslevel=compression_settings.gzip_compress_level,
+)
+
 # ===== Dependency Injection =====
 
-def get_translation_service(request: Request) -> TranslationService:
+def _get_service(request: Request, name: str, label: str):
+    """Look up an initialized service, or raise 503."""
+    service = request.app.state.services.get(name) if request.app.state.services_ready else None
+    if service is None:
+        raise HTTPException(status_code=503, detail=f"{label} service not initialized")
+    return service
+
+
+async def get_translation_service(request: Request) -> TranslationService:
     """Get translation service instance."""
-    if not hasattr(request.app.state, 'translation_service'):
-        raise HTTPException(status_code=503, detail="Translation service not initialized")
-    return request.app.state.translation_service
+    return _get_service(request, "translation", "Translation")
 
 
-def get_phonetic_service(request: Request) -> PhoneticService:
+async def get_phonetic_service(request: Request) -> PhoneticService:
     """Get phonetic service instance."""
-    if not hasattr(request.app.state, 'phonetic_service'):
-        raise HTTPException(status_code=503, detail="Phonetic service not initialized")
-    return request.app.state.phonetic_service
+    return _get_service(request, "phonetic", "Phonetic")
 
 
-def get_highlight_service(request: Request) -> HighlightService:
+async def get_highlight_service(request: Request) -> HighlightService:
     """Get highlight service instance."""
-    if not hasattr(request.app.state, 'highlight_service'):
-        raise HTTPException(status_code=503, detail="Highlight service not initialized")
-    return request.app.state.highlight_service
+    return _get_service(request, "highlight", "Highlight")
+
+
+async def get_enhance_service(request: Request) -> EnhanceService:
+    """Get enhance service instance."""
+    return _get_service(request, "enhance", "Enhance")
 
 
-def get_expression_service(request: Request) -> ExpressionService:
+async def get_expression_service(request: Request) -> ExpressionService:
     """Get expression service instance."""
-    if not hasattr(request.app.state, 'expression_service'):
-        raise HTTPException(status_code=503, detail="Expression service not initialized")
-    return request.app.state.expression_service
+    return _get_service(request, "expression", "Expression")
 
 
-def get_transcript_service(request: Request) -> TranscriptService:
+async def get_transcript_service(request: Request) -> TranscriptService:
     """Get transcript service instance."""
-    if not hasattr(request.app.state, 'transcript_service'):
-        raise HTTPException(status_code=503, detail="Transcript service not initialized")
-    return request.app.state.transcript_service
+    return _get_service(request, "transcript", "Transcript")
 
 
-def get_episode_service(request: Request) -> EpisodeService:
+async def get_episode_service(request: Request) -> EpisodeService:
     """Get episode service instance."""
-    if not hasattr(request.app.state, 'episode_service'):
-        raise HTTPException(status_code=503, detail="Episode service not initialized")
-    return request.app.state.episode_service
+    return _get_service(request, "episode", "Episode")
 
 
-def get_mongodb_service(request: Request) -> MongoDBService:
+async def get_mongodb_service(request: Request) -> MongoDBService:
     """Get MongoDB service instance."""
-    if not hasattr(request.app.state, 'mongodb_service') or request.app.state.mongodb_service is None:
-        raise HTTPException(status_code=503, detail="MongoDB service not initialized")
-    return request.app.state.mongodb_service
+    return _get_service(request, "mongodb", "MongoDB")
+
+
+# ===== Background Tasks =====
+
+def save_episode_in_background(
+    episode_svc: EpisodeService,
+    episode_id: int,
+    sentences: list[EnhancedSentence] | list[dict],
+    metadata: dict
+) -> None:
+    """
+    Save generated sentences to the episode file.
+
+    Runs as a background task after the response has been sent; failures
+    are logged and never affect the request. Sentences already dumped to
+    dicts (e.g. while streaming) are saved as-is instead of dumped again.
+    """
+    try:
+        if sentences and isinstance(sentences[0], dict):
+            sentences_data = sentences
+        else:
+            # Convert EnhancedSentence objects to dictionaries in one pass
+            sentences_data = ENHANCED_SENTENCES_ADAPTER.dump_python(sentences, mode="python")
+
+        # Save to episode file
+        save_result = episode_svc.save_episode(
+            episode_id=episode_id,
+            sentences=sentences_data,
+            metadata=metadata
+        )
+        logger.info(f"💾 Saved episode {episode_id} to {save_result['file_path']}")
+    except Exception as e:
+        logger.error(f"Failed to save episode {episode_id}: {e}")
+
+
+# ===== Response Helpers =====
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match covers the given ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    client_tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in client_tags or "*" in client_tags
+
+
+def json_response_with_etag(
+    request: Request,
+    payload: dict | bytes,
+    max_age: int,
+    etag: Optional[str] = None
+) -> Response:
+    """
+    Encode a payload once with orjson and answer conditional requests.
+
+    Without a precomputed etag, the ETag is a BLAKE2b digest of the encoded
+    body, so an unchanged document yields the same tag across workers and
+    restarts. With one, a matching If-None-Match returns 304 before encoding.
+
+    Args:
+        request: Incoming request (for If-None-Match)
+        payload: JSON-serializable response body, or an already encoded one
+        max_age: Seconds clients may reuse the response without revalidating
+        etag: Optional quoted ETag known to identify this payload's version
+
+    Returns:
+        304 response if the client's ETag matches, otherwise the JSON response
+    """
+    if etag is not None and etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": f"private, max-age={max_age}"})
+
+    body = payload if isinstance(payload, bytes) else orjson.dumps(payload, default=str)
+    if etag is None:
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": f"private, max-age={max_age}"}
+
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# ===== Paragraph Helpers =====
+
+def build_paragraph_sentence(
+    idx: int,
+    sentence_text: str,
+    enhancement: dict,
+    text_hash: str,
+    episode_id: Optional[int]
+) -> EnhancedSentence:
+    """
+    Build the EnhancedSentence for one paragraph sentence.
+
+    Args:
+        idx: 0-based position in the paragraph
+        sentence_text: English sentence
+        enhancement: EnhanceService result (zh, phonetic_us, highlights)
+        text_hash: hash_text(sentence_text, length=32)
+        episode_id: Episode ID from the request
+
+    Returns:
+        EnhancedSentence (empty translation and highlights if the translation failed)
+    """
+    if not enhancement['zh']:
+        # Keep the sentence's identity and any phonetic that did succeed
+        return EnhancedSentence(
+            episode_id=episode_id,
+            episode_sequence=idx + 1,
+            en=sentence_text,
+            zh="",
+            phonetic_us=enhancement['phonetic_us'] or "",
+            highlight_entries=[],
+            sentence_hash=text_hash[:16]
+        )
+
+    # Fields come from validated service output: build without re-validation,
+    # only the LLM-provided highlights go through the (batched) validator
+    return EnhancedSentence.model_construct(
+        sentence_id=None,
+        episode_id=episode_id,
+        episode_sequence=idx + 1,
+        en=sentence_text,
+        zh=enhancement['zh'],
+        phonetic_us=enhancement['phonetic_us'],
+        highlight_entries=HIGHLIGHT_ENTRIES_ADAPTER.validate_python(enhancement['highlights']),
+        start_ts=None,
+        end_ts=None,
+        duration=None,
+        # Sentence hash: first 16 hex chars of the same MD5
+        sentence_hash=text_hash[:16]
+    )
+
+
+def ensure_paragraph_size(request: Request, sentences: list[str]) -> None:
+    """
+    Reject paragraphs with more sentences than settings.paragraph_max_sentences.
+
+    Raises:
+        HTTPException: 413 if the paragraph is too large
+    """
+    max_sentences = request.app.state.settings.paragraph_max_sentences
+    if len(sentences) > max_sentences:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Too many sentences ({len(sentences)} > {max_sentences}); split into multiple requests"
+        )
+
+
+async def paragraph_sentences(body: ParagraphGenerateSentencesRequest, request: Request) -> list[str]:
+    """
+    Split the paragraph of a paragraph request into sentences.
+
+    Runs as a dependency, i.e. before the rate limiter: oversize paragraphs
+    are rejected with 413 without being charged, and paragraph_request_cost
+    can charge the sentence count.
+
+    Raises:
+        HTTPException: 413 if the text or sentence count is too large, 500 if splitting fails
+    """
+    max_chars = request.app.state.settings.paragraph_max_chars
+    if len(body.text) > max_chars:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Paragraph too long ({len(body.text)} > {max_chars} characters); split into multiple requests"
+        )
+
+    try:
+        sentences = await split_into_sentences_async(body.text, body.split_by)
+    except Exception as e:
+        logger.error(f"Sentence splitting failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+    logger.info(f"Split into {len(sentences)} sentences")
+    ensure_paragraph_size(request, sentences)
+    request.state.paragraph_sentences = sentences
+    return sentences
+
+
+def paragraph_episode_metadata(body: ParagraphGenerateSentencesRequest) -> dict:
+    """Metadata stored with episodes generated from a paragraph."""
+    return {
+        "source": "paragraph_generation",
+        "original_text": body.text[:100] + "..." if len(body.text) > 100 else body.text,
+        "split_by": body.split_by
+    }
 
 
 # ===== Endpoints =====
@@ -219,12 +575,15 @@ async def root():
         "status": "running",
         "endpoints": {
             "paragraph_generate_sentences": "POST /api/paragraph/generate-sentences",
+            "paragraph_generate_sentences_stream": "POST /api/paragraph/generate-sentences/stream",
             "sentence_enhance": "POST /api/sentence/enhance",
             "sentence_audio_generate": "POST /api/sentence/generate-audio",
             "phrase_audio_generate": "POST /api/phrase/generate-audio",
             "expression_generate": "POST /api/expression/generate",
             "video_transcript": "POST /api/video/transcript",
             "episode_read_from_db": "GET /api/episode/db/{episode_id}",
+            "episode_batch_read_from_db": "POST /api/episode/db/batch-get",
+            "metrics": "GET /metrics",
         }
     }
 
@@ -232,32 +591,59 @@ async def root():
 @app.get("/health", tags=["system"])
 async def health_check(request: Request):
     """Health check endpoint."""
+    services = request.app.state.services if request.app.state.services_ready else {}
     return {
         "status": "healthy",
         "services": {
-            "translation": "initialized" if hasattr(request.app.state, 'translation_service') else "not initialized",
-            "phonetic": "initialized" if hasattr(request.app.state, 'phonetic_service') else "not initialized",
-            "highlight": "initialized" if hasattr(request.app.state, 'highlight_service') else "not initialized",
-            "expression": "initialized" if hasattr(request.app.state, 'expression_service') else "not initialized",
-            "transcript": "initialized" if hasattr(request.app.state, 'transcript_service') else "not initialized",
-            "episode": "initialized" if hasattr(request.app.state, 'episode_service') else "not initialized",
-            "mongodb": "initialized" if hasattr(request.app.state, 'mongodb_service') and request.app.state.mongodb_service else "not initialized",
+            name: "initialized" if services.get(name) is not None else "not initialized"
+            for name in SERVICE_NAMES
         }
     }
 
 
+@app.get("/metrics", tags=["system"])
+async def metrics(request: Request):
+    """Per-process cache statistics and Edge TTS concurrency, for tuning."""
+    services = request.app.state.services if request.app.state.services_ready else {}
+    caches = {}
+    for name, service in services.items():
+        cache = getattr(service, "cache", None)
+        if isinstance(cache, LRUCache):
+            caches[name] = {
+                "size": len(cache),
+                "maxsize": cache.maxsize,
+                "hits": cache.hits,
+                "misses": cache.misses,
+            }
+
+    tts_limiter = request.app.state.tts_limiter
+    tts = {
+        "limit": tts_limiter.limit,
+        "max_limit": tts_limiter.max_limit,
+        "in_flight": tts_limiter.in_flight,
+    } if tts_limiter is not None else None
+
+    return {"caches": caches, "tts_concurrency": tts}
+
+
 @app.post(
     "/api/paragraph/generate-sentences",
-    response_model=ParagraphGenerateSentencesResponse,
-    responses={400: {"model": ErrorResponse}, 500: {"model": ErrorResponse}},
+    responses={
+        200: {"model": ParagraphGenerateSentencesResponse},
+        400: {"model": ErrorResponse},
+        413: {"model": ErrorResponse},
+        429: {"model": ErrorResponse},
+        500: {"model": ErrorResponse}
+    },
     tags=["paragraph"]
 )
+@limiter.limit(PARAGRAPH_RATE_LIMIT, cost=paragraph_request_cost)
 async def generate_sentences_from_paragraph(
     body: ParagraphGenerateSentencesRequest,
     request: Request,
-    trans_svc: TranslationService = Depends(get_translation_service),
-    phonetic_svc: PhoneticService = Depends(get_phonetic_service),
-    highlight_svc: HighlightService = Depends(get_highlight_service),
+    background_tasks: BackgroundTasks,
+    sentences: list[str] = Depends(paragraph_sentences),
+    enhance_svc: EnhanceService = Depends(get_enhance_service),
     episode_svc: EpisodeService = Depends(get_episode_service)
 ):
     """
@@ -265,99 +651,119 @@ async def generate_sentences_from_paragraph(
 
     - Splits paragraph into individual sentences
     - For each sentence: generates translation, phonetic, and highlights
-    - Processes in parallel for better performance
+    - Batches sentences into a few DeepSeek requests processed in parallel
+    - Saves the episode file in the background after responding (if episode_id is set)
+    - Rejects paragraphs over settings.paragraph_max_chars characters or
+      settings.paragraph_max_sentences sentences (413, not charged); rate limited
+      per client IP, charged per sentence (429)
     """
     try:
         logger.info(f"Generating sentences from paragraph: {body.text[:50]}...")
 
-        # Split paragraph into sentences
-        sentences = split_into_sentences(body.text, body.split_by)
-        logger.info(f"Split into {len(sentences)} sentences")
-
         if not sentences:
-            return ParagraphGenerateSentencesResponse(sentences=[])
+            return ORJSONResponse({"sentences": []})
 
-        # Process sentences in parallel
-        def process_sentence(idx: int, sentence_text: str) -> EnhancedSentence:
-            """Process a single sentence."""
-            try:
-                # Get translation
-                zh = trans_svc.translate(sentence_text)
-
-                # Get phonetic
-                phonetic_us = phonetic_svc.get_phonetic(sentence_text)
-
-                # Get highlights
-                highlight_data = highlight_svc.extract_highlights(sentence_text, zh)
-                highlights = [HighlightEntry(**h) for h in highlight_data]
-
-                # Generate sentence hash
-                sentence_hash = hashlib.md5(sentence_text.encode()).hexdigest()[:16]
-
-                return EnhancedSentence(
-                    sentence_id=None,
-                    episode_id=body.episode_id,
-                    episode_sequence=idx + 1,
-                    en=sentence_text,
-                    zh=zh,
-                    phonetic_us=phonetic_us,
-                    highlight_entries=highlights,
-                    start_ts=None,
-                    end_ts=None,
-                    duration=None,
-                    sentence_hash=sentence_hash
-                )
-            except Exception as e:
-                logger.error(f"Failed to process sentence {idx + 1}: {e}")
-                return EnhancedSentence(
-                    episode_sequence=idx + 1,
-                    en=sentence_text,
-                    zh="",
-                    phonetic_us="",
-                    highlight_entries=[]
-                )
+        # Hash every sentence once: the cache key, and its prefix is the sentence_hash
+        hashes = [hash_text(sentence_text, length=32) for sentence_text in sentences]
 
-        # Parallel processing
-        settings = request.app.state.settings
-        with ThreadPoolExecutor(max_workers=settings.max_workers) as executor:
-            futures = [
-                executor.submit(process_sentence, idx, sent)
-                for idx, sent in enumerate(sentences)
-            ]
-            enhanced_sentences = [future.result() for future in futures]
+        # One DeepSeek request per batch of sentences (translation + phonetic + highlights),
+        # batches run concurrently; failed items fall back to per-sentence calls
+        enhancements = await enhance_svc.enhance_batch(sentences, keys=hashes)
+
+        enhanced_sentences = [
+            build_paragraph_sentence(idx, sentence_text, enhancement, text_hash, body.episode_id)
+            for idx, (sentence_text, enhancement, text_hash) in enumerate(zip(sentences, enhancements, hashes))
+        ]
 
         logger.info(f"✅ Generated {len(enhanced_sentences)} enhanced sentences")
 
-        # Save to episode file if episode_id is provided
+        # Dump once: the same dicts are the response body and the episode file content
+        sentences_data = ENHANCED_SENTENCES_ADAPTER.dump_python(enhanced_sentences, mode="python")
+
+        # Save to episode file if episode_id is provided (after the response is sent)
         if body.episode_id is not None:
-            try:
-                # Convert EnhancedSentence objects to dictionaries
-                sentences_data = [s.model_dump() for s in enhanced_sentences]
-
-                # Save to episode file
-                save_result = episode_svc.save_episode(
-                    episode_id=body.episode_id,
-                    sentences=sentences_data,
-                    metadata={
-                        "source": "paragraph_generation",
-                        "original_text": body.text[:100] + "..." if len(body.text) > 100 else body.text,
-                        "split_by": body.split_by
-                    }
-                )
-                logger.info(f"💾 Saved episode {body.episode_id} to {save_result['file_path']}")
-            except Exception as e:
-                # Don't fail the request if episode save fails, just log it
-                logger.error(f"Failed to save episode {body.episode_id}: {e}")
+            background_tasks.add_task(
+                save_episode_in_background,
+                episode_svc,
+                body.episode_id,
+                sentences_data,
+                paragraph_episode_metadata(body)
+            )
 
-        return ParagraphGenerateSentencesResponse(
-            sentences=enhanced_sentences,
-        )
+        # Already in ParagraphGenerateSentencesResponse shape: skip response_model re-validation
+        return ORJSONResponse({"sentences": sentences_data})
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Sentence generation failed: {e}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@app.post(
+    PARAGRAPH_STREAM_PATH,
+    responses={
+        200: {
+            "content": {"application/x-ndjson": {}},
+            "description": "One EnhancedSentence JSON object per line, in completion order"
+        },
+        413: {"model": ErrorResponse},
+        429: {"model": ErrorResponse},
+        500: {"model": ErrorResponse}
+    },
+    tags=["paragraph"]
+)
+@limiter.limit(PARAGRAPH_RATE_LIMIT, cost=paragraph_request_cost)
+async def stream_sentences_from_paragraph(
+    body: ParagraphGenerateSentencesRequest,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    sentences: list[str] = Depends(paragraph_sentences),
+    enhance_svc: EnhanceService = Depends(get_enhance_service),
+    episode_svc: EpisodeService = Depends(get_episode_service)
+):
+    """
+    Use Case 2 (streaming): same as /api/paragraph/generate-sentences, but
+    streams each enhanced sentence as NDJSON as soon as it is ready.
+
+    - Lines arrive in completion order (cached sentences first); use
+      `episode_sequence` to restore paragraph order
+    - Saves the episode file in the background after the stream ends (if episode_id is set)
+    """
+    logger.info(f"Streaming sentences from paragraph: {body.text[:50]}...")
+    hashes = [hash_text(sentence_text, length=32) for sentence_text in sentences]
+
+    # Dumped once per sentence: encoded for the stream and reused for the episode save
+    sentences_data: list[dict] = []
+    completed = False
+
+    async def generate_lines():
+        nonlocal completed
+        async for idx, enhancement in enhance_svc.enhance_stream(sentences, keys=hashes):
+            sentence = build_paragraph_sentence(idx, sentences[idx], enhancement, hashes[idx], body.episode_id)
+            sentence_data = sentence.model_dump()
+            sentences_data.append(sentence_data)
+            yield orjson.dumps(sentence_data) + b"\n"
+
+        # Episode file keeps paragraph order
+        sentences_data.sort(key=lambda sentence_data: sentence_data["episode_sequence"])
+        completed = True
+        logger.info(f"✅ Streamed {len(sentences_data)} enhanced sentences")
+
+    def save_streamed_episode() -> None:
+        # Background tasks also run after a client disconnect cancels the stream;
+        # a partial, unsorted list must not replace the episode file
+        if not completed:
+            logger.warning(f"Stream for episode {body.episode_id} did not complete; episode not saved")
+            return
+        save_episode_in_background(episode_svc, body.episode_id, sentences_data, paragraph_episode_metadata(body))
+
+    if body.episode_id is not None and sentences:
+        background_tasks.add_task(save_streamed_episode)
+
+    return StreamingResponse(generate_lines(), media_type="application/x-ndjson")
+
+
 @app.post(
     "/api/sentence/enhance",
     response_model=SentenceEnhanceResponse,
@@ -367,9 +773,7 @@ async def generate_sentences_from_paragraph(
 async def enhance_sentence(
     body: SentenceEnhanceRequest,
     request: Request,
-    trans_svc: TranslationService = Depends(get_translation_service),
-    phonetic_svc: PhoneticService = Depends(get_phonetic_service),
-    highlight_svc: HighlightService = Depends(get_highlight_service)
+    enhance_svc: EnhanceService = Depends(get_enhance_service)
 ):
     """
     Use Case 3: Enhance a single sentence with translation, phonetic, and highlights.
@@ -377,24 +781,20 @@ async def enhance_sentence(
     - Translates sentence to Chinese
     - Generates US phonetic transcription
     - Extracts highlight entries
+    - All three come from one combined Deepseek request (per-field requests as fallback)
     """
     try:
         logger.info(f"Enhancing sentence: {body.en[:50]}...")
 
-        # Get translation
-        zh = trans_svc.translate(body.en)
-
-        # Get phonetic
-        phonetic_us = phonetic_svc.get_phonetic(body.en)
-
-        # Get highlights
-        highlight_data = highlight_svc.extract_highlights(body.en, zh)
-        highlights = [HighlightEntry(**h) for h in highlight_data]
+        enhancement = await enhance_svc.enhance_one(body.en)
+        zh = enhancement['zh']
+        phonetic_us = enhancement['phonetic_us']
+        highlights = HIGHLIGHT_ENTRIES_ADAPTER.validate_python(enhancement['highlights'])
 
         # Generate sentence hash if not provided
         sentence_hash = body.sentence_hash
         if not sentence_hash:
-            sentence_hash = hashlib.md5(body.en.encode()).hexdigest()[:16]
+            sentence_hash = hash_text(body.en, length=16)
 
         # Calculate duration if not provided
         duration = body.duration
@@ -449,7 +849,8 @@ async def generate_expressions(
         logger.info(f"Generating expressions from {len(body.sentences)} sentences...")
 
         # Call expression service
-        expressions = expr_svc.generate_expressions(
+        expressions = await asyncio.to_thread(
+            expr_svc.generate_expressions,
             sentences=body.sentences,
             episode_id=body.episode_id,
             max_input_tokens=body.max_input_tokens,
@@ -511,7 +912,7 @@ async def get_video_transcript(
         logger.info(f"Fetching transcript for video: {video_id}")
 
         # Get transcript
-        transcript_data = trans_svc.get_transcript(video_id)
+        transcript_data = await asyncio.to_thread(trans_svc.get_transcript, video_id)
 
         logger.info(f"✅ Transcript fetched successfully for video {video_id}")
 
@@ -545,22 +946,32 @@ async def get_video_transcript(
     tags=["sentence"]
 )
 async def generate_sentence_audio(
-    body: SentenceAudioGenerateRequest
+    body: SentenceAudioGenerateRequest,
+    request: Request
 ):
     """
     Use Case 6: Generate audio files for sentences and upload to COS/R2.
 
     - Generates MP3 audio files for each sentence using Edge TTS (async)
-    - Uploads all audio files to both COS and R2 storage (async)
+    - Uploads each audio file to both COS and R2 as soon as it is generated (async)
+    - With check_existing, sentences already stored in both R2 and COS are skipped
+      (object keys ignore the voice, so only set it when the voice is unchanged)
     - Returns comprehensive upload statistics and results
 
     This endpoint uses async/await throughout for better performance and
     proper resource management. Audio generation uses edge-tts Python API
     directly (not CLI) with timeout, retry, and concurrency control.
     """
+    # Audio/storage stacks (edge-tts, storage clients) are only loaded once an audio endpoint is hit;
+    # later requests just read them from sys.modules
+    from utils.audio_generator import (
+        generate_batch_audio, check_edge_tts_available, AudioGenerationError, AdaptiveConcurrencyLimiter
+    )
+    from services.storage_service import upload_audio_stream
+    from utils.storage_check import check_audio_exists_bulk
+
     try:
-        from config import get_settings
-        settings = get_settings()
+        settings = request.app.state.settings
 
         logger.info(f"Generating audio for {len(body.sentences)} sentences...")
 
@@ -571,87 +982,152 @@ async def generate_sentence_audio(
                 detail="Edge TTS library is not installed. Please install edge-tts Python package."
             )
 
-        # Create output directory
+        # Output directory is created at startup
         audio_dir = Path(settings.audio_output_dir)
-        audio_dir.mkdir(parents=True, exist_ok=True)
 
-        # Generate audio files asynchronously with concurrency control
-        # This uses asyncio.gather internally for parallel processing
-        try:
-            processed_sentences = await generate_batch_audio(
-                sentences=body.sentences,
-                audio_dir=audio_dir,
-                voice=body.voice,
-                max_concurrent=min(body.max_workers, settings.max_concurrent_audio),
-                timeout_per_sentence=settings.audio_timeout_seconds
+        # One Edge TTS limiter per process: concurrent requests share the
+        # budget and the limit learned from throttling carries over
+        if request.app.state.tts_limiter is None:
+            request.app.state.tts_limiter = AdaptiveConcurrencyLimiter(
+                settings.max_concurrent_audio,
+                max_limit=settings.max_concurrent_audio_limit
             )
-        except AudioGenerationError as e:
-            logger.error(f"Audio generation error: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
 
-        # Collect audio files for upload
+        # Same hash/object key as generate_batch_audio
+        sentence_hashes = [
+            hash_text(sentence_text.strip(), length=8) if sentence_text.strip() else ''
+            for sentence_text in body.sentences
+        ]
+
+        # Audio already in both R2 and COS needs neither Edge TTS nor upload
+        stored_hashes: set[str] = set()
+        if body.check_existing:
+            object_keys = [f"audio/sentences/{h}.mp3" for h in sentence_hashes if h]
+            try:
+                found = await check_audio_exists_bulk(object_keys, settings=settings)
+                stored_hashes = {
+                    object_key[len("audio/sentences/"):-len(".mp3")]
+                    for object_key, (r2_exists, cos_exists) in found.items()
+                    if r2_exists and cos_exists
+                }
+                logger.info(f"☁️ {len(stored_hashes)} sentence audio files already in R2/COS")
+            except Exception as e:
+                logger.warning(f"Failed to check existing audio: {e}, will proceed with generation")
+
+        sentences_to_generate = [
+            sentence_text
+            for sentence_text, sentence_hash in zip(body.sentences, sentence_hashes)
+            if sentence_hash not in stored_hashes
+        ]
+
+        # Each finished audio file goes straight onto the upload queue, so
+        # COS/R2 uploads overlap with the remaining Edge TTS generation
         upload_files = []
-        for sentence in processed_sentences:
+        upload_queue: asyncio.Queue = asyncio.Queue()
+        uploader = asyncio.create_task(upload_audio_stream(
+            upload_queue,
+            upload_to_cos=True,
+            upload_to_r2=True,
+            max_concurrent_r2=10,
+            max_workers_cos=body.max_workers,
+            settings=settings
+        ))
+
+        async def queue_upload(sentence: dict) -> None:
+            """Queue a generated audio file for upload."""
             if sentence.get('audio_generated') and sentence.get('audio_path'):
                 audio_path = sentence['audio_path']
                 sentence_hash = sentence['sentence_hash']
                 if Path(audio_path).exists():
                     object_key = f"audio/sentences/{sentence_hash}.mp3"
-                    upload_files.append({
+                    file_info = {
                         'file_path': audio_path,
                         'object_key': object_key,
                         'sentence_hash': sentence_hash
-                    })
-
-        logger.info(f"📁 Collected {len(upload_files)} audio files for upload")
+                    }
+                    upload_files.append(file_info)
+                    await upload_queue.put(file_info)
 
-        # Upload to both COS and R2 concurrently (async)
-        cos_upload_results, r2_upload_results, cos_stats, r2_stats = await upload_audio_files(
-            upload_files=upload_files,
-            upload_to_cos=True,
-            upload_to_r2=True,
-            max_concurrent_r2=10,
-            max_workers_cos=body.max_workers,
-            settings=settings
-        )
+        # Generate audio files asynchronously with concurrency control
+        # This uses asyncio.gather internally for parallel processing
+        try:
+            generated_sentences = await generate_batch_audio(
+                sentences=sentences_to_generate,
+                audio_dir=audio_dir,
+                voice=body.voice,
+                max_concurrent=body.max_workers,
+                limiter=request.app.state.tts_limiter,
+                timeout_per_sentence=settings.audio_timeout_seconds,
+                on_result=queue_upload
+            )
+        except AudioGenerationError as e:
+            logger.error(f"Audio generation error: {e}")
+            uploader.cancel()
+            raise HTTPException(status_code=500, detail=str(e))
+        except BaseException:
+            uploader.cancel()
+            raise
 
-        # Build upload results map
-        cos_upload_map = {r.get('object_key'): r for r in cos_upload_results}
-        r2_upload_map = {r.get('object_key'): r for r in r2_upload_results}
+        logger.info(f"📁 Collected {len(upload_files)} audio files for upload")
 
-        # Build final results
+        # Merge stored sentences back in, in request order
+        generated_iter = iter(generated_sentences)
+        processed_sentences = [
+            {
+                'en': sentence_text.strip(),
+                'sentence_hash': sentence_hash,
+                'audio_path': None,
+                'audio_generated': True,
+                'existed': True,
+                'stored': True
+            } if sentence_hash in stored_hashes else next(generated_iter)
+            for sentence_text, sentence_hash in zip(body.sentences, sentence_hashes)
+        ]
+
+        # Wait for the uploads still in flight
+        await upload_queue.put(None)
+        cos_upload_results, r2_upload_results, cos_stats, r2_stats = await uploader
+
+        # Object keys that uploaded successfully (one set membership test per sentence)
+        cos_success = {r.get('object_key') for r in cos_upload_results if r.get('success')}
+        r2_success = {r.get('object_key') for r in r2_upload_results if r.get('success')}
+
+        # Build final results and statistics in one pass
         results = []
+        audio_generated = 0
+        already_existed = 0
         for sentence in processed_sentences:
             sentence_hash = sentence.get('sentence_hash', '')
             object_key = f"audio/sentences/{sentence_hash}.mp3" if sentence_hash else None
+            generated = sentence.get('audio_generated', False)
+            audio_generated += bool(generated)
+            already_existed += bool(sentence.get('existed', False))
+            stored = sentence.get('stored', False)
 
-            cos_result = cos_upload_map.get(object_key, {}) if object_key else {}
-            r2_result = r2_upload_map.get(object_key, {}) if object_key else {}
-
-            # Construct URLs for uploaded files
-            cos_url = settings.get_cos_url(object_key) if object_key and cos_result.get('success') else None
-            r2_url = settings.get_r2_url(object_key) if object_key and r2_result.get('success') else None
-            local_path = sentence.get('audio_path')
+            uploaded_cos = object_key in cos_success
+            uploaded_r2 = object_key in r2_success
+            in_cos = uploaded_cos or stored
+            in_r2 = uploaded_r2 or stored
 
             results.append(SentenceAudioResult(
                 sentence_hash=sentence_hash,
                 en=sentence.get('en', ''),
-                audio_generated=sentence.get('audio_generated', False),
-                uploaded_cos=cos_result.get('success', False),
-                uploaded_r2=r2_result.get('success', False),
-                cos_object_key=object_key if cos_result.get('success') else None,
-                r2_object_key=object_key if r2_result.get('success') else None,
-                cos_url=cos_url,
-                r2_url=r2_url,
-                local_file_path=local_path,
+                audio_generated=generated,
+                uploaded_cos=uploaded_cos,
+                uploaded_r2=uploaded_r2,
+                cos_object_key=object_key if in_cos else None,
+                r2_object_key=object_key if in_r2 else None,
+                # Construct URLs for uploaded (or already stored) files
+                cos_url=settings.get_cos_url(object_key) if in_cos else None,
+                r2_url=settings.get_r2_url(object_key) if in_r2 else None,
+                local_file_path=sentence.get('audio_path'),
                 error=sentence.get('error')
             ))
 
         # Overall statistics
         total_sentences = len(processed_sentences)
-        audio_generated = sum(1 for s in processed_sentences if s.get('audio_generated', False))
-        newly_generated = sum(1 for s in processed_sentences if s.get('audio_generated', False) and not s.get('existed', False))
-        already_existed = sum(1 for s in processed_sentences if s.get('existed', False))
+        # 'existed' results are always generated, so new = generated - existed
+        newly_generated = audio_generated - already_existed
 
         statistics = {
             'total_sentences': total_sentences,
@@ -660,7 +1136,8 @@ async def generate_sentence_audio(
             'audio_success_rate': audio_generated / total_sentences if total_sentences > 0 else 0.0,
             'files_collected_for_upload': len(upload_files),
             'newly_generated': newly_generated,
-            'already_existed': already_existed
+            'already_existed': already_existed,
+            'already_in_storage': sum(1 for h in sentence_hashes if h in stored_hashes)
         }
 
         logger.info(
@@ -723,6 +1200,11 @@ async def generate_phrase_audio(
     }
     ```
     """
+    # Audio/storage stacks (edge-tts, storage clients) are only loaded once an audio endpoint is hit;
+    # later requests just read them from sys.modules
+    from utils.audio_generator import check_edge_tts_available
+    from utils.phrase_audio_generator import generate_and_upload_phrase_audio
+
     try:
         logger.info(f"Generating phrase audio: {body.phrase}")
 
@@ -776,15 +1258,70 @@ async def generate_phrase_audio(
 
 # ===== Episode Management Endpoints (MongoDB) =====
 
+@app.post(
+    "/api/episode/db/batch-get",
+    responses={
+        200: {"model": MongoDBEpisodeBatchResponse},
+        503: {"model": ErrorResponse},
+        500: {"model": ErrorResponse}
+    },
+    tags=["episode"]
+)
+async def batch_read_episodes_from_mongodb(
+    body: MongoDBEpisodeBatchRequest,
+    mongo_svc: MongoDBService = Depends(get_mongodb_service)
+):
+    """
+    Read up to 500 episodes from MongoDB with a single `$in` query.
+
+    Episodes that don't exist are returned as null instead of failing the
+    whole request.
+
+    Raises:
+        503: MongoDB service not available
+        500: Internal server error
+    """
+    try:
+        logger.debug("Reading %s episodes from MongoDB...", len(body.episode_ids))
+
+        episodes = await mongo_svc.get_episodes_by_ids_async(body.episode_ids, body.fields)
+
+        # Trusted documents from MongoDBService: encode directly, no model pass
+        return Response(
+            content=orjson.dumps(
+                {"episodes": {str(episode_id): data for episode_id, data in episodes.items()}},
+                default=str
+            ),
+            media_type="application/json"
+        )
+
+    except MongoDBConnectionError as e:
+        logger.error("MongoDB connection error: %s", e)
+        raise HTTPException(status_code=503, detail=f"Database connection error: {str(e)}")
+
+    except MongoDBServiceError as e:
+        logger.error("MongoDB service error: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+    except Exception as e:
+        logger.error("Unexpected error reading episodes from MongoDB: %s", e)
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
 @app.get(
     "/api/episode/db/{episode_id}",
-    response_model=MongoDBEpisodeResponse,
-    responses={404: {"model": ErrorResponse}, 503: {"model": ErrorResponse}, 500: {"model": ErrorResponse}},
+    responses={
+        200: {"model": MongoDBEpisodeResponse},
+        404: {"model": ErrorResponse},
+        503: {"model": ErrorResponse},
+        500: {"model": ErrorResponse}
+    },
     tags=["episode"]
 )
 async def read_episode_from_mongodb(
     episode_id: int,
     request: Request,
+    fields: Optional[list[str]] = Query(None, description="Top-level fields to return (repeatable); default is all fields"),
     mongo_svc: MongoDBService = Depends(get_mongodb_service)
 ):
     """
@@ -792,12 +1329,15 @@ async def read_episode_from_mongodb(
 
     Queries the episodes collection in MongoDB and returns the complete episode document.
     This endpoint directly accesses the MongoDB database to retrieve the latest episode data.
+    Pass `fields` (e.g. `?fields=title&fields=sentences`) to fetch only those fields.
 
     Args:
         episode_id: The episode ID to query
+        fields: Optional top-level fields to project
 
     Returns:
-        Complete episode data from MongoDB including all fields
+        Episode data from MongoDB (all fields unless `fields` is given), with an
+        ETag header; a matching If-None-Match gets 304 Not Modified
 
     Raises:
         404: Episode not found in database
@@ -805,33 +1345,52 @@ async def read_episode_from_mongodb(
         500: Internal server error
     """
     try:
-        logger.info(f"Reading episode {episode_id} from MongoDB...")
+        logger.debug("Reading episode %s from MongoDB...", episode_id)
 
         # Get episode from MongoDB
-        episode_data = mongo_svc.get_episode_by_id(episode_id)
-
-        return MongoDBEpisodeResponse(
-            episode_id=episode_id,
-            data=episode_data
+        found = await mongo_svc.get_episode_json_with_version_or_none_async(episode_id, fields)
+        if found is None:
+            raise HTTPException(status_code=404, detail=f"Episode {episode_id} not found in database")
+        episode_json, version = found
+
+        # Trusted document from MongoDBService, already encoded once per loaded document:
+        # wrap the bytes in the response envelope instead of re-serializing (no model validation)
+        body = b'{"episode_id":' + str(episode_id).encode() + b',"data":' + episode_json + b'}'
+        return json_response_with_etag(
+            request,
+            body,
+            max_age=request.app.state.settings.episode_http_max_age_seconds,
+            etag=f'"{version}"'
         )
 
-    except EpisodeNotFoundInDBError as e:
-        logger.error(f"Episode not found in MongoDB: {e}")
-        raise HTTPException(status_code=404, detail=str(e))
+    except HTTPException:
+        raise
 
     except MongoDBConnectionError as e:
-        logger.error(f"MongoDB connection error: {e}")
+        logger.error("MongoDB connection error: %s", e)
         raise HTTPException(status_code=503, detail=f"Database connection error: {str(e)}")
 
     except MongoDBServiceError as e:
-        logger.error(f"MongoDB service error: {e}")
+        logger.error("MongoDB service error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
     except Exception as e:
-        logger.error(f"Unexpected error reading episode from MongoDB: {e}")
+        logger.error("Unexpected error reading episode from MongoDB: %s", e)
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
 if __name__ == "__main__":
+    import os
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+
+    # Each worker runs its own lifespan, so Mongo/HTTP clients are created after the fork.
+    # An import string is required for workers > 1.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8000")),
+        workers=int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1))),
+        # C-accelerated event loop and HTTP parser (both ship with uvicorn[standard])
+        loop="uvloop",
+        http="httptools"
+    )
@@ -5,7 +5,7 @@ Defines all data structures used in the Translation API endpoints.
 """
 
 from typing import Optional, Any, Union
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
 
 # ===== Shared Models =====
@@ -17,6 +17,10 @@ class HighlightEntry(BaseModel):
     translation_zh: str = Field(..., description="Chinese translation")
 
 
+# Validates a whole list of highlight dicts in one pydantic-core pass
+HIGHLIGHT_ENTRIES_ADAPTER = TypeAdapter(list[HighlightEntry])
+
+
 # ===== Use Case 1: Paragraph Translation + Highlights =====
 
 class ParagraphTranslateRequest(BaseModel):
@@ -64,6 +68,10 @@ class EnhancedSentence(BaseModel):
         return v
 
 
+# Serializes a whole list of sentences in one pydantic-core pass
+ENHANCED_SENTENCES_ADAPTER = TypeAdapter(list[EnhancedSentence])
+
+
 class ParagraphGenerateSentencesResponse(BaseModel):
     """Response model for paragraph sentence generation."""
     sentences: list[EnhancedSentence]
@@ -189,6 +197,20 @@ class ExpressionGenerateResponse(BaseModel):
     expressions: list[Expression]
 
 
+class MongoDBEpisodeBatchRequest(BaseModel):
+    """Request model for reading several MongoDB episodes at once."""
+    episode_ids: list[int] = Field(..., min_length=1, max_length=500, description="Episode IDs to read (max 500)")
+    fields: Optional[list[str]] = Field(None, description="Top-level fields to return; default is all fields")
+
+
+class MongoDBEpisodeBatchResponse(BaseModel):
+    """Response model for batch MongoDB episode retrieval."""
+    episodes: dict[int, Optional[dict[str, Any]]] = Field(
+        ...,
+        description="Episode data keyed by episode ID (null if not found)"
+    )
+
+
 # ===== Error Response Model =====
 
 # ===== Use Case 5: Video Transcript Generation =====
@@ -243,7 +265,21 @@ class SentenceAudioGenerateRequest(BaseModel):
     """Request model for generating audio files for sentences."""
     sentences: list[str] = Field(..., description="List of sentence texts to generate audio for")
     voice: str = Field("en-US-AvaMultilingualNeural", description="Edge TTS voice model to use")
-    max_workers: int = Field(4, description="Maximum parallel workers for audio generation")
+    max_workers: int = Field(
+        4,
+        description=(
+            "Maximum parallel workers for audio generation and COS uploads; Edge TTS calls are "
+            "further limited by the server's adaptive, process-wide concurrency limit"
+        )
+    )
+    check_existing: bool = Field(
+        False,
+        description=(
+            "Skip sentences whose audio already exists in both R2 and COS. Object keys depend only on "
+            "the text, so stored audio is reused whatever its voice; skipped sentences are returned "
+            "with uploaded_cos/uploaded_r2 false and no local_file_path"
+        )
+    )
 
 
 class SentenceAudioResult(BaseModel):
@@ -357,7 +393,13 @@ class PhraseAudioGenerateResponse(BaseModel):
 # ===== Use Case 9: MongoDB Episode Retrieval =====
 
 class MongoDBEpisodeResponse(BaseModel):
-    """Response model for MongoDB episode retrieval."""
+    """
+    Response model for MongoDB episode retrieval.
+
+    Documents the response schema only: the endpoint returns a raw Response
+    over the episode JSON that MongoDBService pre-encodes and caches (with
+    `_id` as a string and datetimes in ISO format), plus an ETag.
+    """
     episode_id: int = Field(..., description="Episode ID")
     data: dict[str, Any] = Field(..., description="Complete episode data from MongoDB")
 
@@ -6,8 +6,33 @@ It only handles API communication and does not contain business logic.
 """
 
 import logging
-from typing import List, Dict, Any
-from openai import OpenAI
+from typing import List, Dict, Any, Optional
+import httpx
+from openai import OpenAI, AsyncOpenAI
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Idle pooled connections stay open this long (httpx default is 5s), so
+# requests a few seconds apart reuse the TLS session instead of reconnecting
+KEEPALIVE_EXPIRY_SECONDS = 60.0
+
+# Completions are not streamed, so the read timeout must cover a whole batched
+# enhancement (up to 8000 output tokens); connecting still fails fast
+DEFAULT_TIMEOUT_SECONDS = 300.0
+CONNECT_TIMEOUT_SECONDS = 10.0
+
+
+def _pool_limits(max_connections: int) -> httpx.Limits:
+    """Connection pool limits shared by the sync and async clients."""
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS
+    )
 
 
 class DeepseekAPIError(Exception):
@@ -29,15 +54,30 @@ class DeepseekClient:
     - Business logic
     - Data validation
     - Complex response parsing
+
+    A single httpx.Client (thread-safe, HTTP/2 when ``h2`` is installed) is
+    shared by all worker threads. Create one instance per process and call
+    ``close()`` on shutdown.
     """
 
-    def __init__(self, api_key: str, base_url: str = "https://api.deepseek.com"):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.deepseek.com",
+        max_connections: int = 100,
+        http_client: Optional[httpx.Client] = None,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS
+    ):
         """
         Initialize the Deepseek API client.
 
         Args:
             api_key: Deepseek API key
             base_url: API base URL (default: https://api.deepseek.com)
+            max_connections: Connection pool size of the shared HTTP client (default: 100)
+            http_client: Optional pre-configured httpx.Client to use instead
+            timeout: Per-request timeout in seconds, covering the whole
+                non-streamed completion (default: 300)
 
         Raises:
             DeepseekAPIError: If API key is invalid or missing
@@ -47,6 +87,12 @@ class DeepseekClient:
 
         self.api_key = api_key
         self.base_url = base_url
+        self.timeout = httpx.Timeout(timeout, connect=CONNECT_TIMEOUT_SECONDS)
+        self.http_client = http_client or httpx.Client(
+            http2=HTTP2_AVAILABLE,
+            limits=_pool_limits(max_connections),
+            timeout=self.timeout
+        )
         self.client = self._create_client()
         self.logger = logging.getLogger(__name__)
 
@@ -55,7 +101,9 @@ class DeepseekClient:
         try:
             return OpenAI(
                 api_key=self.api_key,
-                base_url=self.base_url
+                base_url=self.base_url,
+                http_client=self.http_client,
+                timeout=self.timeout
             )
         except Exception as e:
             raise DeepseekAPIError(f"Failed to create API client: {e}")
@@ -65,7 +113,8 @@ class DeepseekClient:
         messages: List[Dict[str, str]],
         temperature: float = 0.1,
         max_tokens: int = 1000,
-        model: str = "deepseek-chat"
+        model: str = "deepseek-chat",
+        response_format: Optional[Dict[str, str]] = None
     ) -> str:
         """
         Send a chat completion request to Deepseek API.
@@ -75,6 +124,7 @@ class DeepseekClient:
             temperature: Sampling temperature (0.0 - 2.0)
             max_tokens: Maximum tokens in response
             model: Model name (default: deepseek-chat)
+            response_format: Optional response format, e.g. {"type": "json_object"}
 
         Returns:
             Raw response content string from API
@@ -83,12 +133,14 @@ class DeepseekClient:
             DeepseekAPIError: If API call fails
         """
         try:
+            extra = {'response_format': response_format} if response_format else {}
             response = self.client.chat.completions.create(
                 model=model,
                 messages=messages,
                 temperature=temperature,
                 max_tokens=max_tokens,
-                stream=False
+                stream=False,
+                **extra
             )
 
             content = response.choices[0].message.content
@@ -106,7 +158,8 @@ class DeepseekClient:
         system_prompt: str,
         user_prompt: str,
         temperature: float = 0.1,
-        max_tokens: int = 1000
+        max_tokens: int = 1000,
+        response_format: Optional[Dict[str, str]] = None
     ) -> str:
         """
         Simplified chat completion with system and user prompts.
@@ -116,6 +169,7 @@ class DeepseekClient:
             user_prompt: User message prompt
             temperature: Sampling temperature
             max_tokens: Maximum tokens in response
+            response_format: Optional response format, e.g. {"type": "json_object"}
 
         Returns:
             Raw response content string from API
@@ -131,5 +185,157 @@ class DeepseekClient:
         return self.chat_completion(
             messages=messages,
             temperature=temperature,
-            max_tokens=max_tokens
+            max_tokens=max_tokens,
+            response_format=response_format
+        )
+
+
+    def close(self) -> None:
+        """Close the shared HTTP connection pool."""
+        self.http_client.close()
+
+
+class AsyncDeepseekClient:
+    """
+    Async client for Deepseek API communication.
+
+    Same interface as DeepseekClient, but every request is awaited on the
+    event loop instead of blocking a thread. A single httpx.AsyncClient
+    (HTTP/2 when the ``h2`` package is installed) is shared by all requests,
+    so concurrent calls multiplex over one connection pool.
+
+    Create one instance per process and call ``aclose()`` on shutdown.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.deepseek.com",
+        max_connections: int = 100,
+        http_client: Optional[httpx.AsyncClient] = None,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS
+    ):
+        """
+        Initialize the async Deepseek API client.
+
+        Args:
+            api_key: Deepseek API key
+            base_url: API base URL (default: https://api.deepseek.com)
+            max_connections: Connection pool size of the shared HTTP client (default: 100)
+            http_client: Optional pre-configured httpx.AsyncClient to use instead
+            timeout: Per-request timeout in seconds, covering the whole
+                non-streamed completion (default: 300)
+
+        Raises:
+            DeepseekAPIError: If API key is invalid or missing
+        """
+        if not api_key or not api_key.strip():
+            raise DeepseekAPIError("API key is required and cannot be empty")
+
+        self.api_key = api_key
+        self.base_url = base_url
+        self.timeout = httpx.Timeout(timeout, connect=CONNECT_TIMEOUT_SECONDS)
+        self.http_client = http_client or httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=_pool_limits(max_connections),
+            timeout=self.timeout
+        )
+        self.client = self._create_client()
+        self.logger = logging.getLogger(__name__)
+
+    def _create_client(self) -> AsyncOpenAI:
+        """Create and configure the AsyncOpenAI client for Deepseek."""
+        try:
+            return AsyncOpenAI(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                http_client=self.http_client,
+                timeout=self.timeout
+            )
+        except Exception as e:
+            raise DeepseekAPIError(f"Failed to create API client: {e}")
+
+    async def chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.1,
+        max_tokens: int = 1000,
+        model: str = "deepseek-chat",
+        response_format: Optional[Dict[str, str]] = None
+    ) -> str:
+        """
+        Send a chat completion request to Deepseek API.
+
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            temperature: Sampling temperature (0.0 - 2.0)
+            max_tokens: Maximum tokens in response
+            model: Model name (default: deepseek-chat)
+            response_format: Optional response format, e.g. {"type": "json_object"}
+
+        Returns:
+            Raw response content string from API
+
+        Raises:
+            DeepseekAPIError: If API call fails
+        """
+        try:
+            extra = {'response_format': response_format} if response_format else {}
+            response = await self.client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=False,
+                **extra
+            )
+
+            content = response.choices[0].message.content
+            if content is None:
+                raise DeepseekAPIError("API returned empty response")
+
+            return content.strip()
+
+        except Exception as e:
+            self.logger.error(f"Deepseek API call failed: {e}")
+            raise DeepseekAPIError(f"API call failed: {e}")
+
+    async def simple_completion(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.1,
+        max_tokens: int = 1000,
+        response_format: Optional[Dict[str, str]] = None
+    ) -> str:
+        """
+        Simplified chat completion with system and user prompts.
+
+        Args:
+            system_prompt: System role prompt
+            user_prompt: User message prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens in response
+            response_format: Optional response format, e.g. {"type": "json_object"}
+
+        Returns:
+            Raw response content string from API
+
+        Raises:
+            DeepseekAPIError: If API call fails
+        """
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+
+        return await self.chat_completion(
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            response_format=response_format
         )
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP connection pool."""
+        await self.http_client.aclose()
@@ -0,0 +1,412 @@
+"""
+Enhance Service - Handles batched sentence enhancement logic.
+
+Business logic layer that produces translation, phonetic and highlights for
+many sentences with one Deepseek request per batch, instead of three
+requests per sentence.
+"""
+
+import asyncio
+import json
+import logging
+from typing import List, Dict, Any, Optional, AsyncIterator, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from utils.cache import LRUCache
+from utils.text_helpers import hash_text
+from .deepseek_client import AsyncDeepseekClient, DeepseekAPIError
+from .prompts import ENHANCE_BATCH_SYSTEM_PROMPT, get_enhance_batch_user_prompt
+from .translation_service import TranslationService
+from .phonetic_service import PhoneticService
+from .highlight_service import HighlightService
+from .microbatcher import MicroBatcher
+
+
+logger = logging.getLogger(__name__)
+
+
+class EnhanceService:
+    """
+    Service for enhancing sentences in batches.
+
+    Responsibilities:
+    - Split sentences into batches and send one JSON-mode request per batch
+    - Validate each item with the single-purpose services' validators
+    - Fall back to per-sentence calls for items the batch response got wrong
+    - Coalesce concurrent single-sentence calls from different requests
+    - Cache results by sentence hash (in-process, plus Redis when configured)
+    """
+
+    def __init__(
+        self,
+        async_client: AsyncDeepseekClient,
+        translation_service: TranslationService,
+        phonetic_service: PhoneticService,
+        highlight_service: HighlightService,
+        batch_size: int = 10,
+        batch_wait_ms: float = 20,
+        cache: Optional[LRUCache] = None,
+        redis_client: Optional[Any] = None,
+        redis_ttl: int = 2592000
+    ):
+        """
+        Initialize enhance service.
+
+        Args:
+            async_client: AsyncDeepseekClient instance for API calls
+            translation_service: Used for validation and per-sentence fallback
+            phonetic_service: Used for parsing and per-sentence fallback
+            highlight_service: Used for validation and per-sentence fallback
+            batch_size: Sentences per Deepseek request (default: 10)
+            batch_wait_ms: How long enhance_one waits to share a request with
+                other concurrent callers once start() was called (default: 20)
+            cache: Optional enhancement cache keyed by sentence hash (default: in-process LRU)
+            redis_client: Optional redis.asyncio client used as a second cache
+                tier shared by all workers
+            redis_ttl: Seconds before a Redis entry expires (default: 30 days)
+        """
+        self.async_client = async_client
+        self.translation_service = translation_service
+        self.phonetic_service = phonetic_service
+        self.highlight_service = highlight_service
+        self.batch_size = max(1, batch_size)
+        self.cache = cache if cache is not None else LRUCache()
+        self.redis_client = redis_client
+        self.redis_ttl = redis_ttl
+        self.logger = logger
+
+        # Coalesces concurrent enhance_one calls (across requests) into batch requests
+        self.batcher = MicroBatcher(self._request_batch, max_batch=self.batch_size, max_wait_ms=batch_wait_ms)
+
+    def start(self) -> None:
+        """Start cross-request batching for enhance_one (call inside the event loop)."""
+        self.batcher.start()
+
+    async def aclose(self) -> None:
+        """Stop cross-request batching."""
+        await self.batcher.aclose()
+
+    async def enhance_batch(
+        self,
+        texts: List[str],
+        keys: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Enhance sentences with translation, phonetic and highlights.
+
+        Collects enhance_stream: cached sentences skip Deepseek and repeated
+        sentences are requested once. Batches are requested concurrently.
+        Sentences missing from a batch response, or with an invalid
+        translation, are processed individually.
+
+        Args:
+            texts: English sentences
+            keys: Precomputed hash_text(text, length=32) per sentence, if the
+                caller already has them (default: computed here)
+
+        Returns:
+            One dictionary per input sentence, in input order, with keys:
+            - zh: Chinese translation
+            - phonetic_us: US IPA transcription with slashes
+            - highlights: List of validated highlight dictionaries
+            Sentences that fail entirely get empty values.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        async for idx, item in self.enhance_stream(texts, keys):
+            results[idx] = item
+        return results
+
+    async def enhance_stream(
+        self,
+        texts: List[str],
+        keys: Optional[List[str]] = None
+    ) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Enhance sentences and yield each result as soon as it is available.
+
+        Cached sentences are yielded first, then each batch's sentences as
+        that batch (including its per-sentence fallbacks) completes. Every
+        input index is yielded exactly once; sentences that fail entirely get
+        empty values.
+
+        Args:
+            texts: English sentences
+            keys: Precomputed hash_text(text, length=32) per sentence (default: computed here)
+
+        Yields:
+            Tuples of (input index, enhancement dictionary with zh, phonetic_us, highlights)
+        """
+        if not texts:
+            return
+
+        if keys is None:
+            keys = [hash_text(text, length=32) for text in texts]
+        key_by_text = dict(zip(texts, keys))
+
+        # Only sentences missing from the caches (deduplicated) go to Deepseek
+        positions: Dict[str, List[int]] = {}
+        for idx, item in enumerate(await self._get_cached_many(keys)):
+            if item is None:
+                positions.setdefault(texts[idx], []).append(idx)
+            else:
+                yield idx, item
+
+        pending = list(positions)
+        batches = [
+            pending[start:start + self.batch_size]
+            for start in range(0, len(pending), self.batch_size)
+        ]
+        tasks = [asyncio.ensure_future(self._enhance_uncached(batch, key_by_text)) for batch in batches]
+
+        empty = {'zh': '', 'phonetic_us': '', 'highlights': []}
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                for text, item in (await next_done).items():
+                    for idx in positions[text]:
+                        yield idx, item or empty
+        finally:
+            # Consumer stopped early (e.g. client disconnected): don't leave requests running
+            for task in tasks:
+                task.cancel()
+
+        self.logger.info(
+            f"✅ Enhanced {len(texts)} sentences ({len(texts) - sum(map(len, positions.values()))} cached) "
+            f"in {len(batches)} batch requests"
+        )
+
+    async def _enhance_uncached(
+        self,
+        texts: List[str],
+        key_by_text: Dict[str, str]
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Enhance one batch of uncached sentences and store the results.
+
+        Args:
+            texts: Distinct sentences of this batch
+            key_by_text: Cache key per sentence
+
+        Returns:
+            Enhancement per sentence, or None where even the fallback failed
+        """
+        fetched = dict(zip(texts, await self._request_batch(texts)))
+
+        # Fill gaps left by the batch response with individual requests
+        missing = [text for text, item in fetched.items() if item is None]
+        if missing:
+            self.logger.warning(f"Batch enhancement incomplete, falling back for {len(missing)} sentences")
+            fallbacks = await asyncio.gather(
+                *[self.enhance_single(text) for text in missing],
+                return_exceptions=True
+            )
+            for text, item in zip(missing, fallbacks):
+                if isinstance(item, Exception):
+                    self.logger.error(f"Failed to enhance sentence '{text[:50]}': {item}")
+                    item = None
+                fetched[text] = item
+
+        await self._store_many({key_by_text[text]: item for text, item in fetched.items() if item})
+        return fetched
+
+    async def enhance_one(self, text: str) -> Dict[str, Any]:
+        """
+        Enhance one sentence with a single combined Deepseek request.
+
+        Once start() was called, sentences submitted concurrently (e.g. by
+        parallel /sentence/enhance requests) share one batch request. Falls
+        back to the three single-purpose requests if the combined response
+        is unusable.
+
+        Args:
+            text: English sentence
+
+        Returns:
+            Dictionary with zh, phonetic_us and highlights
+
+        Raises:
+            DeepseekAPIError: If the fallback API calls fail
+        """
+        key = hash_text(text, length=32)
+        cached = (await self._get_cached_many([key]))[0]
+        if cached is not None:
+            return cached
+
+        result = await self.batcher.submit(text)
+        if result is None:
+            self.logger.warning("Combined enhancement unusable, falling back to per-field requests")
+            result = await self.enhance_single(text)
+
+        await self._store_many({key: result})
+        return result
+
+    async def _get_cached_many(self, keys: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Look up enhancements in the in-process cache, then in Redis.
+
+        Redis errors are logged and treated as misses.
+
+        Args:
+            keys: Sentence hashes
+
+        Returns:
+            Cached enhancement per key, or None on a miss
+        """
+        results = [self.cache.get(key) for key in keys]
+        missing = [idx for idx, item in enumerate(results) if item is None]
+        if not missing or self.redis_client is None:
+            return results
+
+        try:
+            raw_values = await self.redis_client.mget([f"enhance:{keys[idx]}" for idx in missing])
+        except Exception as e:
+            self.logger.warning(f"Redis read failed for enhancement cache: {e}")
+            return results
+
+        for idx, raw in zip(missing, raw_values):
+            if raw is None:
+                continue
+            item = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            self.cache.set(keys[idx], item)
+            results[idx] = item
+
+        return results
+
+    async def _store_many(self, items: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Store enhancements in the in-process cache and Redis.
+
+        Results without a translation are not cached. Redis errors are logged and ignored.
+
+        Args:
+            items: Enhancement per sentence hash
+        """
+        items = {key: item for key, item in items.items() if item.get('zh')}
+        if not items:
+            return
+
+        for key, item in items.items():
+            self.cache.set(key, item)
+
+        if self.redis_client is None:
+            return
+
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for key, item in items.items():
+                    raw = orjson.dumps(item) if orjson is not None else json.dumps(item, ensure_ascii=False)
+                    pipe.set(f"enhance:{key}", raw, ex=self.redis_ttl)
+                await pipe.execute()
+        except Exception as e:
+            self.logger.warning(f"Redis write failed for enhancement cache: {e}")
+
+    async def enhance_single(self, text: str) -> Dict[str, Any]:
+        """
+        Enhance one sentence with the single-purpose services.
+
+        Args:
+            text: English sentence
+
+        Returns:
+            Dictionary with zh, phonetic_us and highlights
+
+        Raises:
+            DeepseekAPIError: If any API call fails
+        """
+        zh, phonetic_us = await asyncio.gather(
+            self.translation_service.translate_async(text),
+            self.phonetic_service.get_phonetic_async(text)
+        )
+        highlights = await self.highlight_service.extract_highlights_async(text, zh)
+        return {'zh': zh, 'phonetic_us': phonetic_us, 'highlights': highlights}
+
+    async def _request_batch(self, texts: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Send one batch request and validate its items.
+
+        Args:
+            texts: Sentences of this batch
+
+        Returns:
+            Validated result per sentence, or None where the response was unusable
+        """
+        try:
+            raw_result = await self.async_client.simple_completion(
+                system_prompt=ENHANCE_BATCH_SYSTEM_PROMPT,
+                user_prompt=get_enhance_batch_user_prompt(texts),
+                temperature=0.1,
+                max_tokens=min(8000, 400 * len(texts) + 200),
+                response_format={'type': 'json_object'}
+            )
+        except DeepseekAPIError as e:
+            self.logger.error(f"Batch enhancement request failed ({len(texts)} sentences): {e}")
+            return [None] * len(texts)
+
+        items = self._parse_json_response(raw_result)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+
+        for position, item in enumerate(items):
+            if not isinstance(item, dict):
+                continue
+
+            # Prefer the model's explicit 1-based index; fall back to list position
+            idx = item.get('index')
+            idx = idx - 1 if isinstance(idx, int) and 1 <= idx <= len(texts) else position
+            if idx >= len(texts) or results[idx] is not None:
+                continue
+
+            results[idx] = self._validate_item(texts[idx], item)
+
+        return results
+
+    def _parse_json_response(self, response: str) -> List[Any]:
+        """
+        Parse the JSON object response from API.
+
+        Args:
+            response: Raw API response string
+
+        Returns:
+            List of raw result items (empty if the response is malformed)
+        """
+        try:
+            data = json.loads(response)
+        except json.JSONDecodeError as e:
+            self.logger.warning(f"Failed to parse batch enhancement JSON: {e}")
+            self.logger.debug(f"Raw response: {response}")
+            return []
+
+        items = data.get('results') if isinstance(data, dict) else data
+        if not isinstance(items, list):
+            self.logger.warning(f"Invalid batch enhancement format: {response[:100]}")
+            return []
+
+        return items
+
+    def _validate_item(self, text: str, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Validate one batch item with the same rules as the single-purpose services.
+
+        Args:
+            text: Source English sentence
+            item: Raw result item
+
+        Returns:
+            Validated result dictionary, or None if the translation is invalid
+        """
+        zh = str(item.get('zh') or '').strip()
+        if not zh or not self.translation_service.contains_chinese(zh):
+            return None
+
+        phonetic_us = self.phonetic_service.parse_phonetic_response(str(item.get('phonetic_us') or '').strip())
+
+        raw_highlights = item.get('highlights')
+        highlights = self.highlight_service.validate_highlights(
+            raw_highlights if isinstance(raw_highlights, list) else [],
+            zh
+        )
+
+        return {'zh': zh, 'phonetic_us': phonetic_us, 'highlights': highlights}
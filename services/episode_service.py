@@ -5,16 +5,62 @@ Manages episode JSON file storage with concurrent access control.
 Provides CRUD operations for episode data with file locking.
 """
 
-import json
 import logging
+import os
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List, Tuple
 from datetime import datetime
+import orjson
 from filelock import FileLock, Timeout
 
+from utils.cache import LRUCache
+
 logger = logging.getLogger(__name__)
 
 
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file; orjson reads the bytes without a separate decode step."""
+    return orjson.loads(path.read_bytes())
+
+
+def _write_json(path: Path, data: Any) -> bytes:
+    """
+    Atomically write data as indented UTF-8 JSON and return the bytes written.
+
+    Same layout as json.dumps(indent=2, ensure_ascii=False). The bytes go to
+    a temp file next to the target, are fsynced, then renamed over it, so a
+    crash mid-write leaves the previous file intact instead of a truncated
+    one. Callers hold the episode lock, so one temp name per file is enough.
+    """
+    encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    content = memoryview(encoded)
+    tmp_path = path.with_name(path.name + ".tmp")
+
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        while content:
+            written = os.write(fd, content)
+            content = content[written:]
+        os.fsync(fd)
+    except BaseException:
+        os.close(fd)
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.close(fd)
+
+    os.replace(tmp_path, path)
+    return encoded
+
+
+@lru_cache(maxsize=1024)
+def _episode_paths(storage_dir: Path, episode_id: int) -> Tuple[Path, Path]:
+    """Episode file and lock file paths, built once per episode."""
+    return storage_dir / f"EP{episode_id}.json", storage_dir / f"EP{episode_id}.lock"
+
+
 class EpisodeServiceError(Exception):
     """Base exception for episode service errors."""
     pass
@@ -33,24 +79,77 @@ class EpisodeLockError(EpisodeServiceError):
 class EpisodeService:
     """Service for managing episode JSON files with concurrent access control."""
 
-    def __init__(self, storage_dir: str = "data/episodes"):
+    def __init__(
+        self,
+        storage_dir: str = "data/episodes",
+        cache: Optional[LRUCache] = None,
+        use_file_lock: bool = True
+    ):
         """
         Initialize episode service.
 
         Args:
             storage_dir: Directory to store episode JSON files
+            cache: Optional cache of raw episode file bytes keyed by episode ID
+                (default: 256 entries); entries are checked against the file's
+                mtime and size, so changes made by other processes are seen
+            use_file_lock: Lock episodes with a cross-process FileLock (default).
+                Set to False only when a single process uses storage_dir: an
+                in-memory lock per episode then replaces the .lock files
         """
         self.storage_dir = Path(storage_dir)
+        self.cache = cache if cache is not None else LRUCache(maxsize=256)
+        self.use_file_lock = use_file_lock
+        self._locks: Dict[int, threading.Lock] = {}
+        # list_episodes summaries keyed by episode ID, with the (mtime_ns, size) they describe
+        self._summaries: Dict[int, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         logger.info(f"Episode storage initialized at: {self.storage_dir}")
 
+    @contextmanager
+    def _episode_lock(self, episode_id: int, lock_path: Path, timeout: float) -> Iterator[None]:
+        """
+        Hold the episode lock (FileLock or in-process lock, per use_file_lock).
+
+        Raises:
+            Timeout: If the lock cannot be acquired within timeout seconds
+        """
+        if self.use_file_lock:
+            with FileLock(lock_path, timeout=timeout):
+                yield
+            return
+
+        # dict.setdefault is atomic, so concurrent threads get the same lock
+        lock = self._locks.setdefault(episode_id, threading.Lock())
+        if not lock.acquire(timeout=timeout):
+            raise Timeout(str(lock_path))
+        try:
+            yield
+        finally:
+            lock.release()
+
+    def _read_locked(self, episode_id: int, episode_path: Path) -> bytes:
+        """
+        Read an episode file while holding its lock, reusing cached bytes if still current.
+
+        Raises:
+            FileNotFoundError: If the episode file does not exist
+        """
+        stat = episode_path.stat()
+        cached = self.cache.get(episode_id)
+        if cached is not None and cached[0] == (stat.st_mtime_ns, stat.st_size):
+            return cached[1]
+        return episode_path.read_bytes()
+
+    def _write_locked(self, episode_id: int, episode_path: Path, data: Any) -> None:
+        """Write an episode file while holding its lock and cache the new bytes."""
+        content = _write_json(episode_path, data)
+        stat = episode_path.stat()
+        self.cache.set(episode_id, ((stat.st_mtime_ns, stat.st_size), content))
+
     def _get_episode_path(self, episode_id: int) -> Path:
         """Get the file path for an episode."""
-        return self.storage_dir / f"EP{episode_id}.json"
-
-    def _get_lock_path(self, episode_id: int) -> Path:
-        """Get the lock file path for an episode."""
-        return self.storage_dir / f"EP{episode_id}.lock"
+        return _episode_paths(self.storage_dir, episode_id)[0]
 
     def save_episode(
         self,
@@ -74,34 +173,32 @@ class EpisodeService:
         Raises:
             EpisodeLockError: If lock cannot be acquired
         """
-        episode_path = self._get_episode_path(episode_id)
-        lock_path = self._get_lock_path(episode_id)
+        episode_path, lock_path = _episode_paths(self.storage_dir, episode_id)
 
+        # One timestamp: a new episode's created_at and updated_at are identical
+        now = datetime.utcnow().isoformat()
         episode_data = {
             "episode_id": episode_id,
             "sentences": sentences,
             "metadata": metadata or {},
-            "created_at": datetime.utcnow().isoformat(),
-            "updated_at": datetime.utcnow().isoformat(),
+            "created_at": now,
+            "updated_at": now,
             "version": 1
         }
 
         try:
-            with FileLock(lock_path, timeout=timeout):
+            with self._episode_lock(episode_id, lock_path, timeout):
                 # Check if file exists to preserve creation time
                 if episode_path.exists():
                     try:
-                        existing_data = json.loads(episode_path.read_text(encoding='utf-8'))
+                        existing_data = orjson.loads(self._read_locked(episode_id, episode_path))
                         episode_data["created_at"] = existing_data.get("created_at", episode_data["created_at"])
                         episode_data["version"] = existing_data.get("version", 0) + 1
-                    except (json.JSONDecodeError, KeyError):
+                    except (orjson.JSONDecodeError, KeyError):
                         logger.warning(f"Could not read existing episode {episode_id}, creating new")
 
                 # Write to file
-                episode_path.write_text(
-                    json.dumps(episode_data, ensure_ascii=False, indent=2),
-                    encoding='utf-8'
-                )
+                self._write_locked(episode_id, episode_path, episode_data)
 
                 logger.info(f"✅ Saved episode {episode_id} with {len(sentences)} sentences (version {episode_data['version']})")
 
@@ -116,38 +213,74 @@ class EpisodeService:
         except Timeout:
             raise EpisodeLockError(f"Could not acquire lock for episode {episode_id} within {timeout} seconds")
 
-    def read_episode(self, episode_id: int, timeout: int = 5) -> Dict[str, Any]:
+    def read_episode_bytes(self, episode_id: int, timeout: int = 5) -> bytes:
         """
-        Read episode data from JSON file.
+        Read the raw JSON bytes of an episode file.
+
+        Unchanged files (same mtime and size) are served from the cache
+        without taking the lock or reading the file, so callers can return
+        the bytes as a response body without parsing and re-serializing.
 
         Args:
             episode_id: Episode ID
             timeout: Lock acquisition timeout in seconds
 
         Returns:
-            Episode data dictionary
+            Episode file content (UTF-8 JSON)
 
         Raises:
             EpisodeNotFoundError: If episode file does not exist
             EpisodeLockError: If lock cannot be acquired
         """
-        episode_path = self._get_episode_path(episode_id)
-        lock_path = self._get_lock_path(episode_id)
+        episode_path, lock_path = _episode_paths(self.storage_dir, episode_id)
 
-        if not episode_path.exists():
+        try:
+            stat = episode_path.stat()
+        except FileNotFoundError:
             raise EpisodeNotFoundError(f"Episode {episode_id} not found")
 
-        try:
-            with FileLock(lock_path, timeout=timeout):
-                data = json.loads(episode_path.read_text(encoding='utf-8'))
-                logger.info(f"📖 Read episode {episode_id} (version {data.get('version', 'unknown')})")
-                return data
+        file_key = (stat.st_mtime_ns, stat.st_size)
+        cached = self.cache.get(episode_id)
+        if cached is not None and cached[0] == file_key:
+            return cached[1]
 
+        try:
+            with self._episode_lock(episode_id, lock_path, timeout):
+                stat = episode_path.stat()
+                content = episode_path.read_bytes()
         except Timeout:
             raise EpisodeLockError(f"Could not acquire lock for episode {episode_id} within {timeout} seconds")
-        except json.JSONDecodeError as e:
+        except FileNotFoundError:
+            raise EpisodeNotFoundError(f"Episode {episode_id} not found")
+
+        self.cache.set(episode_id, ((stat.st_mtime_ns, stat.st_size), content))
+        return content
+
+    def read_episode(self, episode_id: int, timeout: int = 5) -> Dict[str, Any]:
+        """
+        Read episode data from JSON file.
+
+        Args:
+            episode_id: Episode ID
+            timeout: Lock acquisition timeout in seconds
+
+        Returns:
+            Episode data dictionary
+
+        Raises:
+            EpisodeNotFoundError: If episode file does not exist
+            EpisodeLockError: If lock cannot be acquired
+        """
+        content = self.read_episode_bytes(episode_id, timeout)
+
+        try:
+            data = orjson.loads(content)
+        except orjson.JSONDecodeError as e:
             raise EpisodeServiceError(f"Invalid JSON in episode {episode_id}: {e}")
 
+        logger.info(f"📖 Read episode {episode_id} (version {data.get('version', 'unknown')})")
+        return data
+
     def update_episode(
         self,
         episode_id: int,
@@ -193,16 +326,15 @@ class EpisodeService:
             EpisodeNotFoundError: If episode does not exist
             IndexError: If sentence_index is out of range
         """
-        episode_path = self._get_episode_path(episode_id)
-        lock_path = self._get_lock_path(episode_id)
+        episode_path, lock_path = _episode_paths(self.storage_dir, episode_id)
 
         if not episode_path.exists():
             raise EpisodeNotFoundError(f"Episode {episode_id} not found")
 
         try:
-            with FileLock(lock_path, timeout=timeout):
-                # Read current data
-                episode_data = json.loads(episode_path.read_text(encoding='utf-8'))
+            with self._episode_lock(episode_id, lock_path, timeout):
+                # Read current data (unchanged files come from the byte cache)
+                episode_data = orjson.loads(self._read_locked(episode_id, episode_path))
 
                 # Validate index
                 if sentence_index < 0 or sentence_index >= len(episode_data["sentences"]):
@@ -213,11 +345,8 @@ class EpisodeService:
                 episode_data["updated_at"] = datetime.utcnow().isoformat()
                 episode_data["version"] = episode_data.get("version", 0) + 1
 
-                # Write back
-                episode_path.write_text(
-                    json.dumps(episode_data, ensure_ascii=False, indent=2),
-                    encoding='utf-8'
-                )
+                # Write back; the new bytes are cached for the next read or update
+                self._write_locked(episode_id, episode_path, episode_data)
 
                 logger.info(f"✅ Updated sentence {sentence_index} in episode {episode_id} (version {episode_data['version']})")
 
@@ -230,48 +359,73 @@ class EpisodeService:
 
         except Timeout:
             raise EpisodeLockError(f"Could not acquire lock for episode {episode_id} within {timeout} seconds")
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise EpisodeServiceError(f"Invalid JSON in episode {episode_id}: {e}")
 
     def list_episodes(self) -> List[Dict[str, Any]]:
         """
         List all available episode files.
 
+        Scans the directory once with os.scandir; summaries of files whose
+        mtime and size haven't changed since the last listing are reused, so
+        only new or modified episodes are parsed.
+
         Returns:
             List of episode information dictionaries
         """
         episodes = []
 
-        for episode_file in sorted(self.storage_dir.glob("EP*.json")):
+        with os.scandir(self.storage_dir) as entries:
+            episode_entries = sorted(
+                (entry for entry in entries if entry.name.startswith("EP") and entry.name.endswith(".json")),
+                key=lambda entry: entry.name
+            )
+
+        for entry in episode_entries:
             try:
                 # Extract episode ID from filename
-                episode_id = int(episode_file.stem[2:])  # Remove "EP" prefix
-
-                # Try to read basic info
-                try:
-                    data = json.loads(episode_file.read_text(encoding='utf-8'))
-                    episodes.append({
-                        "episode_id": episode_id,
-                        "file_name": episode_file.name,
-                        "sentence_count": len(data.get("sentences", [])),
-                        "version": data.get("version", 0),
-                        "created_at": data.get("created_at"),
-                        "updated_at": data.get("updated_at"),
-                        "file_size_bytes": episode_file.stat().st_size
-                    })
-                except (json.JSONDecodeError, KeyError) as e:
-                    logger.warning(f"Could not read episode {episode_id}: {e}")
-                    episodes.append({
-                        "episode_id": episode_id,
-                        "file_name": episode_file.name,
-                        "error": "Invalid JSON or missing data",
-                        "file_size_bytes": episode_file.stat().st_size
-                    })
-
+                episode_id = int(entry.name[2:-5])  # Remove "EP" prefix and ".json"
             except ValueError:
-                logger.warning(f"Skipping invalid episode file: {episode_file.name}")
+                logger.warning(f"Skipping invalid episode file: {entry.name}")
+                continue
+
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue  # Deleted since the scan
+
+            file_key = (stat.st_mtime_ns, stat.st_size)
+            cached = self._summaries.get(episode_id)
+            if cached is not None and cached[0] == file_key:
+                episodes.append(dict(cached[1]))
                 continue
 
+            # Try to read basic info
+            try:
+                data = _read_json(Path(entry.path))
+                summary = {
+                    "episode_id": episode_id,
+                    "file_name": entry.name,
+                    "sentence_count": len(data.get("sentences", [])),
+                    "version": data.get("version", 0),
+                    "created_at": data.get("created_at"),
+                    "updated_at": data.get("updated_at"),
+                    "file_size_bytes": stat.st_size
+                }
+            except (orjson.JSONDecodeError, KeyError) as e:
+                logger.warning(f"Could not read episode {episode_id}: {e}")
+                summary = {
+                    "episode_id": episode_id,
+                    "file_name": entry.name,
+                    "error": "Invalid JSON or missing data",
+                    "file_size_bytes": stat.st_size
+                }
+            except FileNotFoundError:
+                continue
+
+            self._summaries[episode_id] = (file_key, summary)
+            episodes.append(summary)
+
         logger.info(f"📋 Found {len(episodes)} episode files")
         return episodes
 
@@ -289,15 +443,16 @@ class EpisodeService:
         Raises:
             EpisodeNotFoundError: If episode does not exist
         """
-        episode_path = self._get_episode_path(episode_id)
-        lock_path = self._get_lock_path(episode_id)
+        episode_path, lock_path = _episode_paths(self.storage_dir, episode_id)
 
         if not episode_path.exists():
             raise EpisodeNotFoundError(f"Episode {episode_id} not found")
 
         try:
-            with FileLock(lock_path, timeout=timeout):
+            with self._episode_lock(episode_id, lock_path, timeout):
                 episode_path.unlink()
+                self.cache.pop(episode_id)
+                self._summaries.pop(episode_id, None)
                 logger.info(f"🗑️  Deleted episode {episode_id}")
 
                 # Clean up lock file if it exists
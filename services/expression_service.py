@@ -8,7 +8,8 @@ This is the most complex service with batch processing and deduplication.
 import json
 import re
 import logging
-from typing import List, Dict, Any
+import threading
+from typing import List, Dict, Any, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from bson import ObjectId
 
@@ -31,16 +32,24 @@ class ExpressionService:
     - Match expressions to sentences
     """
 
-    def __init__(self, client: DeepseekClient):
+    def __init__(self, client: DeepseekClient, executor: Optional[ThreadPoolExecutor] = None):
         """
         Initialize expression service.
 
         Args:
             client: DeepseekClient instance for API calls
+            executor: Long-lived pool for batch requests (default: own 16-thread pool).
+                Must not be the pool generate_expressions itself runs on, or
+                waiting on batches could starve it.
         """
         self.client = client
+        self.executor = executor or ThreadPoolExecutor(max_workers=16, thread_name_prefix="expression")
         self.logger = logger
 
+    def close(self) -> None:
+        """Shut down the batch executor."""
+        self.executor.shutdown(wait=True)
+
     def generate_expressions(
         self,
         sentences: List[Dict[str, Any]],
@@ -55,7 +64,7 @@ class ExpressionService:
             sentences: List of sentence dictionaries with 'en', 'zh', etc.
             episode_id: Episode ID for the expressions
             max_input_tokens: Maximum input tokens per batch (default: 2500)
-            max_workers: Maximum parallel workers (default: 4)
+            max_workers: Maximum batches of this call in flight at once (default: 4)
 
         Returns:
             List of expression dictionaries
@@ -75,27 +84,29 @@ class ExpressionService:
 
         all_expressions = []
 
-        # Process batches in parallel
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_batch = {}
-            for batch_idx, batch_sentences in enumerate(batches, 1):
-                future = executor.submit(
-                    self._process_batch_with_retry,
-                    batch_sentences,
-                    episode_id,
-                    batch_idx
-                )
-                future_to_batch[future] = batch_idx
-
-            # Collect results
-            for future in as_completed(future_to_batch):
-                batch_idx = future_to_batch[future]
-                try:
-                    batch_expressions = future.result()
-                    all_expressions.extend(batch_expressions)
-                    self.logger.info(f"✅ Batch {batch_idx}/{len(batches)}: {len(batch_expressions)} expressions")
-                except Exception as e:
-                    self.logger.error(f"❌ Batch {batch_idx}/{len(batches)} failed: {e}")
+        # Process batches in parallel on the long-lived pool, at most max_workers at a time
+        slots = threading.BoundedSemaphore(max(1, max_workers))
+        future_to_batch = {}
+        for batch_idx, batch_sentences in enumerate(batches, 1):
+            slots.acquire()
+            future = self.executor.submit(
+                self._process_batch_with_retry,
+                batch_sentences,
+                episode_id,
+                batch_idx
+            )
+            future.add_done_callback(lambda _: slots.release())
+            future_to_batch[future] = batch_idx
+
+        # Collect results
+        for future in as_completed(future_to_batch):
+            batch_idx = future_to_batch[future]
+            try:
+                batch_expressions = future.result()
+                all_expressions.extend(batch_expressions)
+                self.logger.info(f"✅ Batch {batch_idx}/{len(batches)}: {len(batch_expressions)} expressions")
+            except Exception as e:
+                self.logger.error(f"❌ Batch {batch_idx}/{len(batches)} failed: {e}")
 
         # Deduplicate and merge
         deduplicated = self._deduplicate_expressions(all_expressions)
@@ -4,11 +4,14 @@ Highlight Service - Handles highlight entry extraction logic.
 Business logic layer for extracting important words/phrases as highlights.
 """
 
+import asyncio
 import json
 import logging
-from typing import List, Dict, Any, Optional
-from .deepseek_client import DeepseekClient, DeepseekAPIError
+from typing import List, Dict, Any, Optional, Tuple
+from .deepseek_client import DeepseekClient, AsyncDeepseekClient, DeepseekAPIError
 from .prompts import get_highlight_system_prompt, get_highlight_user_prompt
+from utils.cache import LRUCache
+from utils.text_helpers import hash_text
 
 
 logger = logging.getLogger(__name__)
@@ -26,14 +29,23 @@ class HighlightService:
     - Filter invalid highlights
     """
 
-    def __init__(self, client: DeepseekClient):
+    def __init__(
+        self,
+        client: DeepseekClient,
+        async_client: Optional[AsyncDeepseekClient] = None,
+        cache: Optional[LRUCache] = None
+    ):
         """
         Initialize highlight service.
 
         Args:
             client: DeepseekClient instance for API calls
+            async_client: Optional AsyncDeepseekClient used by extract_highlights_async
+            cache: Optional highlight cache keyed by sentence + translation hash (default: in-process LRU)
         """
         self.client = client
+        self.async_client = async_client
+        self.cache = cache if cache is not None else LRUCache()
         self.logger = logger
 
     def extract_highlights(
@@ -57,47 +69,154 @@ class HighlightService:
         Raises:
             DeepseekAPIError: If highlight extraction fails
         """
-        # Input validation
-        if not text or not text.strip():
-            self.logger.warning("Empty text provided for highlight extraction")
+        text, translation, cache_key, cached = self._prepare(text, chinese_translation)
+        if not text:
             return []
-
-        text = text.strip()
-        has_translation = bool(chinese_translation and chinese_translation.strip())
+        if cached is not None:
+            return cached
 
         try:
             self.logger.debug(f"Extracting highlights from: {text[:50]}...")
+            raw_result = self.client.simple_completion(**self._request(text, translation))
+            return self._finish(text, raw_result, translation, cache_key)
+        except Exception as e:
+            raise self._api_error(text, e)
+
+    async def extract_highlights_async(
+        self,
+        text: str,
+        chinese_translation: Optional[str] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Extract highlight entries without blocking the event loop.
+
+        Uses the async client when available, otherwise runs
+        extract_highlights() in a worker thread.
+
+        Args:
+            text: English text to analyze
+            chinese_translation: Chinese translation of the text (optional)
 
-            # Get appropriate prompts
-            system_prompt = get_highlight_system_prompt(has_translation)
-            user_prompt = get_highlight_user_prompt(text, chinese_translation)
-
-            # Call API
-            raw_result = self.client.simple_completion(
-                system_prompt=system_prompt,
-                user_prompt=user_prompt,
-                temperature=0.3,
-                max_tokens=500
-            )
-
-            # Parse JSON response
-            highlights = self._parse_json_response(raw_result)
-
-            # Validate highlights
-            validated_highlights = self._validate_highlights(
-                highlights,
-                chinese_translation if has_translation else None
-            )
-
-            self.logger.info(f"✅ Extracted {len(validated_highlights)} highlights from: '{text[:30]}...'")
-            return validated_highlights
-
-        except DeepseekAPIError as e:
-            self.logger.error(f"Highlight extraction failed for text '{text[:30]}...': {e}")
-            raise
+        Returns:
+            List of highlight dictionaries (see extract_highlights)
+
+        Raises:
+            DeepseekAPIError: If highlight extraction fails
+        """
+        if self.async_client is None:
+            return await asyncio.to_thread(self.extract_highlights, text, chinese_translation)
+
+        text, translation, cache_key, cached = self._prepare(text, chinese_translation)
+        if not text:
+            return []
+        if cached is not None:
+            return cached
+
+        try:
+            self.logger.debug(f"Extracting highlights from: {text[:50]}...")
+            raw_result = await self.async_client.simple_completion(**self._request(text, translation))
+            return self._finish(text, raw_result, translation, cache_key)
         except Exception as e:
-            self.logger.error(f"Unexpected error during highlight extraction: {e}")
-            raise DeepseekAPIError(f"Highlight extraction failed: {e}")
+            raise self._api_error(text, e)
+
+    def _prepare(
+        self,
+        text: str,
+        chinese_translation: Optional[str]
+    ) -> Tuple[str, Optional[str], str, Optional[List[Dict[str, str]]]]:
+        """
+        Validate input and look it up in the cache.
+
+        Args:
+            text: English text to analyze
+            chinese_translation: Chinese translation of the text (optional)
+
+        Returns:
+            Tuple of (stripped text, translation or None if blank, cache key,
+            copy of the cached highlights or None); the text is empty if the
+            input was empty
+        """
+        if not text or not text.strip():
+            self.logger.warning("Empty text provided for highlight extraction")
+            return "", None, "", None
+
+        text = text.strip()
+        translation = chinese_translation if chinese_translation and chinese_translation.strip() else None
+
+        # Highlights depend on the translation, so it is part of the key
+        cache_key = hash_text(f"{text}\n{translation or ''}", length=32)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            self.logger.debug(f"Highlight cache hit: {text[:50]}...")
+            cached = [dict(h) for h in cached]
+        return text, translation, cache_key, cached
+
+    def _request(self, text: str, chinese_translation: Optional[str]) -> Dict[str, Any]:
+        """Completion arguments for a highlight request (same for both clients)."""
+        return {
+            "system_prompt": get_highlight_system_prompt(chinese_translation is not None),
+            "user_prompt": get_highlight_user_prompt(text, chinese_translation),
+            "temperature": 0.3,
+            "max_tokens": 500
+        }
+
+    def _finish(
+        self,
+        text: str,
+        raw_result: str,
+        chinese_translation: Optional[str],
+        cache_key: str
+    ) -> List[Dict[str, str]]:
+        """
+        Parse a raw API response and cache the highlights.
+
+        Args:
+            text: Source English text (for logging)
+            raw_result: Raw API response string
+            chinese_translation: Chinese translation for validation (optional)
+            cache_key: Cache key from _prepare
+
+        Returns:
+            List of validated highlight dictionaries
+        """
+        highlights = self._process_response(text, raw_result, chinese_translation)
+        if highlights:
+            self.cache.set(cache_key, [dict(h) for h in highlights])
+        return highlights
+
+    def _api_error(self, text: str, error: Exception) -> DeepseekAPIError:
+        """Log a failed highlight request and return the DeepseekAPIError to raise."""
+        if isinstance(error, DeepseekAPIError):
+            self.logger.error(f"Highlight extraction failed for text '{text[:30]}...': {error}")
+            return error
+        self.logger.error(f"Unexpected error during highlight extraction: {error}")
+        return DeepseekAPIError(f"Highlight extraction failed: {error}")
+
+    def _process_response(
+        self,
+        text: str,
+        raw_result: str,
+        chinese_translation: Optional[str] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Parse and validate a raw highlight API response.
+
+        Args:
+            text: Source English text (for logging)
+            raw_result: Raw API response string
+            chinese_translation: Chinese translation for validation (optional)
+
+        Returns:
+            List of validated highlight dictionaries
+        """
+        # Parse JSON response
+        highlights = self._parse_json_response(raw_result)
+
+        # Validate highlights
+        validated_highlights = self.validate_highlights(highlights, chinese_translation)
+
+        self.logger.info(f"✅ Extracted {len(validated_highlights)} highlights from: '{text[:30]}...'")
+        return validated_highlights
 
     def _parse_json_response(self, response: str) -> List[Dict[str, Any]]:
         """
@@ -126,7 +245,7 @@ class HighlightService:
             self.logger.debug(f"Raw response: {response}")
             return []
 
-    def _validate_highlights(
+    def validate_highlights(
         self,
         highlights: List[Dict[str, Any]],
         chinese_translation: Optional[str] = None
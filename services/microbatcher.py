@@ -0,0 +1,137 @@
+"""
+Micro-batcher - Coalesces concurrent single-item calls into batched calls.
+
+Requests arriving within a short window (or until the batch is full) are
+handed to one batch handler together, so concurrent callers share a single
+upstream request instead of issuing one each.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+class MicroBatcher:
+    """
+    Collect submitted items into batches and dispatch them to a handler.
+
+    The handler receives a list of items and must return one result per item,
+    in order. Each caller of submit() gets its own item's result (or the
+    handler's exception). Batches are dispatched as separate tasks, so a slow
+    upstream call doesn't delay collecting the next batch.
+
+    Until start() is called (or after aclose()), submit() calls the handler
+    directly with a one-item batch.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_batch: int = 16,
+        max_wait_ms: float = 20
+    ):
+        """
+        Initialize the micro-batcher.
+
+        Args:
+            handler: Coroutine function processing a batch of items
+            max_batch: Maximum items per batch (default: 16)
+            max_wait_ms: Longest time the first item of a batch waits for
+                company before dispatch (default: 20)
+        """
+        self.handler = handler
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max_wait_ms / 1000
+        self._queue: "asyncio.Queue[Tuple[Any, asyncio.Future]]" = asyncio.Queue()
+        self._collector: Optional[asyncio.Task] = None
+        self._dispatches: Set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        """Start the background collector task (must run inside the event loop)."""
+        if self._collector is None:
+            self._collector = asyncio.create_task(self._collect())
+
+    async def aclose(self) -> None:
+        """Stop collecting, wait for running batches and fail queued items."""
+        if self._collector is not None:
+            self._collector.cancel()
+            await asyncio.gather(self._collector, return_exceptions=True)
+            self._collector = None
+
+        if self._dispatches:
+            await asyncio.gather(*self._dispatches, return_exceptions=True)
+
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("MicroBatcher closed"))
+
+    async def submit(self, item: Any) -> Any:
+        """
+        Submit one item and wait for its result.
+
+        Args:
+            item: Item to process
+
+        Returns:
+            The handler's result for this item
+
+        Raises:
+            Whatever the handler raised for the batch containing this item
+        """
+        if self._collector is None:
+            return (await self.handler([item]))[0]
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _collect(self) -> None:
+        """Group queued items into batches until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            task = asyncio.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        """Run the handler for one batch and resolve each caller's future."""
+        # Skip items whose callers have gone away (cancelled requests)
+        batch = [(item, future) for item, future in batch if not future.done()]
+        if not batch:
+            return
+
+        try:
+            results = await self.handler([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(f"Batch handler returned {len(results)} results for {len(batch)} items")
+        except Exception as e:
+            logger.error(f"Batch of {len(batch)} items failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+        logger.debug("Dispatched batch of %s items", len(batch))
+
+
+__all__ = ['MicroBatcher']
@@ -4,11 +4,32 @@ MongoDB Service for Episode Management
 Provides database operations for episodes collection in MongoDB.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
-from typing import Optional, Dict, Any
+import time
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Tuple
+from bson import Decimal128, ObjectId
 from pymongo import MongoClient
 from pymongo.errors import ConnectionFailure, OperationFailure
 
+from utils.cache import LRUCache, SingleFlight
+from .microbatcher import MicroBatcher
+
+try:
+    from motor.motor_asyncio import AsyncIOMotorClient
+    MOTOR_AVAILABLE = True
+except ImportError:
+    AsyncIOMotorClient = None
+    MOTOR_AVAILABLE = False
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,19 +48,90 @@ class EpisodeNotFoundInDBError(MongoDBServiceError):
     pass
 
 
+def to_json_compatible(value: Any) -> Any:
+    """
+    Recursively convert BSON-specific types in a MongoDB document to JSON types.
+
+    ObjectId becomes its hex string and Decimal128 its exact decimal string;
+    datetimes are left alone since orjson encodes them natively.
+
+    Args:
+        value: Document, list or scalar from pymongo/motor
+
+    Returns:
+        The converted value (dicts and lists are rebuilt)
+    """
+    if isinstance(value, dict):
+        return {key: to_json_compatible(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [to_json_compatible(item) for item in value]
+    if isinstance(value, (ObjectId, Decimal128)):
+        return str(value)
+    return value
+
+
+def _json_default(value: Any) -> str:
+    """json.dumps fallback encoder: ISO 8601 datetimes like orjson, str() for anything else."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
 class MongoDBService:
     """Service for managing MongoDB operations."""
 
-    def __init__(self, mongodb_uri: str, mongodb_database_name: str = "dev_lingohow"):
+    def __init__(
+        self,
+        mongodb_uri: str,
+        mongodb_database_name: str = "dev_lingohow",
+        cache: Optional[LRUCache] = None,
+        redis_client: Optional[Any] = None,
+        redis_ttl: int = 300,
+        max_pool_size: int = 100,
+        min_pool_size: int = 10,
+        socket_timeout_ms: int = 5000,
+        batch_wait_ms: float = 2
+    ):
         """
         Initialize MongoDB service.
 
         Args:
             mongodb_uri: MongoDB connection string
             mongodb_database_name: Database name (default: "dev_lingohow")
+            cache: Optional cache for episode documents keyed by episode_id
+                (default: 10000 entries, expiring after 60 seconds)
+            redis_client: Optional redis.asyncio client used as a second cache
+                tier shared by all workers (async reads only)
+            redis_ttl: Seconds before a Redis entry expires (default: 300)
+            max_pool_size: Maximum pooled connections per client (default: 100)
+            min_pool_size: Connections kept open while idle (default: 10)
+            socket_timeout_ms: Per-operation socket timeout (default: 5000)
+            batch_wait_ms: How long a whole-document Motor read waits to share
+                one `$in` query with other concurrent reads once start() was
+                called (default: 2)
         """
         self.uri = mongodb_uri
         self.database_name = mongodb_database_name
+        self.cache = cache if cache is not None else LRUCache(maxsize=10000, ttl=60)
+        self.redis_client = redis_client
+        self.redis_ttl = redis_ttl
+        self._inflight = SingleFlight()
+
+        # Coalesces concurrent whole-document Motor reads (different episode IDs) into `$in` queries
+        self.batcher = MicroBatcher(self._find_episodes_batch, max_batch=100, max_wait_ms=batch_wait_ms)
+
+        # (document, version token, encoded JSON) per cache key, reused while the
+        # same document object is cached
+        self._versions = LRUCache(maxsize=self.cache.maxsize, ttl=self.cache.ttl)
+
+        # Shared by the pymongo and Motor clients; each keeps one pool for the process
+        self.client_options = {
+            "maxPoolSize": max_pool_size,
+            "minPoolSize": min_pool_size,
+            "serverSelectionTimeoutMS": 5000,
+            "connectTimeoutMS": 5000,
+            "socketTimeoutMS": socket_timeout_ms,
+        }
 
         if not self.uri:
             raise MongoDBConnectionError("MongoDB URI not provided")
@@ -47,21 +139,28 @@ class MongoDBService:
         self.client: Optional[MongoClient] = None
         self.db = None
 
+        # Motor client for non-blocking reads from async endpoints (None without motor)
+        self.async_client = None
+        self.async_db = None
+
         logger.info(f"MongoDB service initialized with database: {self.database_name}")
 
     def connect(self):
         """Establish connection to MongoDB."""
         if self.client is None:
             try:
-                self.client = MongoClient(
-                    self.uri,
-                    serverSelectionTimeoutMS=5000,
-                    connectTimeoutMS=5000
-                )
-                # Test the connection
+                self.client = MongoClient(self.uri, **self.client_options)
+                # Test the connection (also opens the first pooled socket)
+                started = time.perf_counter()
                 self.client.admin.command('ping')
+                rtt_ms = (time.perf_counter() - started) * 1000
                 self.db = self.client[self.database_name]
-                logger.info(f"✅ Connected to MongoDB database: {self.database_name}")
+                logger.info(f"✅ Connected to MongoDB database: {self.database_name} (ping {rtt_ms:.1f}ms)")
+
+                if MOTOR_AVAILABLE:
+                    self.async_client = AsyncIOMotorClient(self.uri, **self.client_options)
+                    self.async_db = self.async_client[self.database_name]
+                    logger.info("✅ Motor async client initialized")
             except ConnectionFailure as e:
                 logger.error(f"❌ Failed to connect to MongoDB: {e}")
                 raise MongoDBConnectionError(f"Failed to connect to MongoDB: {e}")
@@ -69,20 +168,92 @@ class MongoDBService:
                 logger.error(f"❌ Unexpected error connecting to MongoDB: {e}")
                 raise MongoDBConnectionError(f"Unexpected error: {e}")
 
+    async def warm_up_async(self) -> None:
+        """
+        Open the Motor pool before the first request.
+
+        Motor connects lazily, so without this the first async read pays for
+        server selection and the TCP/TLS/auth handshake. Pings log their
+        round-trip time; failures are logged, never raised.
+        """
+        if self.async_client is None:
+            return
+
+        try:
+            started = time.perf_counter()
+            await self.async_client.admin.command('ping')
+            rtt_ms = (time.perf_counter() - started) * 1000
+            logger.info(f"✅ Motor connection pool warmed (ping {rtt_ms:.1f}ms)")
+        except Exception as e:
+            logger.warning(f"⚠️  Motor warm-up ping failed: {e}")
+
+    def start(self) -> None:
+        """Start cross-request batching of async episode reads (call inside the event loop)."""
+        self.batcher.start()
+
+    async def aclose(self) -> None:
+        """Stop cross-request batching."""
+        await self.batcher.aclose()
+
     def close(self):
         """Close MongoDB connection."""
+        if self.async_client:
+            self.async_client.close()
+            self.async_client = None
+            self.async_db = None
         if self.client:
             self.client.close()
             self.client = None
             self.db = None
             logger.info("MongoDB connection closed")
 
-    def get_episode_by_id(self, episode_id: int) -> Dict[str, Any]:
+    def ensure_indexes(self) -> bool:
+        """
+        Make sure episode lookups by episode_id use an index.
+
+        Creates the (non-unique) episode_id index if missing, then checks with
+        explain() that the lookup plan is an IXSCAN rather than a COLLSCAN.
+        Failures (e.g. a read-only user) are logged, never raised.
+
+        Returns:
+            True if the lookup plan uses the index, False otherwise
+        """
+        try:
+            if self.db is None:
+                self.connect()
+
+            episodes_collection = self.db["episodes"]
+            episodes_collection.create_index("episode_id", name="episode_id_1", background=True)
+
+            plan = episodes_collection.find({"episode_id": "0"}).limit(1).explain()
+            stages = self._plan_stages(plan.get("queryPlanner", {}).get("winningPlan", {}))
+            if "IXSCAN" in stages or "EXPRESS_IXSCAN" in stages:
+                logger.info("✅ Episode lookups use the episode_id index")
+                return True
+
+            logger.warning("⚠️  Episode lookup plan does not use an index: %s", " <- ".join(stages))
+            return False
+
+        except Exception as e:
+            logger.warning("⚠️  Could not verify episode_id index: %s", e)
+            return False
+
+    def _plan_stages(self, plan: Dict[str, Any]) -> List[str]:
+        """Flatten an explain() plan tree into its stage names, outermost first."""
+        stages = []
+        while plan:
+            if "stage" in plan:
+                stages.append(plan["stage"])
+            plan = plan.get("inputStage") or plan.get("queryPlan") or {}
+        return stages
+
+    def get_episode_by_id(self, episode_id: int, fields: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Get episode data from MongoDB by episode_id.
 
         Args:
             episode_id: Episode ID to query (will be converted to string for MongoDB query)
+            fields: Optional top-level fields to return (default: None, whole document)
 
         Returns:
             Episode document as dictionary
@@ -92,6 +263,37 @@ class MongoDBService:
             MongoDBConnectionError: If connection fails
             MongoDBServiceError: For other database errors
         """
+        episode = self.get_episode_by_id_or_none(episode_id, fields)
+        if episode is None:
+            raise EpisodeNotFoundInDBError(f"Episode {episode_id} not found in database")
+        return episode
+
+    def get_episode_by_id_or_none(
+        self,
+        episode_id: int,
+        fields: Optional[List[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get episode data from MongoDB by episode_id, returning None if it doesn't exist.
+
+        Cheaper than catching EpisodeNotFoundInDBError on paths where misses are common.
+
+        Args:
+            episode_id: Episode ID to query (will be converted to string for MongoDB query)
+            fields: Optional top-level fields to return (default: None, whole document)
+
+        Returns:
+            Episode document as dictionary, or None if not found
+
+        Raises:
+            MongoDBConnectionError: If connection fails
+            MongoDBServiceError: For other database errors
+        """
+        cache_key = self._cache_key(episode_id, fields)
+        cached = self._get_cached(episode_id, fields, cache_key)
+        if cached is not None:
+            return cached
+
         try:
             # Ensure connection is established
             if self.db is None:
@@ -103,29 +305,468 @@ class MongoDBService:
 
             # Query episodes collection
             episodes_collection = self.db["episodes"]
-            episode = episodes_collection.find_one({"episode_id": episode_id_str})
+            episode = episodes_collection.find_one(
+                {"episode_id": episode_id_str},
+                projection=self._projection(fields)
+            )
+
+            return self._process_episode(episode, episode_id, cache_key)
+
+        except MongoDBServiceError:
+            raise
+        except Exception as e:
+            raise self._translate_error(e)
+
+    async def get_episode_by_id_or_none_async(
+        self,
+        episode_id: int,
+        fields: Optional[List[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get episode data without blocking the event loop, returning None if it doesn't exist.
+
+        Lookup order: in-process cache, Redis (if configured), then MongoDB
+        through the Motor client when available, otherwise get_episode_by_id
+        in a worker thread. Documents read from MongoDB are written back to Redis.
+        Concurrent cache misses for the same episode share a single lookup.
+
+        Args:
+            episode_id: Episode ID to query (will be converted to string for MongoDB query)
+            fields: Optional top-level fields to return (default: None, whole document)
+
+        Returns:
+            Episode document as dictionary, or None if not found
+
+        Raises:
+            MongoDBConnectionError: If connection fails
+            MongoDBServiceError: For other database errors
+        """
+        cache_key = self._cache_key(episode_id, fields)
+        cached = self._get_cached(episode_id, fields, cache_key)
+        if cached is not None:
+            return cached
+
+        # Concurrent misses for the same key share one Redis/MongoDB round trip
+        return await self._inflight.do(
+            cache_key,
+            lambda: self._load_episode_async(episode_id, fields, cache_key)
+        )
+
+    async def _load_episode_async(
+        self,
+        episode_id: int,
+        fields: Optional[List[str]],
+        cache_key: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Load an episode after an in-process cache miss (Redis, then MongoDB).
+
+        Args:
+            episode_id: Episode ID to query
+            fields: Requested fields, or None for the whole document
+            cache_key: Key from _cache_key
+
+        Returns:
+            Episode document as dictionary, or None if not found
+        """
+        shared = await self._get_shared(cache_key)
+        if shared is not None:
+            self.cache.set(cache_key, shared)
+            return shared
+
+        if self.db is None:
+            await asyncio.to_thread(self.connect)
+
+        if self.async_db is None:
+            episode = await asyncio.to_thread(self.get_episode_by_id_or_none, episode_id, fields)
+        elif fields is None:
+            # Shares one `$in` query with concurrent reads of other episodes
+            episode = await self.batcher.submit(episode_id)
+        else:
+            try:
+                document = await self.async_db["episodes"].find_one(
+                    {"episode_id": str(episode_id)},
+                    projection=self._projection(fields)
+                )
+                episode = self._process_episode(document, episode_id, cache_key)
+            except MongoDBServiceError:
+                raise
+            except Exception as e:
+                raise self._translate_error(e)
+
+        if episode is not None:
+            await self._set_shared(cache_key, episode)
+        return episode
+
+    async def get_episode_json_with_version_or_none_async(
+        self,
+        episode_id: int,
+        fields: Optional[List[str]] = None
+    ) -> Optional[Tuple[bytes, str]]:
+        """
+        Get an episode as encoded JSON together with a version token usable as an HTTP ETag.
+
+        The token is derived from updatedAt/updated_at when the document has
+        one, otherwise from a BLAKE2b digest of the encoded document. Both
+        the bytes and the token are computed once per loaded document and
+        reused, so hot reads and revalidation skip serialization entirely.
+
+        Args:
+            episode_id: Episode ID to query
+            fields: Optional top-level fields to return (default: None, whole document)
+
+        Returns:
+            Tuple of (UTF-8 JSON document, version token), or None if not found
+
+        Raises:
+            MongoDBConnectionError: If connection fails
+            MongoDBServiceError: For other database errors
+        """
+        episode = await self.get_episode_by_id_or_none_async(episode_id, fields)
+        if episode is None:
+            return None
+
+        cache_key = self._cache_key(episode_id, fields)
+        known = self._versions.get(cache_key)
+        if known is not None and known[0] is episode:
+            return known[2], known[1]
+
+        encoded = self._encode(episode)
+        version = self._version_token(cache_key, episode, encoded)
+        self._versions.set(cache_key, (episode, version, encoded))
+        return encoded, version
+
+    @staticmethod
+    def _encode(episode: Dict[str, Any]) -> bytes:
+        """Encode an episode document as UTF-8 JSON."""
+        if orjson is not None:
+            return orjson.dumps(episode, default=str)
+        return json.dumps(episode, default=_json_default, ensure_ascii=False).encode()
+
+    def _version_token(
+        self,
+        cache_key: str,
+        episode: Dict[str, Any],
+        encoded: Optional[bytes] = None
+    ) -> str:
+        """Build a version token for an episode document (see get_episode_json_with_version_or_none_async)."""
+        updated_at = episode.get("updatedAt") or episode.get("updated_at")
+        if isinstance(updated_at, datetime):
+            # Same text as the ISO string a Redis-tier copy carries, so every tier and worker agrees
+            updated_at = updated_at.isoformat()
+        if updated_at is not None:
+            source = f"{cache_key}:{updated_at}".encode()
+        elif encoded is not None:
+            source = encoded
+        elif orjson is not None:
+            source = orjson.dumps(episode, default=str)
+        else:
+            source = json.dumps(episode, default=_json_default, sort_keys=True).encode()
+        return hashlib.blake2b(source, digest_size=16).hexdigest()
+
+    def get_episodes_by_ids(
+        self,
+        episode_ids: List[int],
+        fields: Optional[List[str]] = None
+    ) -> Dict[int, Optional[Dict[str, Any]]]:
+        """
+        Get several episodes with a single `$in` query.
+
+        Args:
+            episode_ids: Episode IDs to query
+            fields: Optional top-level fields to return (default: None, whole documents)
+
+        Returns:
+            Dictionary mapping each requested episode ID to its document,
+            or None if the episode was not found
+
+        Raises:
+            MongoDBConnectionError: If connection fails
+            MongoDBServiceError: For other database errors
+        """
+        results, missing = self._get_cached_many(episode_ids, fields)
+        if not missing:
+            return results
+
+        try:
+            if self.db is None:
+                self.connect()
+
+            documents = self.db["episodes"].find(
+                {"episode_id": {"$in": [str(episode_id) for episode_id in missing]}},
+                projection=self._projection(fields and [*fields, "episode_id"])
+            )
+            return self._process_episodes(list(documents), missing, fields, results)
+
+        except MongoDBServiceError:
+            raise
+        except Exception as e:
+            raise self._translate_error(e)
+
+    async def get_episodes_by_ids_async(
+        self,
+        episode_ids: List[int],
+        fields: Optional[List[str]] = None
+    ) -> Dict[int, Optional[Dict[str, Any]]]:
+        """
+        Get several episodes with a single `$in` query without blocking the event loop.
+
+        Uses the Motor client when available, otherwise runs get_episodes_by_ids
+        in a worker thread.
+
+        Args:
+            episode_ids: Episode IDs to query
+            fields: Optional top-level fields to return (default: None, whole documents)
+
+        Returns:
+            Dictionary mapping each requested episode ID to its document,
+            or None if the episode was not found
+
+        Raises:
+            MongoDBConnectionError: If connection fails
+            MongoDBServiceError: For other database errors
+        """
+        results, missing = self._get_cached_many(episode_ids, fields)
+        if not missing:
+            return results
 
-            if episode is None:
-                raise EpisodeNotFoundInDBError(f"Episode {episode_id} not found in database")
+        if self.db is None:
+            await asyncio.to_thread(self.connect)
 
-            # Convert ObjectId to string for JSON serialization
-            if "_id" in episode:
-                episode["_id"] = str(episode["_id"])
+        if self.async_db is None:
+            fetched = await asyncio.to_thread(self.get_episodes_by_ids, missing, fields)
+            results.update(fetched)
+            return results
 
-            logger.info(f"📖 Retrieved episode {episode_id} (stored as '{episode_id_str}') from MongoDB")
-            return episode
+        try:
+            documents = await self.async_db["episodes"].find(
+                {"episode_id": {"$in": [str(episode_id) for episode_id in missing]}},
+                projection=self._projection(fields and [*fields, "episode_id"])
+            ).to_list(None)
+            return self._process_episodes(documents, missing, fields, results)
 
-        except EpisodeNotFoundInDBError:
+        except MongoDBServiceError:
             raise
-        except ConnectionFailure as e:
-            logger.error(f"MongoDB connection error: {e}")
-            raise MongoDBConnectionError(f"Connection error: {e}")
-        except OperationFailure as e:
-            logger.error(f"MongoDB operation error: {e}")
-            raise MongoDBServiceError(f"Operation failed: {e}")
         except Exception as e:
-            logger.error(f"Unexpected MongoDB error: {e}")
-            raise MongoDBServiceError(f"Unexpected error: {e}")
+            raise self._translate_error(e)
+
+    async def _find_episodes_batch(self, episode_ids: List[int]) -> List[Optional[Dict[str, Any]]]:
+        """
+        MicroBatcher handler: load whole documents for a batch of episode IDs with one `$in` query.
+
+        Args:
+            episode_ids: Episode IDs queued by concurrent readers (may repeat)
+
+        Returns:
+            One document (or None if not found) per queued ID, in order
+        """
+        unique_ids = list(dict.fromkeys(episode_ids))
+        try:
+            documents = await self.async_db["episodes"].find(
+                {"episode_id": {"$in": [str(episode_id) for episode_id in unique_ids]}}
+            ).to_list(None)
+        except Exception as e:
+            raise self._translate_error(e)
+
+        results = self._process_episodes(documents, unique_ids, None, {})
+        return [results.get(episode_id) for episode_id in episode_ids]
+
+    def _get_cached_many(
+        self,
+        episode_ids: List[int],
+        fields: Optional[List[str]]
+    ) -> Tuple[Dict[int, Optional[Dict[str, Any]]], List[int]]:
+        """
+        Split requested episode IDs into cached documents and IDs to query.
+
+        Args:
+            episode_ids: Requested episode IDs (duplicates are collapsed)
+            fields: Requested fields, or None for whole documents
+
+        Returns:
+            Tuple of (results with cached documents, IDs missing from the cache)
+        """
+        results: Dict[int, Optional[Dict[str, Any]]] = {}
+        missing: List[int] = []
+        for episode_id in dict.fromkeys(episode_ids):
+            cached = self._get_cached(episode_id, fields, self._cache_key(episode_id, fields))
+            results[episode_id] = cached
+            if cached is None:
+                missing.append(episode_id)
+        return results, missing
+
+    def _process_episodes(
+        self,
+        documents: List[Dict[str, Any]],
+        episode_ids: List[int],
+        fields: Optional[List[str]],
+        results: Dict[int, Optional[Dict[str, Any]]]
+    ) -> Dict[int, Optional[Dict[str, Any]]]:
+        """
+        Match queried documents back to episode IDs and cache them.
+
+        The `$in` query always projects episode_id so documents can be matched.
+        The episode_id index is not unique: if an ID has several documents, the
+        first one returned is kept, as find_one would.
+
+        Args:
+            documents: Documents returned by the `$in` query
+            episode_ids: Episode IDs that were queried
+            fields: Requested fields, or None for whole documents
+            results: Result dictionary to fill in (IDs not found stay None)
+
+        Returns:
+            The updated results dictionary
+        """
+        by_id_str = {str(episode_id): episode_id for episode_id in episode_ids}
+        for document in documents:
+            # pop: later duplicates of an already matched ID are skipped
+            episode_id = by_id_str.pop(str(document.get("episode_id")), None)
+            if episode_id is None:
+                continue
+            results[episode_id] = self._process_episode(
+                document, episode_id, self._cache_key(episode_id, fields)
+            )
+
+        found = sum(1 for episode_id in episode_ids if results.get(episode_id) is not None)
+        logger.debug("📚 Retrieved %s/%s episodes from MongoDB in one query", found, len(episode_ids))
+        return results
+
+    def _cache_key(self, episode_id: int, fields: Optional[List[str]]) -> str:
+        """Build the cache key for an episode read (projected reads get their own entry)."""
+        if not fields:
+            return str(episode_id)
+        return f"{episode_id}:{','.join(sorted(set(fields)))}"
+
+    def _projection(self, fields: Optional[List[str]]) -> Optional[Dict[str, int]]:
+        """Build a find_one projection (None returns the whole document)."""
+        if not fields:
+            return None
+        return {field: 1 for field in fields}
+
+    def _get_cached(
+        self,
+        episode_id: int,
+        fields: Optional[List[str]],
+        cache_key: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up an episode in the in-process cache.
+
+        Projected reads are also served from a cached whole document; the
+        projection is then cached under its own key, so repeated reads get
+        the same dict (and reuse its encoded bytes and version token).
+
+        Args:
+            episode_id: Episode ID
+            fields: Requested fields, or None for the whole document
+            cache_key: Key from _cache_key
+
+        Returns:
+            Episode document, or None on a miss
+        """
+        cached = self.cache.get(cache_key)
+        if cached is not None or not fields:
+            return cached
+
+        full = self.cache.get(str(episode_id))
+        if full is None:
+            return None
+        projected = {key: full[key] for key in ("_id", *fields) if key in full}
+        self.cache.set(cache_key, projected)
+        return projected
+
+    async def _get_shared(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Read an episode document from the shared Redis tier.
+
+        Redis errors are logged and treated as a miss.
+
+        Args:
+            cache_key: Key from _cache_key
+
+        Returns:
+            Episode document, or None on a miss (or without Redis)
+        """
+        if self.redis_client is None:
+            return None
+
+        try:
+            raw = await self.redis_client.get(f"episode:{cache_key}")
+            if raw is None:
+                return None
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except Exception as e:
+            logger.warning("Redis read failed for episode %s: %s", cache_key, e)
+            return None
+
+    async def _set_shared(self, cache_key: str, episode: Dict[str, Any]) -> None:
+        """
+        Write an episode document to the shared Redis tier.
+
+        Redis errors are logged and ignored.
+
+        Args:
+            cache_key: Key from _cache_key
+            episode: JSON-serializable episode document
+        """
+        if self.redis_client is None:
+            return
+
+        try:
+            if orjson is not None:
+                raw = orjson.dumps(episode, default=str)
+            else:
+                raw = json.dumps(episode, default=_json_default, ensure_ascii=False)
+            await self.redis_client.set(f"episode:{cache_key}", raw, ex=self.redis_ttl)
+        except Exception as e:
+            logger.warning("Redis write failed for episode %s: %s", cache_key, e)
+
+    def _process_episode(
+        self,
+        episode: Optional[Dict[str, Any]],
+        episode_id: int,
+        cache_key: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Make a queried episode document JSON serializable and cache it.
+
+        Args:
+            episode: Document returned by find_one (None if not found)
+            episode_id: Queried episode ID
+            cache_key: Key from _cache_key
+
+        Returns:
+            Episode document as dictionary, or None if not found
+        """
+        if episode is None:
+            return None
+
+        # Convert BSON types once so the cached document encodes entirely in orjson's C path
+        episode = to_json_compatible(episode)
+
+        logger.debug("📖 Retrieved episode %s from MongoDB", episode_id)
+        self.cache.set(cache_key, episode)
+        return episode
+
+    def _translate_error(self, error: Exception) -> MongoDBServiceError:
+        """
+        Map a driver exception to the service's exception types.
+
+        Args:
+            error: Exception raised by pymongo/motor
+
+        Returns:
+            MongoDBServiceError (or subclass) to raise
+        """
+        if isinstance(error, ConnectionFailure):
+            logger.error("MongoDB connection error: %s", error)
+            return MongoDBConnectionError(f"Connection error: {error}")
+        if isinstance(error, OperationFailure):
+            logger.error("MongoDB operation error: %s", error)
+            return MongoDBServiceError(f"Operation failed: {error}")
+        logger.error("Unexpected MongoDB error: %s", error)
+        return MongoDBServiceError(f"Unexpected error: {error}")
 
     def __enter__(self):
         """Context manager entry."""
@@ -138,7 +779,9 @@ class MongoDBService:
 
 
 __all__ = [
+    'MOTOR_AVAILABLE',
     'MongoDBService',
+    'to_json_compatible',
     'MongoDBServiceError',
     'MongoDBConnectionError',
     'EpisodeNotFoundInDBError'
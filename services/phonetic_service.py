@@ -4,11 +4,14 @@ Phonetic Service - Handles US phonetic transcription logic.
 Business logic layer for phonetic transcription operations.
 """
 
+import asyncio
 import logging
 import re
-from typing import Optional
-from .deepseek_client import DeepseekClient, DeepseekAPIError
+from typing import Any, Dict, Optional, Tuple
+from .deepseek_client import DeepseekClient, AsyncDeepseekClient, DeepseekAPIError
 from .prompts import PHONETIC_SYSTEM_PROMPT, get_phonetic_user_prompt
+from utils.cache import LRUCache
+from utils.text_helpers import hash_text
 
 
 logger = logging.getLogger(__name__)
@@ -25,14 +28,23 @@ class PhoneticService:
     - Ensure proper IPA format with slashes
     """
 
-    def __init__(self, client: DeepseekClient):
+    def __init__(
+        self,
+        client: DeepseekClient,
+        async_client: Optional[AsyncDeepseekClient] = None,
+        cache: Optional[LRUCache] = None
+    ):
         """
         Initialize phonetic service.
 
         Args:
             client: DeepseekClient instance for API calls
+            async_client: Optional AsyncDeepseekClient used by get_phonetic_async
+            cache: Optional phonetic cache keyed by sentence hash (default: in-process LRU)
         """
         self.client = client
+        self.async_client = async_client
+        self.cache = cache if cache is not None else LRUCache()
         self.logger = logger
 
     def get_phonetic(self, text: str) -> str:
@@ -48,38 +60,110 @@ class PhoneticService:
         Raises:
             DeepseekAPIError: If phonetic generation fails
         """
-        # Input validation
-        if not text or not text.strip():
-            self.logger.warning("Empty text provided for phonetic transcription")
+        text, cache_key, cached = self._prepare(text)
+        if not text:
             return ""
-
-        text = text.strip()
+        if cached is not None:
+            return cached
 
         try:
             self.logger.debug(f"Generating phonetic for: {text[:50]}...")
+            raw_result = self.client.simple_completion(**self._request(text))
+            return self._finish(text, raw_result, cache_key)
+        except Exception as e:
+            raise self._api_error(text, e)
+
+    async def get_phonetic_async(self, text: str) -> str:
+        """
+        Generate US phonetic transcription without blocking the event loop.
+
+        Uses the async client when available, otherwise runs get_phonetic()
+        in a worker thread.
+
+        Args:
+            text: English text to transcribe
 
-            # Call API
-            raw_result = self.client.simple_completion(
-                system_prompt=PHONETIC_SYSTEM_PROMPT,
-                user_prompt=get_phonetic_user_prompt(text),
-                temperature=0.1,
-                max_tokens=500
-            )
+        Returns:
+            US phonetic transcription in IPA notation with slashes (e.g., /həˈloʊ/)
 
-            # Parse and clean the response
-            phonetic = self._parse_phonetic_response(raw_result)
+        Raises:
+            DeepseekAPIError: If phonetic generation fails
+        """
+        if self.async_client is None:
+            return await asyncio.to_thread(self.get_phonetic, text)
 
-            self.logger.info(f"✅ Phonetic generated: '{text[:30]}...' -> '{phonetic}'")
-            return phonetic
+        text, cache_key, cached = self._prepare(text)
+        if not text:
+            return ""
+        if cached is not None:
+            return cached
 
-        except DeepseekAPIError as e:
-            self.logger.error(f"Phonetic generation failed for text '{text[:30]}...': {e}")
-            raise
+        try:
+            self.logger.debug(f"Generating phonetic for: {text[:50]}...")
+            raw_result = await self.async_client.simple_completion(**self._request(text))
+            return self._finish(text, raw_result, cache_key)
         except Exception as e:
-            self.logger.error(f"Unexpected error during phonetic generation: {e}")
-            raise DeepseekAPIError(f"Phonetic generation failed: {e}")
+            raise self._api_error(text, e)
+
+    def _prepare(self, text: str) -> Tuple[str, str, Optional[str]]:
+        """
+        Validate input text and look it up in the cache.
+
+        Args:
+            text: English text to transcribe
+
+        Returns:
+            Tuple of (stripped text, cache key, cached phonetic or None);
+            the text is empty if the input was empty
+        """
+        if not text or not text.strip():
+            self.logger.warning("Empty text provided for phonetic transcription")
+            return "", "", None
+
+        text = text.strip()
+        cache_key = hash_text(text, length=32)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            self.logger.debug(f"Phonetic cache hit: {text[:50]}...")
+        return text, cache_key, cached
+
+    def _request(self, text: str) -> Dict[str, Any]:
+        """Completion arguments for a phonetic request (same for both clients)."""
+        return {
+            "system_prompt": PHONETIC_SYSTEM_PROMPT,
+            "user_prompt": get_phonetic_user_prompt(text),
+            "temperature": 0.1,
+            "max_tokens": 500
+        }
+
+    def _finish(self, text: str, raw_result: str, cache_key: str) -> str:
+        """
+        Parse a raw API response and cache the phonetic.
 
-    def _parse_phonetic_response(self, response: str) -> str:
+        Args:
+            text: Source English text (for logging)
+            raw_result: Raw API response
+            cache_key: Cache key from _prepare
+
+        Returns:
+            Cleaned phonetic transcription with slashes
+        """
+        phonetic = self.parse_phonetic_response(raw_result)
+        if phonetic:
+            self.cache.set(cache_key, phonetic)
+
+        self.logger.info(f"✅ Phonetic generated: '{text[:30]}...' -> '{phonetic}'")
+        return phonetic
+
+    def _api_error(self, text: str, error: Exception) -> DeepseekAPIError:
+        """Log a failed phonetic request and return the DeepseekAPIError to raise."""
+        if isinstance(error, DeepseekAPIError):
+            self.logger.error(f"Phonetic generation failed for text '{text[:30]}...': {error}")
+            return error
+        self.logger.error(f"Unexpected error during phonetic generation: {error}")
+        return DeepseekAPIError(f"Phonetic generation failed: {error}")
+
+    def parse_phonetic_response(self, response: str) -> str:
         """
         Parse and clean phonetic response from API.
 
@@ -102,6 +102,32 @@ def get_highlight_system_prompt(has_chinese_translation: bool) -> str:
         return HIGHLIGHT_SYSTEM_PROMPT_WITHOUT_TRANSLATION
 
 
+# ===== Batch Enhancement Prompts =====
+
+ENHANCE_BATCH_SYSTEM_PROMPT = """You are an English language learning assistant for Chinese-speaking \
+American middle school students. For EACH numbered English sentence you receive, produce:
+1. "zh": an accurate, natural and fluent Chinese translation (信、达、雅), concise and suitable \
+for language learning
+2. "phonetic_us": the American English IPA transcription of the whole sentence, enclosed in slashes \
+like /transcription/
+3. "highlights": important learning points - advanced or context-specific words, phrasal verbs, \
+collocations, idioms and useful sentence patterns. Every sentence needs at least one highlight. \
+Avoid basic vocabulary that middle schoolers already know. For translation_zh you MUST copy the \
+matching substring from your own "zh" translation; do NOT create a new translation.
+
+Return ONLY a valid JSON object with this exact format, one item per input sentence, in input order:
+{"results": [{"index": 1, "zh": "中文翻译", "phonetic_us": "/IPA/", \
+"highlights": [{"slug": "kebab-case-slug", "display_text": "original word/phrase", "translation_zh": "对应中文片段"}]}]}
+
+Do NOT include any explanations, just the JSON object."""
+
+
+def get_enhance_batch_user_prompt(texts: list) -> str:
+    """Get user prompt for batch sentence enhancement (numbered from 1)."""
+    numbered = "\n".join(f"{i}. {text}" for i, text in enumerate(texts, 1))
+    return f"Enhance these {len(texts)} English sentences:\n\n{numbered}"
+
+
 # ===== Expression Generation Prompts =====
 
 EXPRESSION_SYSTEM_PROMPT = """You are an expert English language learning content creator. \
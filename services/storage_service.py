@@ -8,18 +8,48 @@ Uses aioboto3 for R2 and thread pool for COS (which doesn't have async client).
 import asyncio
 import logging
 import os
+from contextlib import AsyncExitStack
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Callable, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+# Files below this size (boto's default multipart threshold) are sent with a
+# single PutObject instead of going through the managed transfer machinery
+SINGLE_PUT_MAX_BYTES = 8 * 1024 * 1024
+
+
 class StorageUploadError(Exception):
     """Custom exception for storage upload errors."""
     pass
 
 
+def _read_for_upload(file_path: str) -> tuple[Optional[int], Optional[bytes]]:
+    """
+    Stat a file once and read it if it is small enough for a single PUT.
+
+    Blocking; run it in a worker thread.
+
+    Args:
+        file_path: Local file path
+
+    Returns:
+        Tuple of (size, body): (None, None) if the file doesn't exist,
+        body None if the file is too large for a single PUT
+    """
+    try:
+        size = os.stat(file_path).st_size
+    except FileNotFoundError:
+        return None, None
+
+    if size >= SINGLE_PUT_MAX_BYTES:
+        return size, None
+
+    with open(file_path, 'rb') as f:
+        return size, f.read()
+
+
 async def upload_to_r2_async(
     file_path: str,
     object_key: str,
@@ -134,15 +164,49 @@ def upload_to_cos_sync(
         Dict with upload result
     """
     try:
-        from qcloud_cos import CosConfig, CosS3Client
+        client = _create_cos_client(region, secret_id, secret_key)
+    except ImportError:
+        return {
+            'success': False,
+            'object_key': object_key,
+            'error': 'qcloud_cos not installed'
+        }
+    except Exception as e:
+        logger.error(f"COS upload failed for {object_key}: {e}")
+        return {
+            'success': False,
+            'object_key': object_key,
+            'error': str(e)
+        }
 
-        cos_config = CosConfig(
-            Region=region,
-            SecretId=secret_id,
-            SecretKey=secret_key
-        )
-        client = CosS3Client(cos_config)
+    return _upload_cos_file(client, file_path, object_key, bucket)
+
+
+def _create_cos_client(region: str, secret_id: str, secret_key: str) -> Any:
+    """
+    Create a COS client.
+
+    Raises:
+        ImportError: If qcloud_cos is not installed
+    """
+    from qcloud_cos import CosConfig, CosS3Client
+
+    cos_config = CosConfig(
+        Region=region,
+        SecretId=secret_id,
+        SecretKey=secret_key
+    )
+    return CosS3Client(cos_config)
 
+
+def _upload_cos_file(client: Any, file_path: str, object_key: str, bucket: str) -> Dict[str, Any]:
+    """
+    Upload one file with an existing COS client (blocking; run it in a worker thread).
+
+    Returns:
+        Dict with upload result, as upload_to_cos_sync
+    """
+    try:
         file_obj = Path(file_path)
         if not file_obj.exists():
             return {
@@ -166,14 +230,114 @@ def upload_to_cos_sync(
             'etag': response.get('ETag', '').strip('"')
         }
 
-    except ImportError:
+    except Exception as e:
+        logger.error(f"COS upload failed for {object_key}: {e}")
         return {
             'success': False,
             'object_key': object_key,
-            'error': 'qcloud_cos not installed'
+            'error': str(e)
+        }
+
+
+def _r2_configured(settings: Any) -> bool:
+    """Whether all R2 upload settings are present."""
+    return all([
+        settings.r2_bucket_name,
+        settings.r2_access_key_id,
+        settings.r2_secret_access_key,
+        settings.r2_endpoint_url
+    ])
+
+
+def _cos_configured(settings: Any) -> bool:
+    """Whether all COS upload settings are present."""
+    return all([
+        settings.cos_secret_id,
+        settings.cos_secret_key,
+        settings.cos_bucket,
+        settings.cos_region
+    ])
+
+
+def _r2_client(settings: Any, max_concurrent: int) -> Any:
+    """
+    Create an aioboto3 R2 client context manager sized for max_concurrent uploads.
+
+    Raises:
+        ImportError: If aioboto3 is not installed
+    """
+    import aioboto3
+    from botocore.config import Config
+
+    # Configure boto with increased timeouts and connection pool settings
+    boto_config = Config(
+        connect_timeout=30,
+        read_timeout=60,
+        retries={'max_attempts': 2, 'mode': 'standard'},
+        max_pool_connections=max_concurrent + 5
+    )
+
+    session = aioboto3.Session()
+    return session.client(
+        service_name='s3',
+        endpoint_url=settings.r2_endpoint_url,
+        aws_access_key_id=settings.r2_access_key_id,
+        aws_secret_access_key=settings.r2_secret_access_key,
+        region_name='auto',
+        config=boto_config
+    )
+
+
+async def _upload_r2_file(s3_client: Any, bucket_name: str, file_info: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Upload one file with an open R2 client.
+
+    Args:
+        s3_client: Open aioboto3 S3 client
+        bucket_name: R2 bucket name
+        file_info: Dict with 'file_path' and 'object_key'
+
+    Returns:
+        Dict with upload result
+    """
+    file_path = file_info['file_path']
+    object_key = file_info['object_key']
+    try:
+        # One stat (+ read for small files) off the event loop
+        file_size, body = await asyncio.to_thread(_read_for_upload, file_path)
+        if file_size is None:
+            return {
+                'success': False,
+                'object_key': object_key,
+                'error': 'File not found'
+            }
+
+        if body is not None:
+            await s3_client.put_object(
+                Bucket=bucket_name,
+                Key=object_key,
+                Body=body,
+                ContentLength=file_size,
+                ContentType='audio/mpeg'
+            )
+        else:
+            await s3_client.upload_file(
+                Filename=file_path,
+                Bucket=bucket_name,
+                Key=object_key,
+                ExtraArgs={'ContentType': 'audio/mpeg'}
+            )
+
+        return {
+            'success': True,
+            'object_key': object_key,
+            'file_name': Path(file_path).name,
+            'file_size': file_size,
+            'content_type': 'audio/mpeg'
         }
+
     except Exception as e:
-        logger.error(f"COS upload failed for {object_key}: {e}")
+        logger.error(f"R2 upload failed for {object_key}: {e}")
         return {
             'success': False,
             'object_key': object_key,
@@ -181,6 +345,26 @@ def upload_to_cos_sync(
         }
 
 
+def _collect_results(
+    results: List[Any],
+    upload_files: List[Dict[str, str]],
+    storage: str
+) -> List[Dict[str, Any]]:
+    """Turn gather(return_exceptions=True) output into upload result dicts."""
+    processed_results = []
+    for idx, result in enumerate(results):
+        if isinstance(result, Exception):
+            logger.error(f"{storage} upload exception for file {idx}: {result}")
+            processed_results.append({
+                'success': False,
+                'object_key': upload_files[idx].get('object_key', 'unknown'),
+                'error': str(result)
+            })
+        else:
+            processed_results.append(result)
+    return processed_results
+
+
 async def batch_upload_r2(
     upload_files: List[Dict[str, str]],
     max_concurrent: int = 10,
@@ -203,12 +387,7 @@ async def batch_upload_r2(
         settings = get_settings()
 
     # Check if R2 is configured using Settings
-    if not all([
-        settings.r2_bucket_name,
-        settings.r2_access_key_id,
-        settings.r2_secret_access_key,
-        settings.r2_endpoint_url
-    ]):
+    if not _r2_configured(settings):
         logger.warning("R2 configuration incomplete - skipping upload")
         return [], {
             'error': 'R2 configuration incomplete - missing settings',
@@ -230,27 +409,8 @@ async def batch_upload_r2(
     logger.info(f"🔑 R2 configuration loaded, starting upload of {len(upload_files)} files...")
 
     try:
-        import aioboto3
-        from botocore.config import Config
-
-        # Configure boto with increased timeouts and connection pool settings
-        boto_config = Config(
-            connect_timeout=30,
-            read_timeout=60,
-            retries={'max_attempts': 2, 'mode': 'standard'},
-            max_pool_connections=max_concurrent + 5
-        )
-
         # Create shared session and client for all uploads
-        session = aioboto3.Session()
-        async with session.client(
-            service_name='s3',
-            endpoint_url=settings.r2_endpoint_url,
-            aws_access_key_id=settings.r2_access_key_id,
-            aws_secret_access_key=settings.r2_secret_access_key,
-            region_name='auto',
-            config=boto_config
-        ) as s3_client:
+        async with _r2_client(settings, max_concurrent) as s3_client:
 
             # Create semaphore for concurrency control
             semaphore = asyncio.Semaphore(max_concurrent)
@@ -258,58 +418,12 @@ async def batch_upload_r2(
             async def upload_single_file(file_info: Dict[str, str]) -> Dict[str, Any]:
                 """Upload single file using shared client."""
                 async with semaphore:
-                    try:
-                        file_path = file_info['file_path']
-                        object_key = file_info['object_key']
-
-                        file_obj = Path(file_path)
-                        if not file_obj.exists():
-                            return {
-                                'success': False,
-                                'object_key': object_key,
-                                'error': 'File not found'
-                            }
-
-                        # Upload using shared client
-                        await s3_client.upload_file(
-                            Filename=str(file_obj),
-                            Bucket=settings.r2_bucket_name,
-                            Key=object_key,
-                            ExtraArgs={'ContentType': 'audio/mpeg'}
-                        )
-
-                        return {
-                            'success': True,
-                            'object_key': object_key,
-                            'file_name': file_obj.name,
-                            'file_size': file_obj.stat().st_size,
-                            'content_type': 'audio/mpeg'
-                        }
-
-                    except Exception as e:
-                        logger.error(f"R2 upload failed for {object_key}: {e}")
-                        return {
-                            'success': False,
-                            'object_key': object_key,
-                            'error': str(e)
-                        }
+                    return await _upload_r2_file(s3_client, settings.r2_bucket_name, file_info)
 
             # Upload all files concurrently
             tasks = [upload_single_file(file_info) for file_info in upload_files]
             results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Handle exceptions
-            processed_results = []
-            for idx, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logger.error(f"R2 upload exception for file {idx}: {result}")
-                    processed_results.append({
-                        'success': False,
-                        'object_key': upload_files[idx].get('object_key', 'unknown'),
-                        'error': str(result)
-                    })
-                else:
-                    processed_results.append(result)
+            processed_results = _collect_results(results, upload_files, "R2")
 
             # Wait for graceful connection cleanup
             await asyncio.sleep(2.0)  # 增加到2秒，确保连接完全关闭
@@ -355,9 +469,13 @@ async def batch_upload_cos(
     """
     Upload multiple files to COS using thread pool (since COS SDK is sync).
 
+    Uploads run on the event loop's default executor (the app-wide worker
+    pool in the API) instead of a pool created per call; a semaphore keeps
+    at most max_workers uploads in flight.
+
     Args:
         upload_files: List of dicts with 'file_path', 'object_key', 'sentence_hash'
-        max_workers: Maximum thread pool workers (default: 4)
+        max_workers: Maximum concurrent uploads (default: 4)
         settings: Settings instance (optional, will get from get_settings() if not provided)
 
     Returns:
@@ -369,12 +487,7 @@ async def batch_upload_cos(
         settings = get_settings()
 
     # Check if COS is configured using Settings
-    if not all([
-        settings.cos_secret_id,
-        settings.cos_secret_key,
-        settings.cos_bucket,
-        settings.cos_region
-    ]):
+    if not _cos_configured(settings):
         logger.warning("COS configuration incomplete - skipping upload")
         return [], {
             'error': 'COS configuration incomplete - missing settings',
@@ -395,12 +508,14 @@ async def batch_upload_cos(
 
     logger.info(f"🔑 COS configuration loaded, starting upload of {len(upload_files)} files...")
 
-    # Run sync uploads in thread pool
-    loop = asyncio.get_event_loop()
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [
-            loop.run_in_executor(
-                executor,
+    # Run sync uploads in the shared default executor
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def upload_single_file(file_info: Dict[str, str]) -> Dict[str, Any]:
+        async with semaphore:
+            return await loop.run_in_executor(
+                None,
                 upload_to_cos_sync,
                 file_info['file_path'],
                 file_info['object_key'],
@@ -409,22 +524,13 @@ async def batch_upload_cos(
                 settings.cos_secret_id,
                 settings.cos_secret_key
             )
-            for file_info in upload_files
-        ]
-        results = await asyncio.gather(*futures, return_exceptions=True)
 
-    # Handle exceptions
-    processed_results = []
-    for idx, result in enumerate(results):
-        if isinstance(result, Exception):
-            logger.error(f"COS upload exception for file {idx}: {result}")
-            processed_results.append({
-                'success': False,
-                'object_key': upload_files[idx].get('object_key', 'unknown'),
-                'error': str(result)
-            })
-        else:
-            processed_results.append(result)
+    results = await asyncio.gather(
+        *[upload_single_file(file_info) for file_info in upload_files],
+        return_exceptions=True
+    )
+
+    processed_results = _collect_results(results, upload_files, "COS")
 
     # Calculate statistics
     total = len(processed_results)
@@ -504,11 +610,179 @@ async def upload_audio_files(
     return cos_results, r2_results, cos_stats, r2_stats
 
 
+def _upload_stats(results: List[Dict[str, Any]], errors: List[str]) -> Dict[str, Any]:
+    """
+    Build upload statistics for a list of results.
+
+    Args:
+        results: Upload results
+        errors: Errors that prevented uploading at all (e.g. missing configuration)
+
+    Returns:
+        Statistics dict in the same shape as batch_upload_r2/batch_upload_cos
+    """
+    total = len(results)
+    successful = sum(1 for r in results if r.get('success', False))
+    stats = {
+        'total_uploads': total,
+        'successful_uploads': successful,
+        'failed_uploads': total - successful,
+        'success_rate': successful / total if total > 0 else 0.0
+    }
+
+    if errors:
+        stats['error'] = errors[0]
+
+    return stats
+
+
+async def upload_audio_stream(
+    queue: "asyncio.Queue[Optional[Dict[str, str]]]",
+    upload_to_cos: bool = True,
+    upload_to_r2: bool = True,
+    max_concurrent_r2: int = 10,
+    max_workers_cos: int = 4,
+    already_uploaded: Optional[Callable[[Dict[str, str]], Tuple[bool, bool]]] = None,
+    on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    settings: Optional[Any] = None
+) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, Any], Dict[str, Any]]:
+    """
+    Upload audio files as they arrive on a queue, until a None sentinel.
+
+    Lets callers start uploading while files are still being generated.
+    One R2 client and one COS client stay open for the whole stream and
+    each file starts uploading as soon as it is queued (within the
+    max_concurrent_r2 / max_workers_cos limits).
+
+    Args:
+        queue: Queue of dicts with 'file_path', 'object_key', 'sentence_hash';
+            put None once all files have been queued
+        upload_to_cos: Whether to upload to COS (default: True)
+        upload_to_r2: Whether to upload to R2 (default: True)
+        max_concurrent_r2: Max concurrent R2 uploads (default: 10)
+        max_workers_cos: Max concurrent COS uploads (default: 4)
+        already_uploaded: Optional callable returning (exists_in_r2, exists_in_cos)
+            for a queued file; the file is only uploaded where it is missing
+        on_result: Optional callback called with ('r2' or 'cos', result) after
+            each upload
+        settings: Settings instance (optional, will get from get_settings() if not provided)
+
+    Returns:
+        Tuple of (cos_results, r2_results, cos_stats, r2_stats), as upload_audio_files
+
+    Examples:
+        >>> queue = asyncio.Queue()
+        >>> uploader = asyncio.create_task(upload_audio_stream(queue))
+        >>> await queue.put({'file_path': 'a.mp3', 'object_key': 'audio/sentences/a.mp3', 'sentence_hash': 'a'})
+        >>> await queue.put(None)
+        >>> cos_results, r2_results, cos_stats, r2_stats = await uploader
+    """
+    # Get settings if not provided
+    if settings is None:
+        from config import get_settings
+        settings = get_settings()
+
+    r2_errors: List[str] = []
+    cos_errors: List[str] = []
+    r2_files: List[Dict[str, str]] = []
+    cos_files: List[Dict[str, str]] = []
+    r2_tasks: List["asyncio.Task[Dict[str, Any]]"] = []
+    cos_tasks: List["asyncio.Task[Dict[str, Any]]"] = []
+
+    async with AsyncExitStack() as stack:
+        s3_client = None
+        if upload_to_r2:
+            if not _r2_configured(settings):
+                logger.warning("R2 configuration incomplete - skipping upload")
+                r2_errors.append('R2 configuration incomplete - missing settings')
+            else:
+                try:
+                    s3_client = await stack.enter_async_context(_r2_client(settings, max_concurrent_r2))
+                except ImportError:
+                    logger.error("aioboto3 not installed")
+                    r2_errors.append('aioboto3 not installed')
+                except Exception as e:
+                    logger.error(f"R2 client creation failed: {e}")
+                    r2_errors.append(str(e))
+
+        cos_client = None
+        if upload_to_cos:
+            if not _cos_configured(settings):
+                logger.warning("COS configuration incomplete - skipping upload")
+                cos_errors.append('COS configuration incomplete - missing settings')
+            else:
+                try:
+                    cos_client = await asyncio.to_thread(
+                        _create_cos_client, settings.cos_region, settings.cos_secret_id, settings.cos_secret_key
+                    )
+                except ImportError:
+                    logger.error("qcloud_cos not installed")
+                    cos_errors.append('qcloud_cos not installed')
+                except Exception as e:
+                    logger.error(f"COS client creation failed: {e}")
+                    cos_errors.append(str(e))
+
+        loop = asyncio.get_running_loop()
+        r2_semaphore = asyncio.Semaphore(max_concurrent_r2)
+        cos_semaphore = asyncio.Semaphore(max_workers_cos)
+
+        async def upload_r2(file_info: Dict[str, str]) -> Dict[str, Any]:
+            async with r2_semaphore:
+                result = await _upload_r2_file(s3_client, settings.r2_bucket_name, file_info)
+            if on_result is not None:
+                on_result('r2', result)
+            return result
+
+        async def upload_cos(file_info: Dict[str, str]) -> Dict[str, Any]:
+            async with cos_semaphore:
+                result = await loop.run_in_executor(
+                    None,
+                    _upload_cos_file,
+                    cos_client,
+                    file_info['file_path'],
+                    file_info['object_key'],
+                    settings.cos_bucket
+                )
+            if on_result is not None:
+                on_result('cos', result)
+            return result
+
+        try:
+            while (file_info := await queue.get()) is not None:
+                in_r2, in_cos = already_uploaded(file_info) if already_uploaded is not None else (False, False)
+                if s3_client is not None and not in_r2:
+                    r2_files.append(file_info)
+                    r2_tasks.append(asyncio.create_task(upload_r2(file_info)))
+                if cos_client is not None and not in_cos:
+                    cos_files.append(file_info)
+                    cos_tasks.append(asyncio.create_task(upload_cos(file_info)))
+
+            r2_results = _collect_results(await asyncio.gather(*r2_tasks, return_exceptions=True), r2_files, "R2")
+            cos_results = _collect_results(await asyncio.gather(*cos_tasks, return_exceptions=True), cos_files, "COS")
+        except BaseException:
+            for task in (*r2_tasks, *cos_tasks):
+                task.cancel()
+            raise
+
+        if r2_tasks:
+            # Wait for graceful connection cleanup (once per stream, before the client closes)
+            await asyncio.sleep(2.0)
+
+    r2_stats = _upload_stats(r2_results, r2_errors)
+    cos_stats = _upload_stats(cos_results, cos_errors)
+    logger.info(
+        f"📊 Streamed uploads: R2 {r2_stats['successful_uploads']}/{r2_stats['total_uploads']}, "
+        f"COS {cos_stats['successful_uploads']}/{cos_stats['total_uploads']} successful"
+    )
+    return cos_results, r2_results, cos_stats, r2_stats
+
+
 __all__ = [
     'upload_to_r2_async',
     'upload_to_cos_sync',
     'batch_upload_r2',
     'batch_upload_cos',
     'upload_audio_files',
+    'upload_audio_stream',
     'StorageUploadError'
 ]
@@ -18,6 +18,8 @@ from typing import Dict, List, Optional, Any, Tuple
 import boto3
 from botocore.exceptions import ClientError, BotoCoreError
 
+from utils.cache import LRUCache
+
 try:
     from youtube_transcript_api import YouTubeTranscriptApi
     from youtube_transcript_api._errors import (
@@ -48,9 +50,16 @@ class InvalidVideoIdError(TranscriptServiceError):
 class TranscriptService:
     """YouTube transcript fetching service with R2 storage integration."""
 
-    def __init__(self) -> None:
-        """Initialize the transcript service."""
+    def __init__(self, cache: Optional[LRUCache] = None) -> None:
+        """
+        Initialize the transcript service.
+
+        Args:
+            cache: Optional cache for fetched transcripts keyed by video ID
+                (default: 2048 entries, expiring after 24 hours)
+        """
         self.logger = logging.getLogger(__name__)
+        self.cache = cache if cache is not None else LRUCache(maxsize=2048, ttl=86400)
 
         if not TRANSCRIPT_API_AVAILABLE:
             raise RuntimeError("youtube_transcript_api not available. Install with: pip install youtube-transcript-api==1.2.2")
@@ -225,6 +234,10 @@ class TranscriptService:
         """
         Fetch transcript for a YouTube video.
 
+        Transcripts don't change once published, so successful results are
+        cached per video ID and title; cache hits skip both the YouTube fetch
+        and the R2 upload.
+
         Args:
             video_id: YouTube video ID
             title: Optional video title
@@ -239,6 +252,12 @@ class TranscriptService:
         if not video_id or not isinstance(video_id, str):
             raise InvalidVideoIdError("video_id must be a non-empty string")
 
+        cache_key = (video_id, title)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            self.logger.info(f"Transcript cache hit for video ID: {video_id}")
+            return cached
+
         self.logger.info(f"Fetching transcript for video ID: {video_id}")
 
         try:
@@ -281,6 +300,7 @@ class TranscriptService:
                     if account_id:
                         transcript_data['r2_url'] = f"https://{bucket_name}.{account_id}.r2.cloudflarestorage.com/{r2_object_key}"
 
+            self.cache.set(cache_key, transcript_data)
             return transcript_data
 
         except TranscriptsDisabled:
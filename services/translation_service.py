@@ -4,10 +4,13 @@ Translation Service - Handles Chinese translation logic.
 Business logic layer for translation operations.
 """
 
+import asyncio
 import logging
-from typing import Optional
-from .deepseek_client import DeepseekClient, DeepseekAPIError
+from typing import Any, Dict, Optional, Tuple
+from .deepseek_client import DeepseekClient, AsyncDeepseekClient, DeepseekAPIError
 from .prompts import TRANSLATION_SYSTEM_PROMPT, get_translation_user_prompt
+from utils.cache import LRUCache
+from utils.text_helpers import hash_text
 
 
 logger = logging.getLogger(__name__)
@@ -24,14 +27,23 @@ class TranslationService:
     - Handle errors gracefully
     """
 
-    def __init__(self, client: DeepseekClient):
+    def __init__(
+        self,
+        client: DeepseekClient,
+        async_client: Optional[AsyncDeepseekClient] = None,
+        cache: Optional[LRUCache] = None
+    ):
         """
         Initialize translation service.
 
         Args:
             client: DeepseekClient instance for API calls
+            async_client: Optional AsyncDeepseekClient used by translate_async
+            cache: Optional translation cache keyed by sentence hash (default: in-process LRU)
         """
         self.client = client
+        self.async_client = async_client
+        self.cache = cache if cache is not None else LRUCache()
         self.logger = logger
 
     def translate(self, text: str) -> str:
@@ -47,40 +59,113 @@ class TranslationService:
         Raises:
             DeepseekAPIError: If translation fails
         """
-        # Input validation
-        if not text or not text.strip():
-            self.logger.warning("Empty text provided for translation")
+        text, cache_key, cached = self._prepare(text)
+        if not text:
             return ""
-
-        text = text.strip()
+        if cached is not None:
+            return cached
 
         try:
             self.logger.debug(f"Translating text: {text[:50]}...")
+            translation = self.client.simple_completion(**self._request(text))
+            return self._finish(text, translation, cache_key)
+        except Exception as e:
+            raise self._api_error(text, e)
+
+    async def translate_async(self, text: str) -> str:
+        """
+        Translate English text to Chinese without blocking the event loop.
+
+        Uses the async client when available, otherwise runs translate()
+        in a worker thread.
+
+        Args:
+            text: English text to translate
 
-            # Call API
-            translation = self.client.simple_completion(
-                system_prompt=TRANSLATION_SYSTEM_PROMPT,
-                user_prompt=get_translation_user_prompt(text),
-                temperature=0.1,
-                max_tokens=2000
-            )
-
-            # Validate output - ensure we got Chinese characters
-            if not translation or not self._contains_chinese(translation):
-                self.logger.warning(f"Translation may be invalid for text: {text[:30]}...")
-                return ""
-
-            self.logger.info(f"✅ Translation successful: '{text[:30]}...' -> '{translation[:30]}...'")
-            return translation
-
-        except DeepseekAPIError as e:
-            self.logger.error(f"Translation failed for text '{text[:30]}...': {e}")
-            raise
+        Returns:
+            Chinese translation string
+
+        Raises:
+            DeepseekAPIError: If translation fails
+        """
+        if self.async_client is None:
+            return await asyncio.to_thread(self.translate, text)
+
+        text, cache_key, cached = self._prepare(text)
+        if not text:
+            return ""
+        if cached is not None:
+            return cached
+
+        try:
+            self.logger.debug(f"Translating text: {text[:50]}...")
+            translation = await self.async_client.simple_completion(**self._request(text))
+            return self._finish(text, translation, cache_key)
         except Exception as e:
-            self.logger.error(f"Unexpected error during translation: {e}")
-            raise DeepseekAPIError(f"Translation failed: {e}")
+            raise self._api_error(text, e)
+
+    def _prepare(self, text: str) -> Tuple[str, str, Optional[str]]:
+        """
+        Validate input text and look it up in the cache.
+
+        Args:
+            text: English text to translate
+
+        Returns:
+            Tuple of (stripped text, cache key, cached translation or None);
+            the text is empty if the input was empty
+        """
+        if not text or not text.strip():
+            self.logger.warning("Empty text provided for translation")
+            return "", "", None
+
+        text = text.strip()
+        cache_key = hash_text(text, length=32)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            self.logger.debug(f"Translation cache hit: {text[:50]}...")
+        return text, cache_key, cached
+
+    def _request(self, text: str) -> Dict[str, Any]:
+        """Completion arguments for a translation request (same for both clients)."""
+        return {
+            "system_prompt": TRANSLATION_SYSTEM_PROMPT,
+            "user_prompt": get_translation_user_prompt(text),
+            "temperature": 0.1,
+            "max_tokens": 2000
+        }
+
+    def _finish(self, text: str, translation: str, cache_key: str) -> str:
+        """
+        Validate API output - ensure we got Chinese characters.
+
+        Valid translations are cached; invalid ones are not, so they are retried.
+
+        Args:
+            text: Source English text (for logging)
+            translation: Raw translation from API
+            cache_key: Cache key of the source text
+
+        Returns:
+            The translation, or an empty string if it is invalid
+        """
+        if not translation or not self.contains_chinese(translation):
+            self.logger.warning(f"Translation may be invalid for text: {text[:30]}...")
+            return ""
+
+        self.cache.set(cache_key, translation)
+        self.logger.info(f"✅ Translation successful: '{text[:30]}...' -> '{translation[:30]}...'")
+        return translation
+
+    def _api_error(self, text: str, error: Exception) -> DeepseekAPIError:
+        """Log a failed translation request and return the DeepseekAPIError to raise."""
+        if isinstance(error, DeepseekAPIError):
+            self.logger.error(f"Translation failed for text '{text[:30]}...': {error}")
+            return error
+        self.logger.error(f"Unexpected error during translation: {error}")
+        return DeepseekAPIError(f"Translation failed: {error}")
 
-    def _contains_chinese(self, text: str) -> bool:
+    def contains_chinese(self, text: str) -> bool:
         """
         Check if text contains Chinese characters.
 
@@ -9,7 +9,7 @@ async/await, timeout handling, retry logic, and concurrency control.
 import asyncio
 import logging
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Awaitable
 import time
 
 try:
@@ -26,12 +26,118 @@ class AudioGenerationError(Exception):
     pass
 
 
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency limiter for Edge TTS requests.
+
+    Edge TTS throttles clients nondeterministically, so a fixed concurrency is
+    either too low (wasted parallelism) or too high (throttling and retries).
+    The limit starts at ``initial``, is halved when a throttling error is
+    reported (at most once per ``decrease_cooldown`` seconds, so one burst of
+    failures counts as one signal), and grows by one after every
+    ``recovery_interval`` seconds or ``increase_after`` successful TTS calls
+    without throttling, whichever comes first, up to ``max_limit``. Only
+    ``record_success()`` counts towards growth, so skipped sentences and
+    non-throttle failures never raise the limit.
+
+    Use as an async context manager in place of ``asyncio.Semaphore``. One
+    instance can be shared across requests so the learned limit persists.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        max_limit: Optional[int] = None,
+        min_limit: int = 1,
+        recovery_interval: float = 60.0,
+        decrease_cooldown: float = 5.0,
+        increase_after: int = 20
+    ):
+        self.max_limit = max(max_limit or initial, min_limit)
+        self.min_limit = min_limit
+        self.limit = min(max(initial, min_limit), self.max_limit)
+        self.recovery_interval = recovery_interval
+        self.decrease_cooldown = decrease_cooldown
+        self.increase_after = increase_after
+        self._in_flight = 0
+        self._successes = 0
+        self._condition = asyncio.Condition()
+        self._last_change = time.monotonic()
+        self._last_decrease = float('-inf')
+
+    @property
+    def in_flight(self) -> int:
+        """Number of operations currently holding a slot."""
+        return self._in_flight
+
+    async def __aenter__(self) -> 'AdaptiveConcurrencyLimiter':
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def record_success(self) -> None:
+        """
+        Report a successful TTS call (additive increase).
+
+        Call it while holding a slot: waiters see a raised limit when that
+        slot is released.
+        """
+        self._successes += 1
+        now = time.monotonic()
+        if self.limit < self.max_limit and (
+            now - self._last_change >= self.recovery_interval
+            or self._successes >= self.increase_after
+        ):
+            self.limit += 1
+            self._last_change = now
+            self._successes = 0
+            logger.info(f"Edge TTS concurrency increased to {self.limit}")
+
+    def record_throttle(self) -> None:
+        """Report a throttling error; halves the limit (multiplicative decrease)."""
+        now = time.monotonic()
+        if now - self._last_decrease < self.decrease_cooldown:
+            return
+
+        self._last_decrease = now
+        self._last_change = now
+        self._successes = 0
+        new_limit = max(self.min_limit, self.limit // 2)
+        if new_limit != self.limit:
+            self.limit = new_limit
+            logger.warning(f"Edge TTS throttling detected, concurrency reduced to {self.limit}")
+
+
+def is_throttling_error(exc: BaseException) -> bool:
+    """
+    Check whether an Edge TTS exception indicates server-side throttling.
+
+    Args:
+        exc: Exception raised while generating audio
+
+    Returns:
+        True for HTTP 429 responses and dropped connections
+    """
+    if getattr(exc, 'status', None) == 429:
+        return True
+    if isinstance(exc, (ConnectionResetError, ConnectionAbortedError)):
+        return True
+    return type(exc).__name__ == 'ServerDisconnectedError'
+
+
 async def generate_audio_async(
     text: str,
     output_path: Path,
     voice: str = "en-US-AvaMultilingualNeural",
     timeout: int = 30,
-    max_retries: int = 2
+    max_retries: int = 2,
+    limiter: Optional[AdaptiveConcurrencyLimiter] = None
 ) -> bool:
     """
     Generate audio file asynchronously using edge-tts Python API.
@@ -45,6 +151,7 @@ async def generate_audio_async(
         voice: Edge TTS voice model (default: en-US-AvaMultilingualNeural)
         timeout: Timeout in seconds (default: 30)
         max_retries: Maximum number of retry attempts (default: 2)
+        limiter: Optional concurrency limiter notified of successes, throttling errors and timeouts
 
     Returns:
         True if successful, False otherwise
@@ -86,6 +193,8 @@ async def generate_audio_async(
             # Verify file was created and has content
             if output_path.exists() and output_path.stat().st_size > 0:
                 logger.debug(f"Audio generated successfully: {output_path.name}")
+                if limiter is not None:
+                    limiter.record_success()
                 return True
             else:
                 logger.warning(f"Audio file created but empty: {output_path}")
@@ -96,6 +205,9 @@ async def generate_audio_async(
                 f"Audio generation timeout (attempt {attempt + 1}/{max_retries + 1}): "
                 f"{text[:50]}..."
             )
+            # Edge TTS slows down before it starts rejecting: treat as throttling
+            if limiter is not None:
+                limiter.record_throttle()
             if attempt < max_retries:
                 await asyncio.sleep(1)  # Brief delay before retry
                 continue
@@ -108,6 +220,8 @@ async def generate_audio_async(
                 f"Audio generation error (attempt {attempt + 1}/{max_retries + 1}): "
                 f"{type(e).__name__}: {str(e)} - Text: {text[:50]}..."
             )
+            if limiter is not None and is_throttling_error(e):
+                limiter.record_throttle()
             if attempt < max_retries:
                 await asyncio.sleep(1)
                 continue
@@ -123,20 +237,28 @@ async def generate_batch_audio(
     audio_dir: Path,
     voice: str = "en-US-AvaMultilingualNeural",
     max_concurrent: int = 5,
-    timeout_per_sentence: int = 30
+    timeout_per_sentence: int = 30,
+    limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    on_result: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None
 ) -> List[Dict[str, Any]]:
     """
     Generate audio files for multiple sentences concurrently with rate limiting.
 
-    Uses asyncio.Semaphore to limit concurrent operations and prevent
-    overwhelming the TTS service or system resources.
+    Uses an AdaptiveConcurrencyLimiter to bound concurrent operations: it
+    starts at max_concurrent, backs off when Edge TTS throttles and recovers
+    gradually afterwards.
 
     Args:
         sentences: List of sentence texts
         audio_dir: Directory to save audio files
         voice: Edge TTS voice model
-        max_concurrent: Maximum concurrent audio generations (default: 5)
+        max_concurrent: Maximum concurrent audio generations for this call (default: 5);
+            applies on top of a shared limiter, which may allow more
         timeout_per_sentence: Timeout per sentence in seconds (default: 30)
+        limiter: Optional shared limiter (default: a new one starting at max_concurrent)
+        on_result: Optional coroutine called with each result as soon as it is
+            ready (after the concurrency slot is released), e.g. to start uploads
+            while the rest of the batch is still generating
 
     Returns:
         List of result dictionaries with generation status
@@ -155,44 +277,49 @@ async def generate_batch_audio(
 
     from utils.text_helpers import hash_text
 
-    # Create semaphore for concurrency control
-    semaphore = asyncio.Semaphore(max_concurrent)
+    # Adaptive concurrency control
+    if limiter is None:
+        limiter = AdaptiveConcurrencyLimiter(max_concurrent)
 
-    async def process_single_sentence(idx: int, sentence_text: str) -> Dict[str, Any]:
-        """Process a single sentence with semaphore control."""
-        async with semaphore:
-            sentence_text = sentence_text.strip()
+    # Per-call cap, taken before a shared limiter slot so waiting here holds no shared slot
+    call_slots = asyncio.Semaphore(max(1, max_concurrent))
 
-            if not sentence_text:
-                logger.warning(f"Sentence {idx}: Empty text, skipping")
-                return {
-                    'index': idx,
-                    'en': '',
-                    'sentence_hash': '',
-                    'audio_path': None,
-                    'audio_generated': False,
-                    'error': 'Empty sentence text'
-                }
+    async def process_single_sentence(idx: int, sentence_text: str) -> Dict[str, Any]:
+        """Process a single sentence with concurrency control."""
+        sentence_text = sentence_text.strip()
 
-            # Generate hash
-            sentence_hash = hash_text(sentence_text, length=8)
+        if not sentence_text:
+            logger.warning(f"Sentence {idx}: Empty text, skipping")
+            return {
+                'index': idx,
+                'en': '',
+                'sentence_hash': '',
+                'audio_path': None,
+                'audio_generated': False,
+                'error': 'Empty sentence text'
+            }
 
-            # Create audio file path
-            audio_filename = f"{sentence_hash}.mp3"
-            audio_path = audio_dir / audio_filename
+        # Generate hash
+        sentence_hash = hash_text(sentence_text, length=8)
 
-            # Check if audio file already exists
-            if audio_path.exists() and audio_path.stat().st_size > 0:
-                logger.info(f"Sentence {idx}: Audio already exists - {audio_filename}")
-                return {
-                    'index': idx,
-                    'en': sentence_text,
-                    'sentence_hash': sentence_hash,
-                    'audio_path': str(audio_path),
-                    'audio_generated': True,
-                    'existed': True
-                }
+        # Create audio file path
+        audio_filename = f"{sentence_hash}.mp3"
+        audio_path = audio_dir / audio_filename
 
+        # Check if audio file already exists
+        if audio_path.exists() and audio_path.stat().st_size > 0:
+            logger.info(f"Sentence {idx}: Audio already exists - {audio_filename}")
+            return {
+                'index': idx,
+                'en': sentence_text,
+                'sentence_hash': sentence_hash,
+                'audio_path': str(audio_path),
+                'audio_generated': True,
+                'existed': True
+            }
+
+        # Only actual Edge TTS calls take a limiter slot
+        async with call_slots, limiter:
             # Generate new audio file
             logger.info(f"Sentence {idx}: Generating audio for: {sentence_text[:50]}...")
             start_time = time.time()
@@ -201,7 +328,8 @@ async def generate_batch_audio(
                 sentence_text,
                 audio_path,
                 voice,
-                timeout=timeout_per_sentence
+                timeout=timeout_per_sentence,
+                limiter=limiter
             )
 
             elapsed = time.time() - start_time
@@ -235,36 +363,50 @@ async def generate_batch_audio(
                     'generation_time': elapsed
                 }
 
-    # Create tasks for all sentences
+    async def process_and_report(idx: int, sentence_text: str) -> Dict[str, Any]:
+        """Process a sentence, then hand the result to on_result."""
+        result = await process_single_sentence(idx, sentence_text)
+        if on_result is not None:
+            await on_result(result)
+        return result
+
+    # Identical sentences share one generation (same hash, same file), so
+    # each unique text is generated and reported once
+    unique_indices: Dict[str, int] = {}
+    for idx, sentence in enumerate(sentences):
+        unique_indices.setdefault(sentence.strip(), idx)
+
     tasks = [
-        process_single_sentence(idx, sentence)
-        for idx, sentence in enumerate(sentences)
+        process_and_report(idx, sentences[idx])
+        for idx in unique_indices.values()
     ]
 
     # Execute all tasks concurrently
     logger.info(
-        f"Starting batch audio generation: {len(sentences)} sentences, "
-        f"max {max_concurrent} concurrent"
+        f"Starting batch audio generation: {len(sentences)} sentences "
+        f"({len(tasks)} unique), max {min(limiter.limit, max_concurrent)} concurrent"
     )
     results = await asyncio.gather(*tasks, return_exceptions=True)
 
     # Handle any exceptions from gather
-    processed_results = []
-    for idx, result in enumerate(results):
+    results_by_text: Dict[str, Dict[str, Any]] = {}
+    for (sentence_text, idx), result in zip(unique_indices.items(), results):
         if isinstance(result, Exception):
             logger.error(f"Sentence {idx}: Exception during processing: {result}")
-            processed_results.append({
+            result = {
                 'index': idx,
-                'en': sentences[idx] if idx < len(sentences) else '',
+                'en': sentences[idx],
                 'sentence_hash': '',
                 'audio_generated': False,
                 'error': str(result)
-            })
-        else:
-            processed_results.append(result)
+            }
+        results_by_text[sentence_text] = result
 
-    # Sort by original index
-    processed_results.sort(key=lambda x: x['index'])
+    # One result per input sentence, in original order
+    processed_results = []
+    for idx, sentence in enumerate(sentences):
+        result = results_by_text[sentence.strip()]
+        processed_results.append(result if result['index'] == idx else {**result, 'index': idx})
 
     # Calculate statistics
     total = len(processed_results)
@@ -295,6 +437,8 @@ def check_edge_tts_available() -> bool:
 
 
 __all__ = [
+    'AdaptiveConcurrencyLimiter',
+    'is_throttling_error',
     'generate_audio_async',
     'generate_batch_audio',
     'check_edge_tts_available',
@@ -0,0 +1,172 @@
+"""
+In-process caching utilities.
+
+Provides a small thread-safe LRU cache with optional TTL, used to skip
+repeated upstream calls (e.g. DeepSeek requests for sentences that were
+already processed), and a single-flight helper that collapses concurrent
+identical async calls into one.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Thread-safe least-recently-used cache with optional expiry.
+
+    Safe to share between the event loop and threadpool workers. A maxsize
+    of 0 disables the cache (every lookup misses, nothing is stored).
+
+    Examples:
+        >>> cache = LRUCache(maxsize=2)
+        >>> cache.set("a", 1)
+        >>> cache.get("a")
+        1
+        >>> cache.get("missing") is None
+        True
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries (default: 10000, 0 disables caching)
+            ttl: Seconds before an entry expires (default: None, never expires)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Look up a key and mark it as most recently used.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss (default: None)
+
+        Returns:
+            Cached value, or default if missing or expired
+        """
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry when full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        if self.maxsize <= 0:
+            return
+
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Remove a key from the cache.
+
+        Args:
+            key: Cache key
+            default: Value returned if the key is not cached
+
+        Returns:
+            The removed value, or default
+        """
+        with self._lock:
+            entry = self._data.pop(key, _MISSING)
+        return default if entry is _MISSING else entry[0]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent async calls that share a key.
+
+    The first caller for a key starts the work as a task; callers arriving
+    while it is in flight await the same task instead of repeating the work.
+    The key is released as soon as the task finishes, so results are not
+    cached here (pair it with LRUCache for that). A cancelled caller does
+    not cancel the shared task.
+
+    Examples:
+        >>> flight = SingleFlight()
+        >>> await flight.do("episode:238", lambda: fetch_episode(238))
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run func once per key among concurrent callers.
+
+        Args:
+            key: Identifies identical calls
+            func: Zero-argument coroutine function performing the work
+
+        Returns:
+            The shared result of func
+
+        Raises:
+            Whatever func raises, re-raised in every waiting caller
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._release(key, done))
+        return await asyncio.shield(task)
+
+    def _release(self, key: Hashable, task: asyncio.Task) -> None:
+        """Forget a finished task and mark its exception as retrieved."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+
+__all__ = ['LRUCache', 'SingleFlight']
@@ -7,7 +7,7 @@ Provides async functions to check if files exist in R2 and COS storage.
 import asyncio
 import logging
 import os
-from typing import Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -169,9 +169,125 @@ async def check_audio_exists_in_storage(
     return r2_exists, cos_exists
 
 
+async def check_audio_exists_bulk(
+    object_keys: List[str],
+    max_concurrent: int = 10,
+    settings: Optional[Any] = None
+) -> Dict[str, Tuple[bool, bool]]:
+    """
+    Check many object keys in R2 and COS, sharing one client per store.
+
+    Unlike check_audio_exists_in_storage, which builds new clients for every
+    key, this issues all HEAD requests through a single R2 client and a
+    single COS client with bounded concurrency.
+
+    Args:
+        object_keys: Object keys to check (duplicates are checked once)
+        max_concurrent: Maximum concurrent HEAD requests per store (default: 10)
+        settings: Settings instance (optional, will get from get_settings() if not provided)
+
+    Returns:
+        Dict mapping each object key to (r2_exists, cos_exists); a store that
+        is not configured or fails to answer counts as missing
+    """
+    if settings is None:
+        from config import get_settings
+        settings = get_settings()
+
+    keys = list(dict.fromkeys(object_keys))
+    if not keys:
+        return {}
+
+    async def check_r2() -> Dict[str, bool]:
+        if not all([
+            settings.r2_bucket_name,
+            settings.r2_access_key_id,
+            settings.r2_secret_access_key,
+            settings.r2_endpoint_url
+        ]):
+            logger.warning("R2 configuration incomplete, skipping check")
+            return {}
+
+        try:
+            import aioboto3
+        except ImportError:
+            logger.warning("aioboto3 not installed, cannot check R2")
+            return {}
+
+        semaphore = asyncio.Semaphore(max_concurrent)
+        session = aioboto3.Session()
+        async with session.client(
+            service_name='s3',
+            endpoint_url=settings.r2_endpoint_url,
+            aws_access_key_id=settings.r2_access_key_id,
+            aws_secret_access_key=settings.r2_secret_access_key,
+            region_name='auto'
+        ) as s3_client:
+
+            async def head(object_key: str) -> bool:
+                async with semaphore:
+                    try:
+                        await s3_client.head_object(Bucket=settings.r2_bucket_name, Key=object_key)
+                        return True
+                    except Exception as e:
+                        logger.debug(f"R2 file check failed for {object_key}: {e}")
+                        return False
+
+            found = await asyncio.gather(*[head(object_key) for object_key in keys])
+        return dict(zip(keys, found))
+
+    async def check_cos() -> Dict[str, bool]:
+        if not all([
+            settings.cos_secret_id,
+            settings.cos_secret_key,
+            settings.cos_bucket,
+            settings.cos_region
+        ]):
+            logger.warning("COS configuration incomplete, skipping check")
+            return {}
+
+        try:
+            from qcloud_cos import CosConfig, CosS3Client
+        except ImportError:
+            logger.warning("qcloud_cos not installed, cannot check COS")
+            return {}
+
+        client = CosS3Client(CosConfig(
+            Region=settings.cos_region,
+            SecretId=settings.cos_secret_id,
+            SecretKey=settings.cos_secret_key
+        ))
+
+        def head_sync(object_key: str) -> bool:
+            try:
+                client.head_object(Bucket=settings.cos_bucket, Key=object_key)
+                return True
+            except Exception as e:
+                logger.debug(f"COS file does not exist {object_key}: {e}")
+                return False
+
+        # Sync SDK: HEAD requests run on the shared default executor
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def head(object_key: str) -> bool:
+            async with semaphore:
+                return await loop.run_in_executor(None, head_sync, object_key)
+
+        found = await asyncio.gather(*[head(object_key) for object_key in keys])
+        return dict(zip(keys, found))
+
+    r2_found, cos_found = await asyncio.gather(check_r2(), check_cos())
+    return {
+        object_key: (r2_found.get(object_key, False), cos_found.get(object_key, False))
+        for object_key in keys
+    }
+
+
 __all__ = [
     'check_r2_file_exists',
     'check_cos_file_exists',
     'check_cos_file_exists_sync',
-    'check_audio_exists_in_storage'
+    'check_audio_exists_in_storage',
+    'check_audio_exists_bulk'
 ]
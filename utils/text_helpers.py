@@ -51,6 +51,10 @@ def hash_text(text: str, length: int = 8) -> str:
     """
     Generate MD5 hash value for text content.
 
+    Prefixes of this hash are the sentence hashes used in audio object keys
+    (audio/sentences/{sentence_hash}.mp3), so the algorithm must stay MD5
+    for existing R2/COS objects and cache entries to keep matching.
+
     Args:
         text: Text content to hash
         length: Length of hash to retain (default: 8 characters)